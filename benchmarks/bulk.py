@@ -0,0 +1,50 @@
+import sys
+import time
+import numpy as np
+from lib import AdjacencyList, Graph
+
+
+def timed(name: str, f) -> AdjacencyList:
+  start = time.perf_counter()
+  g = f()
+  print(f"{name:28} {time.perf_counter() - start:7.2f} s")
+  return g
+
+
+def one_by_one(n: int, edges: np.ndarray, directed: bool) -> AdjacencyList:
+  g = AdjacencyList(directed=directed)
+  g.add_vertices_bulk(range(n))
+  for x, y in edges.tolist():
+    g.create_edge(x, y)
+  return g
+
+
+def bulk(n: int, edges: np.ndarray, directed: bool) -> AdjacencyList:
+  g = AdjacencyList(directed=directed)
+  g.add_vertices_bulk(range(n))
+  g.add_edges_bulk(edges)
+  return g
+
+
+def main():
+  m = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+  n = m // 5
+  edges = np.random.default_rng(0).integers(0, n, size=(m, 2))
+  print(f"{n} vertices, {m} edges")
+
+  for directed in (False, True):
+    kind = "directed" if directed else "undirected"
+    loop = timed(f"create_edge loop, {kind}", lambda: one_by_one(n, edges, directed))
+    added = timed(f"add_edges_bulk, {kind}", lambda: bulk(n, edges, directed))
+    # Labels are the indices, so first appearance may number vertices differently
+    timed(f"from_edges array, {kind}", lambda: Graph.from_edges(edges, graph_type=AdjacencyList, directed=directed))
+    timed(
+      f"from_edges tuples, {kind}",
+      lambda: Graph.from_edges(map(tuple, edges.tolist()), graph_type=AdjacencyList, directed=directed))
+
+    assert [[v.index for v in row] for row in loop.content] == [[v.index for v in row] for row in added.content]
+    assert loop.get_components() == added.get_components()
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,30 @@
+import sys
+import time
+from lib import AdjacencyList, CSRGraph
+
+
+def timed(name: str, f):
+  start = time.perf_counter()
+  g = f()
+  print(f"{name:26} {time.perf_counter() - start:7.2f} s  {len(g.indices) if isinstance(g, CSRGraph) else g.edge_count()} arcs")
+  return g
+
+
+def main():
+  m = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+  n = m // 10
+  scale = max(n.bit_length() - 1, 1)
+
+  timed("G(n, p) CSR", lambda: CSRGraph.create_gnp_graph(n, 2 * m / (n * (n - 1)), seed=0))
+  timed("G(n, m) CSR", lambda: CSRGraph.create_gnm_graph(n, m, seed=0))
+  timed("Barabasi-Albert CSR", lambda: CSRGraph.create_barabasi_albert_graph(n, m // n, seed=0))
+  timed("R-MAT CSR", lambda: CSRGraph.create_rmat_graph(scale, m, directed=True, seed=0))
+
+  # Python objects per edge bound the mutable graphs, so these get 1 / 20th
+  small = m // 20
+  timed("G(n, m) AdjacencyList", lambda: AdjacencyList.create_gnm_graph(small // 10, small, seed=0))
+  timed("R-MAT AdjacencyList", lambda: AdjacencyList.create_rmat_graph(scale - 4, small, directed=True, seed=0))
+
+
+if __name__ == "__main__":
+  main()
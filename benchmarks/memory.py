@@ -0,0 +1,76 @@
+import random
+import sys
+import tracemalloc
+from lib import AdjacencyList, Edge, Vertex
+
+
+class DictVertex:
+  """Vertex layout before __slots__"""
+
+  def __init__(self, index: int, label: str | int):
+    self.index = index
+    self.label = label
+    self.color = None
+    self.degree = 0
+    self.component = 0
+    self.entry_depth = 0
+    self.exit_depth = 0
+
+
+class DictEdge:
+  """Edge layout before __slots__"""
+
+  def __init__(self, u: DictVertex, v: DictVertex, label=None, *, directed: bool = False):
+    self.directed = directed
+    self.type = None
+    self.ends = (u, v)
+    self.label = label
+
+
+def measure(build) -> int:
+  tracemalloc.start()
+  kept = build()
+  size, _ = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  del kept
+  return size
+
+
+def main():
+  n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+  m = int(sys.argv[2]) if len(sys.argv) > 2 else 500_000
+  random.seed(0)
+  labels = [f"v{i}" for i in range(n)]
+  pairs = [(random.randrange(n), random.randrange(n)) for _ in range(m)]
+
+  def dict_objects():
+    vertices = [DictVertex(i, labels[i]) for i in range(n)]
+    return vertices, [DictEdge(vertices[x], vertices[y], directed=True) for x, y in pairs]
+
+  def slotted_objects():
+    vertices = [Vertex(i, labels[i]) for i in range(n)]
+    return vertices, [Edge(vertices[x], vertices[y], directed=True) for x, y in pairs]
+
+  def adjacency_list():
+    g = AdjacencyList(directed=True)
+    for label in labels:
+      g.create_vertex(label)
+    for x, y in pairs:
+      g.create_edge(x, y)
+    return g
+
+  g = adjacency_list()
+
+  results = {
+    "dict Vertex/Edge": measure(dict_objects),
+    "__slots__ Vertex/Edge": measure(slotted_objects),
+    "AdjacencyList": measure(adjacency_list),
+    "CSRGraph indptr/indices": measure(lambda: (lambda c: (c.indptr, c.indices))(g.freeze())),
+  }
+
+  for name, size in results.items():
+    print(f"{name:<26} {size / 2**20:9.1f} MiB {size / m:9.1f} B/edge")
+
+
+if __name__ == "__main__":
+  main()
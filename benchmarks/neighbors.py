@@ -0,0 +1,52 @@
+import sys
+import time
+import numpy as np
+from lib import AdjacencyList
+
+
+def power_law_edges(n: int, m: int, rng: np.random.Generator, exponent: float = 2.5) -> np.ndarray:
+  """Chung-Lu style endpoints, vertex i weighted (i + 1) ** (-1 / (exponent - 1))"""
+  weights = np.arange(1, n + 1, dtype=np.float64) ** (-1 / (exponent - 1))
+  weights /= weights.sum()
+  return rng.choice(n, size=(m, 2), p=weights)
+
+
+def run(hashed: bool, n: int, edges: np.ndarray, queries: np.ndarray, removals: np.ndarray):
+  g = AdjacencyList(hashed=hashed)
+  g.add_vertices_bulk(range(n))
+  start = time.perf_counter()
+  g.add_edges_bulk(edges)
+  built = time.perf_counter() - start
+
+  start = time.perf_counter()
+  found = [g.is_neighbor(x, y) for x, y in queries.tolist()]
+  queried = time.perf_counter() - start
+
+  start = time.perf_counter()
+  for x, y in removals.tolist():
+    g.remove_edge(x, y)
+  removed = time.perf_counter() - start
+
+  name = "hashed rows" if hashed else "plain rows"
+  print(f"{name:12} build {built:6.2f} s  is_neighbor {queried:6.2f} s  remove_edge {removed:6.2f} s")
+  return found, sorted(map(len, g.content))
+
+
+def main():
+  n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+  rng = np.random.default_rng(0)
+  edges = power_law_edges(n, 5 * n, rng)
+  degrees = np.bincount(edges.ravel(), minlength=n)
+  print(f"{n} vertices, {len(edges)} edges, largest degree {degrees.max()}")
+
+  # Queries and removals concentrate on hubs, like the updates they model
+  queries = np.stack((edges[:, 1], rng.integers(0, n, size=len(edges))), axis=1)[:50_000]
+  removals = edges[rng.choice(len(edges), size=20_000, replace=False)]
+
+  plain = run(False, n, edges, queries, removals)
+  hashed = run(True, n, edges, queries, removals)
+  assert plain == hashed
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,43 @@
+import sys
+import time
+import numpy as np
+from lib import WHITE, AdjacencyList, DepthFirstTraversal, Graph
+
+
+def per_source(g: AdjacencyList, sources: list[int], targets: list[int]) -> np.ndarray:
+  """One traversal per source, as callers had to do before"""
+  result = np.zeros((len(sources), len(targets)), dtype=bool)
+  for i, s in enumerate(sources):
+    traversal = DepthFirstTraversal(g)
+    traversal.run([g.vertices[s]])
+    result[i] = [traversal.color[t] != WHITE for t in targets]
+  return result
+
+
+def main():
+  n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+  rng = np.random.default_rng(0)
+  g = Graph.from_edges(rng.integers(0, n, size=(3 * n, 2)), graph_type=AdjacencyList, directed=True)
+  n = len(g.vertices)
+  sources = rng.choice(n, size=min(1000, n), replace=False).tolist()
+  targets = rng.choice(n, size=min(10_000, n), replace=False).tolist()
+
+  start = time.perf_counter()
+  csr = g.freeze()
+  print(f"freeze                {time.perf_counter() - start:7.2f} s")
+
+  start = time.perf_counter()
+  batched = csr.reachability(sources, targets)
+  print(f"bitset reachability   {time.perf_counter() - start:7.2f} s")
+
+  sample = 50
+  start = time.perf_counter()
+  slow = per_source(g, sources[:sample], targets)
+  elapsed = (time.perf_counter() - start) * len(sources) / sample
+  print(f"per-source traversals {elapsed:7.2f} s (extrapolated from {sample})")
+
+  assert (batched[:sample] == slow).all()
+
+
+if __name__ == "__main__":
+  main()
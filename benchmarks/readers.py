@@ -0,0 +1,52 @@
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+from lib import AdjacencyList, iter_dimacs_cnf, iter_edge_list, read_edge_list
+
+
+def write_edge_list(path: str, n: int, m: int, rng: np.random.Generator):
+  edges = rng.integers(0, n, size=(m, 2))
+  with open(path, "w") as f:
+    f.write("# FromNodeId\tToNodeId\n")
+    np.savetxt(f, edges, fmt="%d", delimiter="\t")
+
+
+def write_cnf(path: str, variables: int, clauses: int, rng: np.random.Generator):
+  literals = rng.integers(1, variables + 1, size=(clauses, 2)) * rng.choice([-1, 1], size=(clauses, 2))
+  with open(path, "w") as f:
+    f.write(f"p cnf {variables} {clauses}\n")
+    np.savetxt(f, np.hstack((literals, np.zeros((clauses, 1), dtype=np.int64))), fmt="%d")
+
+
+def report(name: str, path: str, seconds: float, rows: int):
+  size = os.path.getsize(path) / 2**20
+  print(f"{name:<28} {seconds:7.2f} s {size / seconds:8.1f} MiB/s {rows / seconds / 1e6:7.2f} M rows/s")
+
+
+def main():
+  m = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+  rng = np.random.default_rng(0)
+
+  with tempfile.TemporaryDirectory() as directory:
+    edges = os.path.join(directory, "edges.txt")
+    cnf = os.path.join(directory, "formula.cnf")
+    write_edge_list(edges, m // 5, m, rng)
+    write_cnf(cnf, m // 5, m, rng)
+
+    start = time.perf_counter()
+    rows = sum(len(chunk) for chunk in iter_edge_list(edges))
+    report("edge list parse", edges, time.perf_counter() - start, rows)
+
+    start = time.perf_counter()
+    g = read_edge_list(edges, graph_type=AdjacencyList, directed=True)
+    report("edge list -> AdjacencyList", edges, time.perf_counter() - start, len(g.edges))
+
+    start = time.perf_counter()
+    rows = sum(len(chunk) for chunk in iter_dimacs_cnf(cnf))
+    report("DIMACS CNF parse", cnf, time.perf_counter() - start, rows)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,28 @@
+import os
+import sys
+import time
+import numpy as np
+from lib import CSRGraph
+
+
+def main():
+  m = int(sys.argv[1]) if len(sys.argv) > 1 else 4_000_000
+  n = m // 2
+  rng = np.random.default_rng(0)
+  g = CSRGraph.from_arrays(n, rng.integers(0, n, size=m), rng.integers(0, n, size=m), directed=True)
+
+  start = time.perf_counter()
+  expected = g.component_labels(workers=1)
+  print(f"sequential Tarjan  {time.perf_counter() - start:7.2f} s  {int(expected.max()) + 1} components")
+
+  counts = sorted({2, 4, 8, 16, 32, os.cpu_count() or 1} - {1})
+  for workers in counts:
+    start = time.perf_counter()
+    labels = g.component_labels(workers=workers)
+    print(f"{workers:2d} workers         {time.perf_counter() - start:7.2f} s")
+    pairs = np.unique(np.stack((expected, labels), axis=1), axis=0)
+    assert len(pairs) == int(expected.max()) + 1 == int(labels.max()) + 1
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,76 @@
+import sys
+import time
+import numpy as np
+from lib import AdjacencyList, TwoSatSolver, solve_2sat
+
+
+def object_graph_2sat(elements: list[tuple[int, int]]):
+  """The former AdjacencyList.is_2satisfiable, kept as a baseline"""
+  g = AdjacencyList(directed=True)
+
+  for u, v in elements:
+    for e in [abs(u), -abs(u), abs(v), -abs(v)]:
+      g.create_vertex(e)
+
+    for x, y in [(-u, v), (-v, u)]:
+      g.create_edge(g.create_vertex(x), g.create_vertex(y))
+
+  comp_order = [-1] * len(g.vertices)
+  for i, comp in enumerate(g.strongly_connected_components()[::-1]):
+    for v in comp:
+      comp_order[v.index] = i
+
+  assignment = {}
+  for i in range(0, len(comp_order), 2):
+    if comp_order[i] == comp_order[i + 1]:
+      return None
+    assignment[g.vertices[i].label] = comp_order[i] > comp_order[i + 1]
+
+  return assignment
+
+
+def satisfiable_instance(variables: int, clauses: int, rng: np.random.Generator) -> np.ndarray:
+  """Random clauses that all agree with a hidden assignment"""
+  hidden = rng.choice([-1, 1], size=variables + 1)
+  literals = rng.integers(1, variables + 1, size=(clauses, 2)) * rng.choice([-1, 1], size=(clauses, 2))
+  satisfied = (np.sign(literals) == hidden[np.abs(literals)]).any(axis=1)
+  literals[~satisfied, 0] *= -1
+  return literals
+
+
+def main():
+  clauses = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+  rng = np.random.default_rng(0)
+  literals = satisfiable_instance(clauses // 2, clauses, rng)
+
+  start = time.perf_counter()
+  fast = solve_2sat(literals)
+  print(f"solve_2sat         {time.perf_counter() - start:7.2f} s")
+
+  start = time.perf_counter()
+  slow = object_graph_2sat(literals.tolist())
+  print(f"object graph 2-SAT {time.perf_counter() - start:7.2f} s")
+
+  assert (fast is None) == (slow is None)
+
+  deltas = 20
+  solver = TwoSatSolver(literals)
+  solver.live_assignment()
+  extra = satisfiable_instance(clauses // 2, deltas, rng)
+
+  start = time.perf_counter()
+  for a, b in extra.tolist():
+    clause = solver.add_clause(a, b)
+    solver.live_assignment()
+    solver.retract_clause(clause)
+    solver.live_assignment()
+  print(f"incremental delta  {(time.perf_counter() - start) / (2 * deltas):7.4f} s")
+
+  start = time.perf_counter()
+  for i in range(deltas):
+    solve_2sat(np.concatenate((literals, extra[i:i + 1])))
+  print(f"re-solve per delta {(time.perf_counter() - start) / deltas:7.4f} s")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,33 @@
+import sys
+import time
+import numpy as np
+from lib import AdjacencyList, Graph, Walk
+
+
+def timed(name: str, f):
+  start = time.perf_counter()
+  result = f()
+  print(f"{name:24} {time.perf_counter() - start:7.3f} s")
+  return result
+
+
+def main():
+  n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+  chain = np.stack((np.arange(n), np.arange(1, n + 1)), axis=1)
+  g = Graph.from_edges(chain, graph_type=AdjacencyList, directed=True)
+  vertices = list(range(n + 1))
+  edges = list(range(n))
+
+  timed("walk from vertices", lambda: Walk(g, vertices))
+  walk = timed("walk from edge ids", lambda: Walk(g, vertices, edges))
+  timed("render content", lambda: walk.content)
+  timed("get_path", walk.get_path)
+  timed("section", lambda: walk.section(n // 4, 3 * n // 4))
+
+  paths = g.shortest_paths()
+  found = timed("bfs 0 to end", lambda: paths.bfs(0, n))
+  assert found.length == n
+
+
+if __name__ == "__main__":
+  main()
@@ -1,7 +1,17 @@
 from .adjacency_list import *
 from .adjacency_matrix import *
+from .subgraph_view import *
+from .csr_graph import *
+from .graph_file import *
+from .readers import *
+from .two_sat import *
+from .shortest_paths import *
 from .graph import *
+from .generators import *
+from .disjoint_set import *
+from .result_cache import *
 from .constants import *
 from .vertex import *
 from .edge import *
 from .walk import *
+from .traversal import *
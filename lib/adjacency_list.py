@@ -1,387 +1,439 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional
-from lib.constants import Color, EdgeType
+from array import array
+import time
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Sequence
+import numpy as np
+from lib.constants import EdgeType, TraversalAction
+from lib.traversal import WHITE, DepthFirstTraversal
 from lib.walk import Walk
-from lib.graph import Graph
+from lib.graph import Graph, extend_rows, sorted_arcs
+from lib.result_cache import cached
+from lib.csr_graph import CSRGraph
+from lib.parallel_scc import PARALLEL_THRESHOLD
+from lib.two_sat import solve_2sat
+from lib.shortest_paths import ShortestPaths
 
 
 if TYPE_CHECKING:
   from lib.vertex import Vertex
 
 
+def add_slot(slots: dict[int, int | list[int]], key: int, position: int):
+  """Single positions stay plain ints, so rows without parallel arcs hold
+  no lists for the garbage collector to scan"""
+  found = slots.get(key)
+  if found is None:
+    slots[key] = position
+  elif isinstance(found, int):
+    slots[key] = [found, position]
+  else:
+    found.append(position)
+
+
 class AdjacencyList(Graph):
+  """Ordered neighbor rows, one entry per arc
+
+  With hashed=True (or after hash_neighbors()) each row also gets a dict
+  from neighbor index to its position in the row, or a list of positions
+  for parallel arcs. is_neighbor() is then a lookup and removals swap the
+  last entry into the freed slot, both expected O(1) even on hubs, at the
+  cost of rows losing insertion order once something is removed.
+  """
 
-  def __init__(self, *, directed: bool = False):
+  def __init__(self, *, directed: bool = False, hashed: bool = False):
     super().__init__(directed=directed)
     self.content: list[list[Vertex]] = []
+    self.slots: Optional[list[dict[int, int | list[int]]]] = None
+    if hashed:
+      self.hash_neighbors()
+
+  def hash_neighbors(self):
+    """Indexes every row by neighbor, in one pass over the rows"""
+    self.slots = []
+    for row in self.content:
+      slots: dict[int, int | list[int]] = {}
+      for i, v in enumerate(row):
+        add_slot(slots, v.index, i)
+      self.slots.append(slots)
+
+  def multiplicity(self, ix: int, iy: int) -> int:
+    """Arcs from ix to iy, an undirected loop counting twice"""
+    if self.slots is not None:
+      positions = self.slots[ix].get(iy)
+      if positions is None:
+        return 0
+      return 1 if isinstance(positions, int) else len(positions)
+
+    vy = self.vertices[iy]
+    return sum(1 for v in self.content[ix] if v is vy)
+
+  def row_append(self, ix: int, v: Vertex):
+    row = self.content[ix]
+    row.append(v)
+    if self.slots is not None:
+      add_slot(self.slots[ix], v.index, len(row) - 1)
+
+  def row_remove(self, ix: int, v: Vertex):
+    row = self.content[ix]
+    if self.slots is None:
+      row.remove(v)
+      return
+
+    slots = self.slots[ix]
+    positions = slots[v.index]
+    if isinstance(positions, int):
+      i = positions
+      del slots[v.index]
+    else:
+      i = positions.pop()
+      if len(positions) == 1:
+        slots[v.index] = positions[0]
+
+    last = row.pop()
+    if i < len(row):
+      row[i] = last
+      moved = slots[last.index]
+      if isinstance(moved, int):
+        slots[last.index] = i
+      else:
+        moved[moved.index(len(row))] = i
 
   def create_vertex(self, label: str):
     index = super().create_vertex(label)
-    if index == self.vertices[-1].index:
+    if len(self.content) < len(self.vertices):
       self.content.append([])
+      if self.slots is not None:
+        self.slots.append({})
       
     return index
 
+  def add_vertices_bulk(self, labels: Iterable[str | int]) -> list[int]:
+    indices = super().add_vertices_bulk(labels)
+    grow = len(self.vertices) - len(self.content)
+    self.content.extend([] for _ in range(grow))
+    if self.slots is not None:
+      self.slots.extend({} for _ in range(grow))
+
+    return indices
+
   def remove_vertex(self, iv: int):
     v = self.vertices[iv]
-    self.content.pop(iv)
-    
-    for list in self.content:
-      while True:
-        try:
-          list.remove(v)
-        except ValueError:
-          break
-          
+    if v is None:
+      return
+
+    # Only rows of the other endpoints can still point at v
+    for e in self.incidence[iv]:
+      if self.edges[e.index] is not e:
+        continue
+      if e.tail is not v:
+        self.row_remove(e.tail.index, v)
+      if e.head is not v and not self.directed:
+        self.row_remove(e.head.index, v)
+    self.content[iv] = []
+    if self.slots is not None:
+      self.slots[iv] = {}
+
     super().remove_vertex(iv)
 
-  def create_edge(self, ix: int, iy: int, label: Optional[str] = None):
-    vx = self.vertices[ix]
-    vy = self.vertices[iy]
+  def compact(self) -> list[int]:
+    remap = super().compact()
+    if len(self.content) != len(self.vertices):
+      self.content = [row for old, row in enumerate(self.content) if remap[old] != -1]
+      if self.slots is not None:
+        self.hash_neighbors()
 
-    self.content[ix].append(vy)
-    if not self.directed:
-      self.content[iy].append(vx)
+    return remap
+
+  def create_edge(self, ix: int, iy: int, label: Optional[str] = None):
     super().create_edge(ix, iy, label)
+    self.row_append(ix, self.vertices[iy])
+    if not self.directed:
+      self.row_append(iy, self.vertices[ix])
+
+  def insert_edges(self, pairs: np.ndarray, labels: Optional[Sequence[Optional[str]]]):
+    super().insert_edges(pairs, labels)
+
+    content = self.content
+    indptr, heads, _ = sorted_arcs(len(self.vertices), pairs[:, 0], pairs[:, 1], None, directed=self.directed)
+    heads = heads.tolist()
+    if self.slots is not None:
+      bounds = indptr.tolist()
+      for i in np.flatnonzero(np.diff(indptr)).tolist():
+        slots = self.slots[i]
+        offset = len(content[i]) - bounds[i]
+        for position in range(bounds[i], bounds[i + 1]):
+          add_slot(slots, heads[position], position + offset)
+
+    extend_rows(content, indptr, list(map(self.vertices.__getitem__, heads)))
 
   def remove_edge(self, ix: int, iy: int, label: Optional[str] = None):
     vx = self.vertices[ix]
     vy = self.vertices[iy]
 
-    if vy not in self.content[ix]:
+    if self.get_edge(ix, iy, label) is None:
       return
 
-    self.content[ix].remove(vy)
+    self.row_remove(ix, vy)
     if not self.directed:
-      self.content[iy].remove(vx)
+      self.row_remove(iy, vx)
     super().remove_edge(ix, iy, label)
 
   def is_neighbor(self, ix: int, iy: int) -> bool:
+    if self.slots is not None:
+      return iy in self.slots[ix]
+
     return self.vertices[iy] in self.content[ix]
 
+  def freeze(self) -> CSRGraph:
+    return CSRGraph.freeze(self)
+
+  def save(self, path: str):
+    """Removed slots are left out, so the file is numbered densely"""
+    self.freeze().save(path)
+
+  def reachability(self, sources: Sequence[int], targets: Optional[Sequence[int]] = None) -> np.ndarray:
+    """Columns follow this graph's indices, removed vertices are never reached"""
+    csr = self.freeze()
+    reached = csr.reachability(csr.positions(sources), None if targets is None else csr.positions(targets))
+    if targets is not None or csr.vertex_origin is None:
+      return reached
+
+    columns = np.zeros((len(reached), len(self.vertices)), dtype=bool)
+    columns[:, csr.vertex_origin] = reached
+    return columns
+
+  def reachable_sets(self, sources: Sequence[int]) -> list[set[int]]:
+    csr = self.freeze()
+    reached = csr.reachable_sets(csr.positions(sources))
+    if csr.vertex_origin is None:
+      return reached
+
+    origin = csr.vertex_origin.tolist()
+    return [{origin[v] for v in found} for found in reached]
+
+  def shortest_paths(self, weights: Optional[Sequence[float]] = None) -> ShortestPaths:
+    return ShortestPaths(self, weights)
+
   def is_connected(self):
     """Only works for undirected graphs"""
-    for v in self.vertices:
-      v.color = Color.WHITE
-
-    def dfs(u: Vertex, parent: Optional[Vertex] = None):
-      u.color = Color.GREY
-  
-      neighbors = self.content[u.index]
-      for v in neighbors:
-        if v.color == Color.WHITE and v != parent:
-          dfs(v, u)
-  
-      u.color = Color.BLACK
-      
-    dfs(self.vertices[0])
-    for v in self.vertices:
-      if v.color == Color.WHITE:
-        return False
+    if not self.directed:
+      return self.get_components() <= 1
+
+    root = next(self.live_vertices(), None)
+    if root is None:
+      return True
 
-    return True
+    traversal = DepthFirstTraversal(self)
+    traversal.run([root])
+    return all(traversal.color[v.index] != WHITE for v in self.live_vertices())
 
   def contains_circuit(self):
-    components = self.get_components()
-    if (components == 1):
-      return len(self.vertices) - 1 != len(self.edges)
-
-    for c in range(components):
-      for list in self.content:
-        vertices = []
-        for v in list:
-          if v.component == c:
-            vertices.append(v.index)
-        subgraph = self.create_induced_subgraph(vertices)
-        if (len(subgraph.vertices) - 1 == len(subgraph.edges)):
-          return False
-
-    return True
+    """A forest has exactly V - C edges, any further edge closes a circuit"""
+    return self.edge_count() > self.vertex_count() - self.get_components()
 
   def get_walk_between(self, source: int, destination: int) -> Optional[Walk]:
-    paths = self.get_all_paths_between(source, destination)
-    return paths[-1] if paths else None
-
-  # Works only for simple graphs
-  def get_all_paths_between(self, source: int, destination: int) -> list[Walk]:
+    """Breadth-first, so the walk returned is also a shortest one"""
     length = len(self.vertices)
-    if source >= length or destination >= length:
+    if not (self.is_live(source) and self.is_live(destination)):
       return None
 
-    paths: list[Walk] = []
-    currentPath: list[int] = [source]
-    u = self.vertices[source]
-    v = self.vertices[destination]
+    parent = array("i", [-1]) * length
+    parent[source] = source
+    frontier = [source]
 
-    def dfs(source: Vertex, destination: Vertex):
-      if source.index == destination.index:
-        path = Walk(self, currentPath)
-        paths.append(path)
-        return
+    while frontier and parent[destination] == -1:
+      grown = []
+      for u in frontier:
+        for v in self.content[u]:
+          if parent[v.index] == -1:
+            parent[v.index] = u
+            grown.append(v.index)
+      frontier = grown
 
-      source.color = Color.BLACK
-      neighbors = self.content[source.index]
+    if parent[destination] == -1:
+      return None
 
-      for v in neighbors:
-        if v.color == Color.BLACK:
-          continue
+    path = [destination]
+    while path[-1] != source:
+      path.append(parent[path[-1]])
 
-        currentPath.append(v.index)
-        dfs(v, destination)
-        currentPath.pop()
+    return Walk(self, path[::-1])
 
-      source.color = Color.WHITE
-      return
+  # Works only for simple graphs
+  def get_all_paths_between(self, source: int, destination: int) -> list[Walk]:
+    if not (self.is_live(source) and self.is_live(destination)):
+      return None
 
-    for v in self.vertices:
-      v.color = Color.WHITE
+    return [Walk(self, list(path)) for path in self.iter_paths_between(source, destination)]
 
-    dfs(u, v)
+  def iter_paths_between(
+      self, source: int, destination: int, *,
+      max_paths: Optional[int] = None,
+      max_length: Optional[int] = None,
+      deadline: Optional[float] = None) -> Iterator[tuple[int, ...]]:
+    """Lazily yields simple paths as vertex index tuples
 
-    return paths
+    max_length counts edges and deadline is a time.monotonic() timestamp;
+    only the current path is held in memory.
+    """
+    length = len(self.vertices)
+    if not (self.is_live(source) and self.is_live(destination)) or max_paths == 0:
+      return
 
-  def find_cycle(self) -> Optional[Walk]:
-    for v in self.vertices:
-      v.color = Color.WHITE
+    if source == destination:
+      yield (source,)
+      return
 
-    def dfs(u: Vertex, parent: Vertex, walk: list[int]) -> bool:
-      u.color = Color.BLACK
-      neighbors = self.content[u.index]
-      for v in neighbors:
-        if v.color == Color.WHITE:
-          walk.append(v.index)
-          if dfs(v, u, walk):
-            return True
-          else:
-            walk.pop()
-        elif v != parent:
-          walk.append(v.index)
-          return True
+    found = 0
+    path = [source]
+    on_path = bytearray(length)
+    on_path[source] = 1
+    stack = [iter(self.content[source])]
 
-      return False
+    while stack:
+      if deadline is not None and time.monotonic() > deadline:
+        return
 
-    for v in self.vertices:
-      if v.color != Color.WHITE:
-        continue
+      for v in stack[-1]:
+        w = v.index
+        if on_path[w]:
+          continue
 
-      walk = [v.index]
-      if dfs(v, None, walk):
-        start = walk[:-1].index(walk[-1])
-        cycle = walk[start:]
-        return Walk(self, cycle)
+        if w == destination:
+          if max_length is not None and len(path) > max_length:
+            continue
+          yield (*path, w)
+          found += 1
+          if found == max_paths:
+            return
+          continue
 
-    return None
+        if max_length is None or len(path) < max_length:
+          path.append(w)
+          on_path[w] = 1
+          stack.append(iter(self.content[w]))
+          break
+      else:
+        stack.pop()
+        on_path[path.pop()] = 0
 
   def get_cycle_from_circuit(self, circuit: Walk, edge: tuple[int, int, Optional[str]]) -> Walk:
     u = self.vertices[edge[0]]
     v = self.vertices[edge[1]]
-    cycle = [u.index]
-
-    def dfs(source: Vertex, destination: Vertex):
-      if source.index == destination.index:
-        return True
-
-      source.color = Color.BLACK
-      neighbors = self.content[source.index]
-
-      for w in neighbors:
-        if w.color == Color.BLACK:
-          continue
-
-        cycle.append(w.index)
-        if dfs(w, destination):
-          return True
-        cycle.pop()
+    cycle: list[int] = []
 
-      return False
+    def on_enter(w: Vertex, parent: Optional[Vertex]):
+      cycle.append(w.index)
+      if w is v:
+        return TraversalAction.STOP
 
-    for w in self.vertices:
-      w.color = Color.WHITE
+    def on_exit(w: Vertex, parent: Optional[Vertex]):
+      cycle.pop()
 
-    dfs(u, v)
+    DepthFirstTraversal(self).run([u], on_enter=on_enter, on_exit=on_exit)
     cycle.append(u.index)
-    print(cycle)
 
     return Walk(self, cycle)
 
   def restricted_find_cycle(self) -> Walk:
-    if any(v.degree < 2 for v in self.vertices):
+    if any(self.get_degree(v.index) < 2 for v in self.live_vertices()):
       raise Exception("Enter a graph G such that g(v) >= 2 for all v belonging to VG")
 
-    for v in self.vertices:
-      v.color = Color.WHITE
+    source = next(self.live_vertices())
+    path = [source.index]
 
-    source = self.vertices[0]
-    path = [source.index, self.content[source.index][1].index]
+    def on_enter(v: Vertex, parent: Optional[Vertex]):
+      path.append(v.index)
 
-    def dfs(current: Vertex, parent: Vertex):
-      if parent != source and current == source:
-        return True
-
-      current.color = Color.BLACK
-      neighbors = self.content[current.index][1:]
-
-      for v in neighbors:
-        if v.color == Color.BLACK:
-          continue
+    def on_exit(v: Vertex, parent: Optional[Vertex]):
+      path.pop()
 
+    def on_edge(u: Vertex, v: Vertex, kind: EdgeType):
+      if v is source:
         path.append(v.index)
-        if dfs(v, current):
-          return True
-        path.pop()
+        return TraversalAction.STOP
 
-      current.color = Color.WHITE
-      return False
-
-    dfs(self.content[source.index][1], source)
+    traversal = DepthFirstTraversal(self, lambda u: self.content[u.index][1:])
+    traversal.run(
+      [self.content[source.index][1]], on_enter=on_enter, on_exit=on_exit, on_edge=on_edge,
+      backtrack=True)
 
     return Walk(self, path)
 
-  def strongly_connected_components(self):
+  @cached
+  def strongly_connected_components(self, workers: Optional[int] = None):
+    """Large digraphs are frozen and split by a process pool, see CSRGraph"""
     if not self.directed:
       raise Exception("Not a digraph")
 
+    if workers != 1 and self.edge_count() >= PARALLEL_THRESHOLD:
+      csr = self.freeze()
+      if csr.parallel_workers(workers) > 1:
+        origin = csr.origins(np.arange(len(csr.indptr) - 1)).tolist()
+        vertices = self.vertices
+        return [[vertices[origin[v.index]] for v in c] for c in csr.strongly_connected_components(workers)]
+
     length = len(self.vertices)
-    low = [-1] * length
-    disc = [-1] * length
-    onStack = [False] * length
+    low = array("i", [-1]) * length
+    disc = array("i", [-1]) * length
+    onStack = bytearray(length)
     stack: list[Vertex] = []
     time = 0
 
     components: list[list[Vertex]] = []
 
-    def dfs(u, low, disc):
+    def on_enter(u: Vertex, parent: Optional[Vertex]):
       nonlocal time
       disc[u.index] = time
       low[u.index] = time
-      onStack[u.index] = True
+      onStack[u.index] = 1
       stack.append(u)
       time += 1
 
-      neighbors = self.content[u.index]
-      for v in neighbors:
-        if disc[v.index] == -1:
-          dfs(v, low, disc)
-          low[u.index] = min(low[u.index], low[v.index])
-        elif onStack[v.index]:
-          low[u.index] = min(low[u.index], disc[v.index])
+    def on_edge(u: Vertex, v: Vertex, kind: EdgeType):
+      if kind is not EdgeType.TREE_EDGE and onStack[v.index]:
+        low[u.index] = min(low[u.index], disc[v.index])
 
+    def on_exit(u: Vertex, parent: Optional[Vertex]):
       if low[u.index] == disc[u.index]:
         component: list[Vertex] = []
         while True:
           w = stack.pop()
-          component.append(w) 
-          onStack[w.index] = False
-          if w.index == u.index:
+          component.append(w)
+          onStack[w.index] = 0
+          if w is u:
             break
-        components.append(component) 
-
-    for v in self.vertices:
-      if (disc[v.index] == -1):
-        dfs(v, low, disc)
+        components.append(component)
 
-    return components
-
-  def topological_sort(self):
-    stack: list[Vertex] = []
-    
-    for v in self.vertices:
-      v.color = Color.WHITE
-
-    def dfs(u: Vertex, stack: list[Vertex]):
-      u.color = Color.GREY
-  
-      neighbors = self.content[u.index]
-      for v in neighbors:
-        if v.color == Color.WHITE:
-          dfs(v, stack)
+      if parent is not None:
+        low[parent.index] = min(low[parent.index], low[u.index])
 
-      stack.append(u)
-      u.color = Color.BLACK
+    traversal = DepthFirstTraversal(self)
+    traversal.run(self.vertices, on_enter=on_enter, on_exit=on_exit, on_edge=on_edge)
 
-    for v in self.vertices:
-      if v.color is Color.WHITE:
-        dfs(v, stack)
-
-    return stack
-
-  def depth_first_search(self):
-    values = {
-      "Tree Edges": [],
-      "Back Edges": [],
-      "Push Counter": 1,
-      "Pop Counter": 1,
-      "Components": 0
-    }
-
-    for v in self.vertices:
-      v.color = Color.WHITE
-    
-    def dfs(u: Vertex, parent: Optional[Vertex] = None):
-      u.color = Color.GREY
-      u.component = values["Components"]
-  
-      u.entry_depth = values["Push Counter"]
-      values["Push Counter"] += 1
-  
-      neighbors = self.content[u.index]
-      for v in neighbors:
-        if v == parent:
-          continue
+    return components
 
-        edge = (u, v)
-        edge = next(filter(lambda e: e == edge, self.edges))
-        if v.color == Color.WHITE:
-          edge.type = EdgeType.TREE_EDGE
-          values["Tree Edges"].append(edge)
-          dfs(v, u)
-        elif v.color == Color.GREY:
-          edge.type = EdgeType.BACK_EDGE
-          values["Back Edges"].append(edge)
-  
-      u.exit_depth = values["Pop Counter"]
-      values["Pop Counter"] += 1
-  
-      u.color = Color.BLACK
-      
-    for v in self.vertices:
-      if v.color == Color.WHITE:
-        dfs(v)
-        values["Components"] += 1
+  def condensation(self, workers: Optional[int] = None) -> tuple[CSRGraph, np.ndarray]:
+    """Labels follow this graph's indices, -1 on removed vertices"""
+    csr = self.freeze()
+    dag, labels = csr.condensation(workers)
+    if csr.vertex_origin is None:
+      return dag, labels
 
-    return values
+    component = np.full(len(self.vertices), -1, dtype=np.int64)
+    component[csr.vertex_origin] = labels
+    return dag, component
 
   @staticmethod
-  def is_2satisfiable(elements: list[tuple[int, int]]) -> Optional[dict[int, bool]]:
-    g = AdjacencyList(directed=True)
-
-    for u, v in elements:
-      for e in [abs(u), -abs(u), abs(v), -abs(v)]:
-        g.create_vertex(e)
-      
-      for x, y in [(-u, v), (-v, u)]:
-        xi = g.create_vertex(x)
-        yi = g.create_vertex(y)
-        g.create_edge(xi, yi)
-
-    comp_order: list[int] = [-1] * len(g.vertices)
-    assignment: dict[int, bool] = {}
+  def is_2satisfiable(elements: np.ndarray | list[tuple[int, int]]) -> Optional[dict[int, bool]]:
+    return solve_2sat(elements)
     
-    components = g.strongly_connected_components()
-
-    for i, comp in enumerate(components[::-1]):
-      for v in comp:
-        comp_order[v.index] = i
-
-    for i in range(0, len(comp_order), 2):
-      if comp_order[i] == comp_order[i + 1]:
-        return None
-
-      u = g.vertices[i]
-      assignment[u.label] = comp_order[i] > comp_order[i + 1]
+  @staticmethod
+  def from_edges(
+      edges: np.ndarray | Iterable[tuple], *, directed: bool = False,
+      labels: Optional[Sequence[Optional[str]]] = None) -> Graph:
+    return Graph.from_edges(edges, graph_type=AdjacencyList, directed=directed, labels=labels)
 
-    return assignment
-    
   @staticmethod
   def create_empty_graph(n: int, *, directed: bool = False) -> Graph:
     return Graph.create_empty_graph(n, graph_type=AdjacencyList, directed=directed)
@@ -392,4 +444,21 @@ class AdjacencyList(Graph):
 
   @staticmethod
   def create_regular_graph(n: int, k: int) -> Graph:
-    return Graph.create_regular_graph(n, k, graph_type=AdjacencyList)
\ No newline at end of file
+    return Graph.create_regular_graph(n, k, graph_type=AdjacencyList)
+
+  @staticmethod
+  def create_gnp_graph(n: int, p: float, *, directed: bool = False, seed: Optional[int] = None) -> Graph:
+    return Graph.create_gnp_graph(n, p, graph_type=AdjacencyList, directed=directed, seed=seed)
+
+  @staticmethod
+  def create_gnm_graph(n: int, m: int, *, directed: bool = False, seed: Optional[int] = None) -> Graph:
+    return Graph.create_gnm_graph(n, m, graph_type=AdjacencyList, directed=directed, seed=seed)
+
+  @staticmethod
+  def create_barabasi_albert_graph(n: int, k: int, *, directed: bool = False, seed: Optional[int] = None) -> Graph:
+    return Graph.create_barabasi_albert_graph(n, k, graph_type=AdjacencyList, directed=directed, seed=seed)
+
+  @staticmethod
+  def create_rmat_graph(
+      scale: int, m: int, *, directed: bool = False, seed: Optional[int] = None, **probabilities: float) -> Graph:
+    return Graph.create_rmat_graph(scale, m, graph_type=AdjacencyList, directed=directed, seed=seed, **probabilities)
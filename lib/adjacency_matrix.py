@@ -1,34 +1,174 @@
-from typing import Optional
+from __future__ import annotations
+from typing import Iterable, Optional, Sequence
+import numpy as np
 from lib.graph import Graph
 
 
 class AdjacencyMatrix(Graph):
-  """Deprecated, most of methods are not implemented"""
+  """Dense backend keeping edge multiplicities in a NumPy matrix
 
-  def __init__(self):
-    super().__init__()
-    self.content: list[list[int]] = []
+  The matrix is over-allocated and doubles its capacity when vertices no
+  longer fit, so inserting a vertex costs amortized O(V) instead of
+  rebuilding every row. content is the live n x n view of it. Bulk queries
+  (reachability, walks, triangles) are matrix products that go to BLAS,
+  which suits dense graphs up to a few tens of thousands of vertices.
+  """
+
+  def __init__(self, *, directed: bool = False):
+    super().__init__(directed=directed)
+    self.matrix = np.zeros((0, 0), dtype=np.int32)
+
+  @property
+  def content(self) -> np.ndarray:
+    n = len(self.vertices)
+    return self.matrix[:n, :n]
+
+  def reserve(self, n: int):
+    capacity = len(self.matrix)
+    if n <= capacity:
+      return
+
+    capacity = max(n, 2 * capacity, 16)
+    matrix = np.zeros((capacity, capacity), dtype=self.matrix.dtype)
+    old = len(self.matrix)
+    matrix[:old, :old] = self.matrix
+    self.matrix = matrix
 
   def create_vertex(self, label: str):
-    super().create_vertex(label)
-    for row in self.content:
-      row.append(0)
-    self.content.append([0] * len(self.vertices))
+    index = super().create_vertex(label)
+    self.reserve(len(self.vertices))
 
-  def create_edge(self, ix: int, iy: int, label: Optional[str] = None):
-    self.content[ix][iy] += 1
+    return index
+
+  def add_vertices_bulk(self, labels: Iterable[str | int]) -> list[int]:
+    indices = super().add_vertices_bulk(labels)
+    self.reserve(len(self.vertices))
+
+    return indices
+
+  def insert_edges(self, pairs: np.ndarray, labels: Optional[Sequence[Optional[str]]]):
+    super().insert_edges(pairs, labels)
+
+    tails, heads = pairs[:, 0], pairs[:, 1]
+    np.add.at(self.matrix, (tails, heads), 1)
     if not self.directed:
-      self.content[iy][ix] += 1
+      np.add.at(self.matrix, (heads, tails), 1)
+
+  def create_edge(self, ix: int, iy: int, label: Optional[str] = None):
     super().create_edge(ix, iy, label)
+    self.matrix[ix, iy] += 1
+    if not self.directed:
+      self.matrix[iy, ix] += 1
 
   def remove_edge(self, ix: int, iy: int, label: Optional[str] = None):
-    if (self.content[ix][iy] == 0):
+    if self.get_edge(ix, iy, label) is None:
       return
 
-    self.content[ix][iy] -= 1
+    self.matrix[ix, iy] -= 1
     if not self.directed:
-      self.content[iy][ix] -= 1
+      self.matrix[iy, ix] -= 1
     super().remove_edge(ix, iy, label)
 
-  def is_neighbor(self, ix: int, iy: int) -> bool:
-    return bool(self.content[ix][iy])
+  def remove_vertex(self, iv: int):
+    if self.vertices[iv] is None:
+      return
+
+    self.matrix[iv, :] = 0
+    self.matrix[:, iv] = 0
+    super().remove_vertex(iv)
+
+  def compact(self) -> list[int]:
+    n = len(self.vertices)
+    remap = super().compact()
+    if len(self.vertices) != n:
+      keep = np.flatnonzero(np.asarray(remap) != -1)
+      self.matrix = np.ascontiguousarray(self.matrix[np.ix_(keep, keep)])
+
+    return remap
+
+  def is_neighbor(self, ix: int | np.ndarray, iy: int | np.ndarray) -> bool | np.ndarray:
+    """Also takes index arrays, answering every (ix[k], iy[k]) pair at once"""
+    found = self.matrix[ix, iy] != 0
+    return bool(found) if np.ndim(found) == 0 else found
+
+  def neighbors(self, iv: int) -> np.ndarray:
+    return np.flatnonzero(self.content[iv])
+
+  def is_bipartite(self, x: list[int], y: list[int]) -> bool:
+    """Whether x and y split the live vertices with no edge inside either"""
+    if not all(self.is_live(v) for v in x) or not all(self.is_live(v) for v in y):
+      return False
+
+    x = np.asarray(x, dtype=np.int64)
+    y = np.asarray(y, dtype=np.int64)
+    if len(np.unique(np.concatenate((x, y)))) != len(x) + len(y):
+      return False
+
+    live = np.fromiter((v is not None for v in self.vertices), dtype=bool, count=len(self.vertices))
+    side = np.zeros(len(live), dtype=bool)
+    side[x] = True
+    side[y] = True
+    if (side != live).any():
+      return False
+
+    content = self.content
+    return not (content[np.ix_(x, x)].any() or content[np.ix_(y, y)].any())
+
+  def boolean_matrix(self, dtype: type = np.float32) -> np.ndarray:
+    """0/1 adjacency in a floating type, so products run through BLAS"""
+    return (self.content != 0).astype(dtype)
+
+  def reachability(self, sources: Sequence[int], targets: Optional[Sequence[int]] = None) -> np.ndarray:
+    """Boolean matrix telling whether each source reaches each target
+
+    All sources advance together, one matrix product per BFS level.
+    """
+    n = len(self.vertices)
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.arange(n, dtype=np.int64) if targets is None else np.asarray(targets, dtype=np.int64)
+    if ((sources < 0) | (sources >= n)).any() or ((targets < 0) | (targets >= n)).any():
+      raise Exception("Invalid vertices")
+
+    adjacency = self.boolean_matrix()
+    reached = np.zeros((len(sources), n), dtype=bool)
+    reached[np.arange(len(sources)), sources] = True
+    frontier = reached
+    while frontier.any():
+      frontier = ((frontier.astype(np.float32) @ adjacency) > 0) & ~reached
+      reached |= frontier
+
+    return reached[:, targets]
+
+  def transitive_closure(self) -> np.ndarray:
+    """Reflexive closure by repeated squaring, O(V^3 log V) in BLAS"""
+    n = len(self.vertices)
+    closure = self.boolean_matrix()
+    closure[np.arange(n), np.arange(n)] = 1
+    while True:
+      # Entries stay 0/1 between products, and sums up to n are exact in float32
+      squared = (closure @ closure > 0).astype(np.float32)
+      if (squared == closure).all():
+        return closure.astype(bool)
+      closure = squared
+
+  def count_walks(self, length: int) -> np.ndarray:
+    """Walks with the given number of edges between every pair of vertices
+
+    Parallel edges count separately. Products run in float64, so counts
+    are exact while they stay below 2**53.
+    """
+    if length < 0:
+      raise Exception("Walk length must be non-negative")
+
+    return np.linalg.matrix_power(self.content.astype(np.float64), length)
+
+  def count_triangles(self) -> int:
+    """Triangles in an undirected graph, directed 3-cycles in a digraph
+
+    Loops and parallel edges are ignored.
+    """
+    adjacency = self.boolean_matrix(np.float64)
+    np.fill_diagonal(adjacency, 0)
+    closing = float(((adjacency @ adjacency) * adjacency.T).sum())
+
+    return round(closing / (3 if self.directed else 6))
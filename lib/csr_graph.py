@@ -0,0 +1,558 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
+from itertools import repeat
+import os
+import numpy as np
+from lib.disjoint_set import DisjointSet
+from lib.edge import Edge
+from lib.generators import barabasi_albert_edges, gnm_edges, gnp_edges, rmat_edges
+from lib.graph import Graph, index_edge, sorted_arcs
+from lib.result_cache import cached
+from lib.parallel_scc import PARALLEL_THRESHOLD, parallel_component_labels, peel
+from lib.graph_file import DIRECTED, EDGE_LABELS, INT_VERTEX_LABELS, LabelTable, read_graph_file, write_graph_file
+from lib.vertex import Vertex
+
+
+if TYPE_CHECKING:
+  from lib.adjacency_list import AdjacencyList
+
+
+def strongly_connected_labels(indptr: list[int], indices: list[int]) -> tuple[list[int], list[int]]:
+  """Iterative Tarjan over CSR rows
+
+  Returns the component of every vertex, numbered in completion order (so
+  sinks of the condensation come first), and the vertices in the order
+  they were popped, which keeps each component contiguous.
+  """
+  n = len(indptr) - 1
+  cursor = indptr[:-1]
+  disc = [-1] * n
+  low = [0] * n
+  component = [-1] * n
+  stack: list[int] = []
+  popped: list[int] = []
+  time = 0
+  count = 0
+
+  for root in range(n):
+    if disc[root] != -1:
+      continue
+
+    disc[root] = low[root] = time
+    time += 1
+    stack.append(root)
+    calls = [root]
+
+    while calls:
+      u = calls[-1]
+      i = cursor[u]
+      if i < indptr[u + 1]:
+        cursor[u] = i + 1
+        v = indices[i]
+        if disc[v] == -1:
+          disc[v] = low[v] = time
+          time += 1
+          stack.append(v)
+          calls.append(v)
+        elif component[v] == -1 and disc[v] < low[u]:
+          low[u] = disc[v]
+        continue
+
+      calls.pop()
+      if low[u] == disc[u]:
+        while True:
+          w = stack.pop()
+          component[w] = count
+          popped.append(w)
+          if w == u:
+            break
+        count += 1
+
+      if calls and low[u] < low[calls[-1]]:
+        low[calls[-1]] = low[u]
+
+  return component, popped
+
+
+class CSRGraph(Graph):
+  """Read-only graph stored as compressed sparse rows
+
+  Vertex and Edge objects, the lookup indexes and the per-arc labels are
+  built from the arrays on first access, so algorithms that only scan
+  indptr/indices never materialize them.
+  """
+
+  LAZY_ATTRIBUTES = ("vertices", "edges", "label_index", "edge_index")
+
+  def __init__(self, *, directed: bool = False):
+    super().__init__(directed=directed)
+    self.indptr: np.ndarray = np.zeros(1, dtype=np.int64)
+    self.indices: np.ndarray = np.zeros(0, dtype=np.int64)
+    self.edge_ids: np.ndarray = np.zeros(0, dtype=np.int64)
+    self.degrees: np.ndarray = np.zeros(0, dtype=np.int64)
+    self.edge_tails: np.ndarray = np.zeros(0, dtype=np.int64)
+    self.edge_heads: np.ndarray = np.zeros(0, dtype=np.int64)
+    self.vertex_labels: Sequence[str | int] = []
+    self.edge_labels: Optional[Sequence[Optional[str]]] = None
+    self.disjoint_set = None
+    # Objects built one at a time by vertex() and edge() before a full load
+    self.vertex_cache: dict[int, Vertex] = {}
+    self.edge_cache: dict[int, Edge] = {}
+    # Set by freeze() when it skipped removed slots: the frozen graph's index
+    # of each vertex and edge here, and the index here of each of its vertices
+    self.vertex_origin: Optional[np.ndarray] = None
+    self.edge_origin: Optional[np.ndarray] = None
+    self.vertex_position: Optional[np.ndarray] = None
+
+    for name in CSRGraph.LAZY_ATTRIBUTES:
+      delattr(self, name)
+
+  def __getattr__(self, name: str):
+    if name in ("vertices", "label_index"):
+      self.load_vertices()
+      return self.__dict__[name]
+
+    if name in ("edges", "edge_index"):
+      self.load_edges()
+      return self.__dict__[name]
+
+    if name == "labels":
+      self.labels = None
+      if self.edge_labels is not None:
+        labels = np.empty(len(self.edge_labels), dtype=object)
+        labels[:] = list(self.edge_labels)
+        self.labels = labels[self.edge_ids]
+      return self.labels
+
+    raise AttributeError(name)
+
+  def load_vertices(self):
+    labels = self.vertex_labels
+    if isinstance(labels, np.ndarray):
+      labels = labels.tolist()
+
+    vertices = [Vertex(i, label) for i, label in enumerate(labels)]
+    for v, degree in zip(vertices, self.degrees.tolist()):
+      v.degree = degree
+    for i, v in self.vertex_cache.items():
+      vertices[i] = v
+    self.vertex_cache = {}
+
+    self.vertices = vertices
+    self.label_index = {v.label: v.index for v in vertices}
+
+  def load_edges(self):
+    vertices = self.vertices
+    labels = repeat(None) if self.edge_labels is None else self.edge_labels
+
+    edges = [
+      Edge(vertices[x], vertices[y], label, directed=self.directed, index=i)
+      for i, (x, y, label) in enumerate(zip(self.edge_tails.tolist(), self.edge_heads.tolist(), labels))]
+    for i, e in self.edge_cache.items():
+      edges[i] = e
+    self.edge_cache = {}
+
+    self.edges = edges
+    self.edge_index = {}
+    for e in edges:
+      index_edge(self.edge_index, self.edge_key(e.tail.index, e.head.index), e)
+
+  def vertex(self, iv: int) -> Vertex:
+    """Builds just this Vertex while the full list is not loaded"""
+    if "vertices" in self.__dict__:
+      return self.vertices[iv]
+
+    v = self.vertex_cache.get(iv)
+    if v is None:
+      if not 0 <= iv < len(self.indptr) - 1:
+        raise IndexError(iv)
+      label = self.vertex_labels[iv]
+      v = self.vertex_cache[iv] = Vertex(iv, label.item() if isinstance(label, np.generic) else label)
+      v.degree = int(self.degrees[iv])
+
+    return v
+
+  def edge(self, ie: int) -> Edge:
+    """Builds just this Edge, and its ends, while the full list is not loaded"""
+    if "edges" in self.__dict__:
+      return self.edges[ie]
+
+    e = self.edge_cache.get(ie)
+    if e is None:
+      if not 0 <= ie < len(self.edge_tails):
+        raise IndexError(ie)
+      label = None if self.edge_labels is None else self.edge_labels[ie]
+      e = self.edge_cache[ie] = Edge(
+        self.vertex(int(self.edge_tails[ie])), self.vertex(int(self.edge_heads[ie])), label,
+        directed=self.directed, index=ie)
+
+    return e
+
+  def is_live(self, iv: int) -> bool:
+    return 0 <= iv < len(self.indptr) - 1
+
+  @staticmethod
+  def freeze(graph: AdjacencyList) -> CSRGraph:
+    """Snapshot of the live vertices and edges, graph itself is left untouched
+
+    Removed slots are skipped, so indices only agree with graph's when it
+    has none. Otherwise vertex_origin and edge_origin map the snapshot's
+    indices back, and vertex_position maps graph's vertices in (-1 where
+    removed).
+    """
+    vertices = list(graph.live_vertices())
+    edges = list(graph.live_edges())
+    n = len(vertices)
+    m = len(edges)
+    tails = np.fromiter((e.tail.index for e in edges), dtype=np.int64, count=m)
+    heads = np.fromiter((e.head.index for e in edges), dtype=np.int64, count=m)
+
+    position = None
+    if n < len(graph.vertices):
+      origin = np.fromiter((v.index for v in vertices), dtype=np.int64, count=n)
+      position = np.full(len(graph.vertices), -1, dtype=np.int64)
+      position[origin] = np.arange(n, dtype=np.int64)
+      tails = position[tails]
+      heads = position[heads]
+
+    g = CSRGraph.from_arrays(
+      n, tails, heads, directed=graph.directed,
+      vertex_labels=[v.label for v in vertices],
+      edge_labels=[e.label for e in edges] if any(e.label is not None for e in edges) else None)
+    if position is not None:
+      g.vertex_origin = origin
+      g.vertex_position = position
+    if m < len(graph.edges):
+      g.edge_origin = np.fromiter((e.index for e in edges), dtype=np.int64, count=m)
+
+    return g
+
+  def positions(self, vertices: Sequence[int]) -> np.ndarray:
+    """Snapshot indices of vertices given as indices of the frozen graph"""
+    vertices = np.asarray(vertices, dtype=np.int64)
+    if self.vertex_position is None:
+      return vertices
+
+    if ((vertices < 0) | (vertices >= len(self.vertex_position))).any():
+      raise Exception("Invalid vertices")
+    found = self.vertex_position[vertices]
+    if (found < 0).any():
+      raise Exception("Invalid vertices")
+
+    return found
+
+  def origins(self, vertices: Sequence[int] | np.ndarray) -> np.ndarray:
+    """Indices in the frozen graph of snapshot vertices"""
+    vertices = np.asarray(vertices, dtype=np.int64)
+    return vertices if self.vertex_origin is None else self.vertex_origin[vertices]
+
+  @staticmethod
+  def from_arrays(
+      n: int, tails: np.ndarray, heads: np.ndarray, *, directed: bool = False,
+      vertex_labels: Optional[Sequence[str | int]] = None,
+      edge_labels: Optional[Sequence[Optional[str]]] = None) -> CSRGraph:
+    """Vertices default to being labeled by their index"""
+    g = CSRGraph(directed=directed)
+    m = len(tails)
+    g.vertex_labels = np.arange(n, dtype=np.int64) if vertex_labels is None else vertex_labels
+    g.edge_labels = edge_labels
+    g.edge_tails = tails
+    g.edge_heads = heads
+    g.degrees = np.bincount(tails, minlength=n) + np.bincount(heads, minlength=n)
+    g.indptr, g.indices, g.edge_ids = sorted_arcs(
+      n, tails, heads, np.arange(m, dtype=np.int64), directed=directed)
+
+    return g
+
+  @staticmethod
+  def from_pairs(n: int, pairs: np.ndarray, *, directed: bool = False) -> CSRGraph:
+    """From an (m, 2) array of vertex indices, such as the generators return"""
+    return CSRGraph.from_arrays(
+      n, np.ascontiguousarray(pairs[:, 0]), np.ascontiguousarray(pairs[:, 1]), directed=directed)
+
+  @staticmethod
+  def create_gnp_graph(n: int, p: float, *, directed: bool = False, seed: Optional[int] = None) -> CSRGraph:
+    return CSRGraph.from_pairs(n, gnp_edges(n, p, directed=directed, seed=seed), directed=directed)
+
+  @staticmethod
+  def create_gnm_graph(n: int, m: int, *, directed: bool = False, seed: Optional[int] = None) -> CSRGraph:
+    return CSRGraph.from_pairs(n, gnm_edges(n, m, directed=directed, seed=seed), directed=directed)
+
+  @staticmethod
+  def create_barabasi_albert_graph(n: int, k: int, *, directed: bool = False, seed: Optional[int] = None) -> CSRGraph:
+    return CSRGraph.from_pairs(n, barabasi_albert_edges(n, k, seed=seed), directed=directed)
+
+  @staticmethod
+  def create_rmat_graph(
+      scale: int, m: int, *, directed: bool = False, seed: Optional[int] = None, **probabilities: float) -> CSRGraph:
+    return CSRGraph.from_pairs(1 << scale, rmat_edges(scale, m, seed=seed, **probabilities), directed=directed)
+
+  def save(self, path: str):
+    sections = {
+      "indptr": self.indptr,
+      "indices": self.indices,
+      "edge_ids": self.edge_ids,
+      "degrees": self.degrees,
+      "edge_tails": self.edge_tails,
+      "edge_heads": self.edge_heads,
+    }
+
+    labels = self.vertex_labels
+    if isinstance(labels, np.ndarray) or all(type(label) is int for label in labels):
+      sections["vertex_labels"] = np.asarray(labels, dtype=np.int64)
+    else:
+      table = labels if isinstance(labels, LabelTable) else LabelTable.pack(labels)
+      sections["vertex_label_offsets"] = table.offsets
+      sections["vertex_label_data"] = table.data
+
+    if self.edge_labels is not None:
+      table = self.edge_labels
+      if not isinstance(table, LabelTable):
+        table = LabelTable.pack(table)
+      sections["edge_label_mask"] = table.mask
+      sections["edge_label_offsets"] = table.offsets
+      sections["edge_label_data"] = table.data
+
+    write_graph_file(
+      path, sections, directed=self.directed,
+      vertices=len(self.indptr) - 1, edges=len(self.edge_tails))
+
+  @staticmethod
+  def open(path: str) -> CSRGraph:
+    flags, sections = read_graph_file(path)
+    g = CSRGraph(directed=bool(flags & DIRECTED))
+
+    g.indptr = sections["indptr"]
+    g.indices = sections["indices"]
+    g.edge_ids = sections["edge_ids"]
+    g.degrees = sections["degrees"]
+    g.edge_tails = sections["edge_tails"]
+    g.edge_heads = sections["edge_heads"]
+
+    if flags & INT_VERTEX_LABELS:
+      g.vertex_labels = sections["vertex_labels"]
+    else:
+      g.vertex_labels = LabelTable(sections["vertex_label_offsets"], sections["vertex_label_data"])
+
+    if flags & EDGE_LABELS:
+      g.edge_labels = LabelTable(
+        sections["edge_label_offsets"], sections["edge_label_data"], sections["edge_label_mask"])
+
+    return g
+
+  def create_vertex(self, label: str):
+    raise Exception("CSRGraph is read-only")
+
+  def add_vertices_bulk(self, labels: Iterable[str | int]) -> list[int]:
+    raise Exception("CSRGraph is read-only")
+
+  def remove_vertex(self, iv: int):
+    raise Exception("CSRGraph is read-only")
+
+  def add_edges_bulk(self, edges: np.ndarray | Iterable[tuple], labels: Optional[Sequence[Optional[str]]] = None):
+    raise Exception("CSRGraph is read-only")
+
+  def create_edge(self, ix: int, iy: int, label: Optional[str] = None):
+    raise Exception("CSRGraph is read-only")
+
+  def remove_edge(self, ix: int, iy: int, label: Optional[str] = None):
+    raise Exception("CSRGraph is read-only")
+
+  def get_disjoint_set(self) -> DisjointSet:
+    if self.disjoint_set is None:
+      self.disjoint_set = DisjointSet(len(self.indptr) - 1)
+      for x, y in zip(self.edge_tails.tolist(), self.edge_heads.tolist()):
+        self.disjoint_set.union(x, y)
+
+    return self.disjoint_set
+
+  def rows(self) -> tuple[list[int], memoryview, memoryview]:
+    """indptr as a list to seed cursors from, indices and edge ids as views
+
+    Views index the arrays in place, so a memory-mapped file is only paged
+    in where a traversal goes instead of being copied into lists first.
+    """
+    indices = memoryview(np.ascontiguousarray(self.indices))
+    return self.indptr.tolist(), indices, memoryview(np.ascontiguousarray(self.edge_ids))
+
+  def arcs(self, *, undirected: bool = False) -> tuple[list[int], Sequence[int], Sequence[int]]:
+    """The stored rows, rebuilt from the edge arrays when a digraph is wanted undirected"""
+    if not (self.directed and undirected):
+      return self.rows()
+
+    m = len(self.edge_tails)
+    indptr, indices, edge_ids = sorted_arcs(
+      len(self.indptr) - 1, self.edge_tails, self.edge_heads, np.arange(m, dtype=np.int64), directed=False)
+    return indptr.tolist(), memoryview(indices), memoryview(edge_ids)
+
+  def neighbors(self, iv: int) -> np.ndarray:
+    return self.indices[self.indptr[iv]:self.indptr[iv + 1]]
+
+  def is_neighbor(self, ix: int, iy: int) -> bool:
+    return bool((self.neighbors(ix) == iy).any())
+
+  def expand(self, frontier: np.ndarray) -> np.ndarray:
+    """Concatenated neighbors of every vertex in frontier"""
+    starts = self.indptr[frontier]
+    counts = self.indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+      return np.zeros(0, dtype=np.int64)
+
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return self.indices[offsets + np.arange(total, dtype=np.int64)]
+
+  def reachability(self, sources: Sequence[int], targets: Optional[Sequence[int]] = None, *, batch: int = 512) -> np.ndarray:
+    """Boolean matrix telling whether each source reaches each target
+
+    Sources are packed 64 to a word, so a batch of them advances through
+    a single breadth-first sweep of bitset frontiers.
+    """
+    n = len(self.indptr) - 1
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.arange(n, dtype=np.int64) if targets is None else np.asarray(targets, dtype=np.int64)
+    if ((targets < 0) | (targets >= n)).any():
+      raise Exception("Invalid vertices")
+
+    result = np.zeros((len(sources), len(targets)), dtype=bool)
+    for start in range(0, len(sources), batch):
+      chunk = sources[start:start + batch]
+      bits = self.reachability_bits(chunk)[targets]
+      unpacked = np.unpackbits(bits.view(np.uint8), axis=1, bitorder="little")
+      result[start:start + len(chunk)] = unpacked[:, :len(chunk)].T
+
+    return result
+
+  def reachability_bits(self, sources: np.ndarray) -> np.ndarray:
+    """(n, words) uint64 rows, bit i of row v set when sources[i] reaches v"""
+    n = len(self.indptr) - 1
+    if ((sources < 0) | (sources >= n)).any():
+      raise Exception("Invalid vertices")
+
+    words = (len(sources) + 63) // 64
+    bits = np.zeros((n, words), dtype=np.uint64)
+    batch = np.arange(len(sources))
+    np.bitwise_or.at(bits, (sources, batch // 64), np.left_shift(np.uint64(1), (batch % 64).astype(np.uint64)))
+
+    # Vertices whose bits grew last round push them along their arcs
+    frontier = np.unique(sources)
+    while frontier.size:
+      counts = self.indptr[frontier + 1] - self.indptr[frontier]
+      tails = np.repeat(frontier, counts)
+      heads = self.expand(frontier)
+      if heads.size == 0:
+        break
+
+      order = np.argsort(heads, kind="stable")
+      heads = heads[order]
+      starts = np.flatnonzero(np.r_[True, heads[1:] != heads[:-1]])
+      incoming = np.bitwise_or.reduceat(bits[tails[order]], starts, axis=0)
+
+      heads = heads[starts]
+      grown = bits[heads] | incoming
+      changed = (grown != bits[heads]).any(axis=1)
+      frontier = heads[changed]
+      bits[frontier] = grown[changed]
+
+    return bits
+
+  def reachable_sets(self, sources: Sequence[int], *, batch: int = 512) -> list[set[int]]:
+    """Indices of the vertices reached from each source, itself included"""
+    sources = np.asarray(sources, dtype=np.int64)
+    reached = []
+    for start in range(0, len(sources), batch):
+      chunk = sources[start:start + batch]
+      bits = self.reachability_bits(chunk)
+      for i in range(len(chunk)):
+        column = bits[:, i // 64] & np.uint64(1 << (i % 64))
+        reached.append(set(np.flatnonzero(column).tolist()))
+
+    return reached
+
+  def is_connected(self):
+    """Only works for undirected graphs"""
+    n = len(self.indptr) - 1
+    if n == 0:
+      return True
+
+    visited = np.zeros(n, dtype=bool)
+    visited[0] = True
+    frontier = np.zeros(1, dtype=np.int64)
+
+    while frontier.size:
+      reached = self.expand(frontier)
+      frontier = np.unique(reached[~visited[reached]])
+      visited[frontier] = True
+
+    return bool(visited.all())
+
+  def component_labels(self, workers: Optional[int] = None) -> np.ndarray:
+    """Strongly connected component of every vertex, sinks numbered first
+
+    Large digraphs use a process pool when more than one worker is
+    available (all cores by default), small ones sequential Tarjan.
+    """
+    if not self.directed:
+      raise Exception("Not a digraph")
+
+    workers = self.parallel_workers(workers)
+    if workers < 2:
+      indptr, indices, _ = self.rows()
+      component, _ = strongly_connected_labels(indptr, indices)
+      return np.array(component, dtype=np.int64)
+
+    # Representatives are arbitrary, peeling the DAG from its sources
+    # yields a topological order to number them sinks first, like Tarjan
+    representatives = parallel_component_labels(self.indptr, self.indices, workers)
+    unique, dense = np.unique(representatives, return_inverse=True)
+    dag = self.condense(dense, len(unique))
+    order = np.empty(len(unique), dtype=np.int64)
+    order[peel(dag.indptr, dag.indices, np.ones(len(unique), dtype=bool))[::-1]] = np.arange(len(unique))
+    return order[dense]
+
+  def parallel_workers(self, workers: Optional[int]) -> int:
+    """Workers worth starting for this graph, 1 meaning stay sequential"""
+    if workers is None:
+      workers = os.cpu_count() or 1
+    return workers if len(self.indices) >= PARALLEL_THRESHOLD else 1
+
+  def condense(self, labels: np.ndarray, count: int) -> CSRGraph:
+    tails = labels[np.repeat(np.arange(len(self.indptr) - 1, dtype=np.int64), np.diff(self.indptr))]
+    heads = labels[self.indices]
+    crossing = tails != heads
+    arcs = np.unique(np.stack((tails[crossing], heads[crossing]), axis=1), axis=0).reshape(-1, 2)
+    return CSRGraph.from_arrays(count, arcs[:, 0], arcs[:, 1], directed=True)
+
+  @cached
+  def condensation(self, workers: Optional[int] = None) -> tuple[CSRGraph, np.ndarray]:
+    """DAG of the strongly connected components and the component of each vertex
+
+    Component k of the DAG is the k-th to complete, so sinks come first.
+    """
+    labels = self.component_labels(workers)
+    return self.condense(labels, int(labels.max(initial=-1)) + 1), labels
+
+  @cached
+  def strongly_connected_components(self, workers: Optional[int] = None):
+    if not self.directed:
+      raise Exception("Not a digraph")
+
+    vertices = self.vertices
+    if self.parallel_workers(workers) < 2:
+      indptr, indices, _ = self.rows()
+      component, popped = strongly_connected_labels(indptr, indices)
+      components: list[list[Vertex]] = []
+      current = -1
+      for w in popped:
+        if component[w] != current:
+          current = component[w]
+          components.append([])
+        components[-1].append(vertices[w])
+      return components
+
+    labels = self.component_labels(workers)
+    components: list[list[Vertex]] = [[] for _ in range(int(labels.max(initial=-1)) + 1)]
+    for w, c in enumerate(labels.tolist()):
+      components[c].append(vertices[w])
+
+    return components
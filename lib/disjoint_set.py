@@ -0,0 +1,63 @@
+from __future__ import annotations
+import numpy as np
+
+
+class DisjointSet:
+  """Union-find over 0..n-1 with union by size and path halving"""
+
+  def __init__(self, n: int = 0):
+    self.parent = list(range(n))
+    self.size = [1] * n
+    self.count = n
+
+  def add(self, k: int = 1):
+    start = len(self.parent)
+    self.parent.extend(range(start, start + k))
+    self.size.extend([1] * k)
+    self.count += k
+
+  def find(self, x: int) -> int:
+    parent = self.parent
+    while parent[x] != x:
+      parent[x] = parent[parent[x]]
+      x = parent[x]
+    return x
+
+  def union(self, x: int, y: int) -> bool:
+    """Returns False when x and y were already together"""
+    x, y = self.find(x), self.find(y)
+    if x == y:
+      return False
+
+    if self.size[x] < self.size[y]:
+      x, y = y, x
+    self.parent[y] = x
+    self.size[x] += self.size[y]
+    self.count -= 1
+    return True
+
+  def union_pairs(self, xs: np.ndarray, ys: np.ndarray):
+    """union() over zipped arrays
+
+    Components among the pairs are found first with numpy min-label hooking
+    and pointer jumping, leaving one union per touched vertex for Python.
+    """
+    nodes, inverse = np.unique(np.concatenate((xs, ys)), return_inverse=True)
+    a, b = inverse[:len(xs)], inverse[len(xs):]
+    label = np.arange(len(nodes))
+    while True:
+      la, lb = label[a], label[b]
+      differ = la != lb
+      if not differ.any():
+        break
+      np.minimum.at(label, np.maximum(la, lb)[differ], np.minimum(la, lb)[differ])
+      while True:
+        jumped = label[label]
+        if np.array_equal(jumped, label):
+          break
+        label = jumped
+
+    moved = np.flatnonzero(label != np.arange(len(nodes)))
+    union = self.union
+    for x, y in zip(nodes[moved].tolist(), nodes[label[moved]].tolist()):
+      union(x, y)
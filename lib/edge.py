@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
-from lib.constants import EdgeType
 
 
 if TYPE_CHECKING:
@@ -8,20 +7,25 @@ if TYPE_CHECKING:
 
 
 class Edge:
+  __slots__ = ("tail", "head", "label", "directed", "index")
 
-  def __init__(self, u: Vertex, v: Vertex, label: Optional[str] = None, *, directed: bool = False):
+  def __init__(self, u: Vertex, v: Vertex, label: Optional[str] = None, *, directed: bool = False, index: int = -1):
+    self.index = index
     self.directed = directed
-    self.type = EdgeType.UNCLASSIFIED
 
-    ends: tuple[Vertex, Vertex] = (u, v)
     if not directed and u.index < v.index:
-      ends = (v, u)
+      u, v = v, u
 
-    self.ends = ends
+    self.tail = u
+    self.head = v
     self.label = label
 
+  @property
+  def ends(self) -> tuple[Vertex, Vertex]:
+    return (self.tail, self.head)
+
   def contains(self, v: Vertex) -> bool:
-    return v.index == self.ends[0].index or v.index == self.ends[1].index
+    return v.index == self.tail.index or v.index == self.head.index
 
   def __eq__(self, __value: object) -> bool:
     if isinstance(__value, Edge):
@@ -35,9 +39,9 @@ class Edge:
         return self.label == __value[2]
 
       if not self.directed:
-        __value = __value[::-1] if __value[1] < __value[0] else __value
+        __value = __value[::-1] if __value[0] < __value[1] else __value
         
-      return self.ends[0].index == __value[0] and self.ends[1].index == __value[1]
+      return self.tail.index == __value[0] and self.head.index == __value[1]
 
     return False
 
@@ -49,5 +53,5 @@ class Edge:
     if self.label is None:
       return str(tuple(self))
 
-    return self.label + str(tuple(self))
+    return str(self.label) + str(tuple(self))
 
@@ -0,0 +1,135 @@
+from __future__ import annotations
+from typing import Optional
+import numpy as np
+
+
+# Pairs per chunk of geometric skips, bounds memory for dense G(n, p)
+SKIP_CHUNK = 1 << 22
+
+
+def pair_count(n: int, directed: bool) -> int:
+  return n * (n - 1) if directed else n * (n - 1) // 2
+
+
+def unrank_pairs(ranks: np.ndarray, n: int, directed: bool) -> np.ndarray:
+  """(m, 2) vertex pairs of ranks into the loop-free pairs of n vertices
+
+  Digraph pairs are ranked row by row skipping the diagonal, undirected
+  ones over the lower triangle (x > y), both in lexicographic order.
+  """
+  if directed:
+    x = ranks // (n - 1)
+    y = ranks % (n - 1)
+    y += y >= x
+    return np.stack((x, y), axis=1)
+
+  # Row x starts at x (x - 1) / 2, the float root is fixed up by one step
+  x = ((1 + np.sqrt(1 + 8 * ranks.astype(np.float64))) / 2).astype(np.int64)
+  x -= x * (x - 1) // 2 > ranks
+  x += (x + 1) * x // 2 <= ranks
+  return np.stack((x, ranks - x * (x - 1) // 2), axis=1)
+
+
+def gnp_edges(n: int, p: float, *, directed: bool = False, seed: Optional[int | np.random.Generator] = None) -> np.ndarray:
+  """Erdős–Rényi G(n, p) edges in O(n + m) by geometric skipping
+
+  The gap to the next kept pair is geometric, so only kept pairs are ever
+  drawn (Batagelj and Brandes). Gaps come in vectorized chunks.
+  """
+  if not 0 <= p <= 1:
+    raise Exception("Probability must be within [0, 1]")
+
+  rng = np.random.default_rng(seed)
+  total = pair_count(n, directed)
+  if p == 0 or total == 0:
+    return np.zeros((0, 2), dtype=np.int64)
+  if p == 1:
+    return unrank_pairs(np.arange(total, dtype=np.int64), n, directed)
+
+  chunks = []
+  last = -1
+  expected = int(total * p)
+  while last < total:
+    size = min(SKIP_CHUNK, expected + 4 * int(np.sqrt(expected)) + 16)
+    ranks = last + np.cumsum(rng.geometric(p, size=size))
+    last = int(ranks[-1])
+    chunks.append(ranks[ranks < total])
+
+  return unrank_pairs(np.concatenate(chunks), n, directed)
+
+
+def gnm_edges(n: int, m: int, *, directed: bool = False, seed: Optional[int | np.random.Generator] = None) -> np.ndarray:
+  """Erdős–Rényi G(n, m) edges, m distinct loop-free pairs drawn uniformly
+
+  Sparse requests redraw until enough distinct ranks turn up, dense ones
+  shuffle every pair instead.
+  """
+  rng = np.random.default_rng(seed)
+  total = pair_count(n, directed)
+  if not 0 <= m <= total:
+    raise Exception("Too many edges for a simple graph")
+
+  if 2 * m > total:
+    ranks = rng.permutation(total)[:m]
+  else:
+    ranks = np.zeros(0, dtype=np.int64)
+    while len(ranks) < m:
+      drawn = rng.integers(0, total, size=int(1.1 * (m - len(ranks))) + 16)
+      ranks = np.sort(np.concatenate((ranks, drawn)))
+      ranks = ranks[np.r_[True, ranks[1:] != ranks[:-1]]]
+    ranks = rng.permutation(ranks)[:m]
+
+  return unrank_pairs(np.sort(ranks), n, directed)
+
+
+def barabasi_albert_edges(n: int, k: int, *, seed: Optional[int | np.random.Generator] = None) -> np.ndarray:
+  """Preferential attachment edges, every vertex v > 0 attaching k edges
+
+  Follows the linear model of Batagelj and Brandes. Endpoints form one
+  flat list starting with vertex 0, and each new head copies the endpoint
+  at a uniform earlier position, which picks targets in proportion to
+  their degree. Heads copying heads are resolved by chasing those copies
+  for all edges at once. Like the model, it may produce loops and
+  parallel edges.
+  """
+  if n < 1 or k < 1:
+    raise Exception("Expected at least one vertex and one edge per vertex")
+
+  rng = np.random.default_rng(seed)
+  m = (n - 1) * k
+  endpoints = np.zeros(2 * m + 1, dtype=np.int64)
+  endpoints[1::2] = np.repeat(np.arange(1, n, dtype=np.int64), k)
+
+  # Edge e has its tail at 2e + 1 and copies its head from 0..2e + 1
+  source = (rng.random(m) * (2 * np.arange(m, dtype=np.int64) + 2)).astype(np.int64)
+  pending = np.flatnonzero((source % 2 == 0) & (source > 0))
+  while pending.size:
+    source[pending] = source[(source[pending] - 2) // 2]
+    pending = pending[(source[pending] % 2 == 0) & (source[pending] > 0)]
+
+  endpoints[2::2] = endpoints[source]
+  return endpoints[1:].reshape(-1, 2)
+
+
+def rmat_edges(
+    scale: int, m: int, *, a: float = 0.57, b: float = 0.19, c: float = 0.19,
+    seed: Optional[int | np.random.Generator] = None) -> np.ndarray:
+  """R-MAT edges over 2 ** scale vertices, Graph 500 parameters by default
+
+  Each edge descends scale levels of the adjacency matrix, picking a
+  quadrant with probabilities a, b, c and 1 - a - b - c. Every level is one
+  vectorized draw for all edges.
+  """
+  if min(a, b, c) < 0 or a + b + c > 1:
+    raise Exception("Quadrant probabilities must be non-negative and sum to at most 1")
+
+  rng = np.random.default_rng(seed)
+  x = np.zeros(m, dtype=np.int64)
+  y = np.zeros(m, dtype=np.int64)
+  for level in range(scale):
+    u = rng.random(m, dtype=np.float32)
+    bit = np.int64(1) << (scale - level - 1)
+    x += bit * (u >= a + b)
+    y += bit * (((u >= a) & (u < a + b)) | (u >= a + b + c))
+
+  return np.stack((x, y), axis=1)
@@ -1,66 +1,380 @@
 from __future__ import annotations
-from typing import Optional
-from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Sequence
+from array import array
+import gc
+from itertools import count, repeat
+import numpy as np
+from lib.disjoint_set import DisjointSet
 from lib.edge import Edge
+from lib.generators import barabasi_albert_edges, gnm_edges, gnp_edges, rmat_edges
+from lib.result_cache import ResultCache, cached
+from lib.traversal import blocked_cycle, classified_edges, depth_first_arrays, topological_levels
 from lib.vertex import Vertex
+from lib.walk import CycleError, Walk
+
+
+if TYPE_CHECKING:
+  from lib.subgraph_view import SubgraphView
+
+
+# Endpoint pairs pack into one int key, tail above the low 32 bits
+EDGE_KEY_SHIFT = 32
+
+
+def index_edge(index: dict[int, Edge | list[Edge]], key: int, edge: Edge):
+  """Single edges are stored as is, lists only appear for parallel edges"""
+  found = index.get(key)
+  if found is None:
+    index[key] = edge
+  elif isinstance(found, Edge):
+    index[key] = [found, edge]
+  else:
+    found.append(edge)
+
+
+def unindex_edge(index: dict[int, Edge | list[Edge]], key: int, edge: Edge):
+  found = index[key]
+  if found is edge:
+    del index[key]
+    return
+
+  found.remove(edge)
+  if len(found) == 1:
+    index[key] = found[0]
+
+
+def indexed_edges(found: Optional[Edge | list[Edge]]) -> Sequence[Edge]:
+  if found is None:
+    return ()
+  if isinstance(found, Edge):
+    return (found,)
+
+  return found
+
+
+def sorted_arcs(
+    n: int, tails: np.ndarray, heads: np.ndarray, ids: Optional[np.ndarray], *,
+    directed: bool) -> tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+  """CSR indptr, heads and edge ids of the given edges, rows in edge order
+
+  Both arcs of an undirected edge are interleaved, so rows keep insertion
+  order and a loop shows up twice in its row. ids may be None when only
+  the rows are wanted.
+  """
+  if not directed:
+    tails, heads = np.stack((tails, heads), axis=1).ravel(), np.stack((heads, tails), axis=1).ravel()
+    ids = None if ids is None else np.repeat(ids, 2)
+
+  order = np.argsort(tails, kind="stable")
+  indptr = np.zeros(n + 1, dtype=np.int64)
+  np.cumsum(np.bincount(tails, minlength=n), out=indptr[1:])
+
+  return indptr, heads[order], None if ids is None else ids[order]
+
+
+def extend_rows(rows: list[list], indptr: np.ndarray, items: list):
+  """rows[i] gets items[indptr[i]:indptr[i + 1]], one extend per nonempty row"""
+  bounds = indptr.tolist()
+  for i in np.flatnonzero(np.diff(indptr)).tolist():
+    rows[i] += items[bounds[i]:bounds[i + 1]]
 
 
 class Graph:
+  """Removed vertices and edges leave None in their slots, so indices stay
+  stable until compact() renumbers everything in one pass"""
 
   def __init__(self, *, directed: bool = False):
-    self.vertices: list[Vertex] = []
-    self.edges: list[Edge] = []
+    self.vertices: list[Optional[Vertex]] = []
+    self.edges: list[Optional[Edge]] = []
+    # Edges touching each vertex, removed ones linger until compact()
+    self.incidence: list[list[Edge]] = []
+    self.dead_vertices = 0
+    self.dead_edges = 0
     self.directed = directed
+    self.label_index: dict[str | int, int] = {}
+    self.edge_index: dict[int, Edge | list[Edge]] = {}
+    # Connected components (ignoring direction), None until next needed
+    self.disjoint_set: Optional[DisjointSet] = DisjointSet()
+    # Bumped by every mutation, cached results only hit on the same version
+    self.version = 0
+    self.cache = ResultCache()
+
+  def create_vertex(self, label: str) -> int:
+    index = self.label_index.get(label)
+    if index is not None:
+      return index
 
-  def create_vertex(self, label: str) -> bool:
-    for v in self.vertices:
-      if v.label == label:
-        return v.index
-        
     index = len(self.vertices)
     self.vertices.append(Vertex(index, label))
-    
+    self.incidence.append([])
+    self.label_index[label] = index
+    self.version += 1
+    if self.disjoint_set is not None:
+      self.disjoint_set.add()
+
     return index
 
+  def add_vertices_bulk(self, labels: Iterable[str | int]) -> list[int]:
+    label_index = self.label_index
+    vertices = self.vertices
+    indices = []
+
+    for label in labels:
+      index = label_index.get(label)
+      if index is None:
+        index = len(vertices)
+        vertices.append(Vertex(index, label))
+        label_index[label] = index
+      indices.append(index)
+
+    self.incidence.extend([] for _ in range(len(vertices) - len(self.incidence)))
+    self.version += 1
+    if self.disjoint_set is not None:
+      self.disjoint_set.add(len(vertices) - len(self.disjoint_set.parent))
+
+    return indices
+
   def remove_vertex(self, iv: int):
     v = self.vertices[iv]
+    if v is None:
+      return
+
+    for e in self.incidence[iv]:
+      if self.edges[e.index] is e:
+        self.discard_edge(e)
+
+    self.vertices[iv] = None
+    self.incidence[iv] = []
+    self.dead_vertices += 1
+    del self.label_index[v.label]
+    self.disjoint_set = None
+    self.version += 1
+
+  def compact(self) -> list[int]:
+    """Renumbers live vertices and edges densely in one linear pass
 
-    to_remove = []
-    for e in self.edges:
-      if e.contains(v):
-        to_remove.append(e)
+    Returns the new index of every old vertex index, -1 for removed ones.
+    """
+    remap = [-1] * len(self.vertices)
+    if not (self.dead_vertices or self.dead_edges):
+      return list(range(len(self.vertices)))
 
-    for e in to_remove:
-      self.edges.remove(e)
-    
-    for u in self.vertices[iv:]:
-      u.index -= 1
-    
-    self.vertices.pop(iv)
+    vertices = [v for v in self.vertices if v is not None]
+    for i, v in enumerate(vertices):
+      remap[v.index] = i
+      v.index = i
+
+    edges = [e for e in self.edges if e is not None]
+    incidence: list[list[Edge]] = [[] for _ in vertices]
+    for i, e in enumerate(edges):
+      e.index = i
+      incidence[e.tail.index].append(e)
+      if e.head is not e.tail:
+        incidence[e.head.index].append(e)
+
+    self.vertices = vertices
+    self.edges = edges
+    self.incidence = incidence
+    self.dead_vertices = 0
+    self.dead_edges = 0
+    self.rebuild_indexes()
+    self.disjoint_set = None
+    self.version += 1
+
+    return remap
+
+  def vertex(self, iv: int) -> Optional[Vertex]:
+    return self.vertices[iv]
+
+  def edge(self, ie: int) -> Optional[Edge]:
+    return self.edges[ie]
+
+  def is_live(self, iv: int) -> bool:
+    return 0 <= iv < len(self.vertices) and self.vertices[iv] is not None
+
+  def live_vertices(self) -> Iterator[Vertex]:
+    return (v for v in self.vertices if v is not None)
+
+  def live_edges(self) -> Iterator[Edge]:
+    return (e for e in self.edges if e is not None)
+
+  def vertex_count(self) -> int:
+    return len(self.vertices) - self.dead_vertices
+
+  def edge_count(self) -> int:
+    return len(self.edges) - self.dead_edges
+
+  def rebuild_indexes(self):
+    self.label_index = {v.label: v.index for v in self.live_vertices()}
+    self.edge_index = {}
+    for e in self.live_edges():
+      index_edge(self.edge_index, self.edge_key(e.tail.index, e.head.index), e)
+
+  def edge_key(self, ix: int, iy: int) -> int:
+    if not self.directed and ix < iy:
+      ix, iy = iy, ix
+
+    return ix << EDGE_KEY_SHIFT | iy
+
+  def get_edge(self, ix: int, iy: int, label: Optional[str] = None) -> Optional[Edge]:
+    edges = indexed_edges(self.edge_index.get(self.edge_key(ix, iy)))
+    if label is None:
+      return edges[0] if edges else None
+
+    return next((e for e in edges if e.label == label), None)
 
   def create_edge(self, ix: int, iy: int, label: Optional[str] = None):
     vx = self.vertices[ix]
     vy = self.vertices[iy]
+    if vx is None or vy is None:
+      raise Exception("Invalid vertices")
 
     vx.degree += 1
     vy.degree += 1
 
-    self.edges.append(Edge(vx, vy, label, directed=self.directed))
+    edge = Edge(vx, vy, label, directed=self.directed, index=len(self.edges))
+    self.edges.append(edge)
+    index_edge(self.edge_index, self.edge_key(ix, iy), edge)
+    self.incidence[ix].append(edge)
+    if ix != iy:
+      self.incidence[iy].append(edge)
+    self.version += 1
+    if self.disjoint_set is not None:
+      self.disjoint_set.union(ix, iy)
+
+  def add_edges_bulk(
+      self, edges: np.ndarray | Iterable[tuple[int, int] | tuple[int, int, Optional[str]]],
+      labels: Optional[Sequence[Optional[str]]] = None):
+    """Edges are either an (m, 2) array or (ix, iy[, label]) tuples of vertex indices"""
+    if isinstance(edges, np.ndarray):
+      pairs = edges.reshape(-1, 2).astype(np.int64, copy=False)
+    else:
+      found: list[Optional[str]] = []
+      flat: list[int] = []
+      for e in edges:
+        flat.append(e[0])
+        flat.append(e[1])
+        found.append(e[2] if len(e) == 3 else None)
+      pairs = np.array(flat, dtype=np.int64).reshape(-1, 2)
+      if labels is None and any(label is not None for label in found):
+        labels = found
+
+    n = len(self.vertices)
+    if len(pairs) == 0:
+      return
+    if pairs.min() < 0 or pairs.max() >= n:
+      raise Exception("Invalid vertices")
+    if self.dead_vertices and any(self.vertices[i] is None for i in np.unique(pairs).tolist()):
+      raise Exception("Invalid vertices")
+    if labels is not None and len(labels) != len(pairs):
+      raise Exception("Invalid labels")
+
+    # Edges reference no cycles, collections meanwhile would only rescan them
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+      self.insert_edges(pairs, labels)
+    finally:
+      if collecting:
+        gc.enable()
+    self.version += 1
+
+  def insert_edges(self, pairs: np.ndarray, labels: Optional[Sequence[Optional[str]]]):
+    """Appends already validated (m, 2) index pairs
+
+    Incidence entries are grouped per vertex with numpy first, so each list
+    is extended once rather than appended to per edge. Subclasses extend
+    their own storage the same way.
+    """
+    n = len(self.vertices)
+    m = len(pairs)
+    start = len(self.edges)
+    vertices = self.vertices
+    directed = self.directed
+    tails, heads = pairs[:, 0], pairs[:, 1]
+    if not directed:
+      # Same orientation as Edge picks, larger index first
+      tails, heads = np.maximum(tails, heads), np.minimum(tails, heads)
+
+    degrees = np.bincount(pairs.ravel(), minlength=n)
+    for index in np.flatnonzero(degrees).tolist():
+      vertices[index].degree += int(degrees[index])
+
+    added = [
+      Edge(vertices[x], vertices[y], label, directed=directed, index=i)
+      for x, y, label, i in zip(
+        tails.tolist(), heads.tolist(), repeat(None) if labels is None else labels, count(start))]
+    self.edges.extend(added)
+
+    edge_index = self.edge_index
+    setdefault = edge_index.setdefault
+    for key, edge in zip((tails << EDGE_KEY_SHIFT | heads).tolist(), added):
+      if setdefault(key, edge) is not edge:
+        index_edge(edge_index, key, edge)
+
+    # Both ends of every edge, in edge order, a loop only once
+    ends = np.stack((tails, heads), axis=1).ravel()
+    ids = np.repeat(np.arange(m), 2)
+    loops = tails == heads
+    if loops.any():
+      keep = np.ones(2 * m, dtype=bool)
+      keep[1::2] = ~loops
+      ends, ids = ends[keep], ids[keep]
+    indptr, ids, _ = sorted_arcs(n, ends, ids, None, directed=True)
+    extend_rows(self.incidence, indptr, list(map(added.__getitem__, ids.tolist())))
+
+    if self.disjoint_set is not None:
+      self.disjoint_set.union_pairs(tails, heads)
+
+  def add_labeled_edges_bulk(self, edges: np.ndarray, labels: Optional[Sequence[Optional[str]]] = None):
+    """Endpoints are vertex labels, unseen ones are created by first appearance"""
+    flat = edges.ravel()
+    unique, first, inverse = np.unique(flat, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    indices = np.empty(len(order), dtype=np.int64)
+    indices[order] = self.add_vertices_bulk(unique[order].tolist())
+    self.add_edges_bulk(indices[inverse.ravel()], labels)
 
   def remove_edge(self, ix: int, iy: int, label: Optional[str] = None):
-    primitive = (ix, iy, label)
-    edge = list(filter(lambda e: e == primitive, self.edges))
+    edge = self.get_edge(ix, iy, label)
 
-    if len(edge) == 0:
+    if edge is None:
       return
 
-    self.edges.remove(edge[0])
+    self.discard_edge(edge)
+    self.version += 1
 
-    vx = self.vertices[ix]
-    vy = self.vertices[iy]
+  def discard_edge(self, edge: Edge):
+    """Tombstones a live edge, its incidence entries are left for compact()"""
+    unindex_edge(self.edge_index, self.edge_key(edge.tail.index, edge.head.index), edge)
+    self.edges[edge.index] = None
+    self.dead_edges += 1
+
+    edge.tail.degree -= 1
+    edge.head.degree -= 1
+    self.disjoint_set = None
+
+  def get_disjoint_set(self) -> DisjointSet:
+    """Rebuilt from the edge list when a removal made it stale"""
+    if self.disjoint_set is None:
+      disjoint_set = DisjointSet(len(self.vertices))
+      for e in self.live_edges():
+        disjoint_set.union(e.tail.index, e.head.index)
+      self.disjoint_set = disjoint_set
+
+    return self.disjoint_set
 
-    vx.degree -= 1
-    vy.degree -= 1
+  def get_components(self) -> int:
+    """Number of connected components, ignoring edge direction"""
+    return self.get_disjoint_set().count - self.dead_vertices
+
+  def get_component(self, iv: int) -> int:
+    """Representative vertex index of iv's component, until the next change"""
+    return self.get_disjoint_set().find(iv)
+
+  def same_component(self, ix: int, iy: int) -> bool:
+    disjoint_set = self.get_disjoint_set()
+    return disjoint_set.find(ix) == disjoint_set.find(iy)
 
   def get_degree(self, index: int) -> int:
     return self.vertices[index].degree
@@ -70,119 +384,231 @@ class Graph:
     return False
 
   def is_bipartite(self, x: list[int], y: list[int]) -> bool:
-    if set(x).intersection(y):
+    """Whether x and y split the live vertices with no edge inside either"""
+    side = bytearray(len(self.vertices))
+    for mark, subgraph in ((1, x), (2, y)):
+      for v in subgraph:
+        if not self.is_live(v) or side[v]:
+          return False
+        side[v] = mark
+
+    if any(not side[v.index] for v in self.live_vertices()):
       return False
 
-    union = set(x) | set(y)
-    vertices = set(map(lambda n: n.index, self.vertices))
-    if union != vertices:
-      return False
+    return all(side[e.tail.index] != side[e.head.index] for e in self.live_edges())
+
+  def find_bipartition(self) -> tuple[list[int], list[int]] | Walk:
+    """Two-colors every component by breadth-first search in O(V + E)
+
+    Returns both sides as vertex indices, or an odd cycle as a Walk when
+    there are none. Edge directions are ignored, so in a digraph the cycle
+    may step against them.
+    """
+    indptr, indices, edge_ids = self.arcs(undirected=True)
+    n = len(self.vertices)
+    side = bytearray(n)
+    parent = array("i", [-1]) * n
+    parent_edge = array("i", [-1]) * n
+
+    for root in range(n):
+      if side[root] or self.vertices[root] is None:
+        continue
 
-    for subgraph in (x, y):
-      for n, i in enumerate(subgraph):
-        for j in subgraph[n:]:
-          if self.is_neighbor(i, j):
-            return False
+      side[root] = 1
+      queue = [root]
+      for u in queue:
+        for i in range(indptr[u], indptr[u + 1]):
+          v = indices[i]
+          if not side[v]:
+            side[v] = 3 - side[u]
+            parent[v] = u
+            parent_edge[v] = edge_ids[i]
+            queue.append(v)
+          elif side[v] == side[u]:
+            return self.odd_cycle(u, v, edge_ids[i], parent, parent_edge)
+
+    return [v for v in range(n) if side[v] == 1], [v for v in range(n) if side[v] == 2]
+
+  def odd_cycle(self, u: int, v: int, edge: int, parent: array, parent_edge: array) -> Walk:
+    """Closes the two tree paths from u and v to their common ancestor with edge"""
+    up_u = [u]
+    while parent[up_u[-1]] != -1:
+      up_u.append(parent[up_u[-1]])
+    position = {w: k for k, w in enumerate(up_u)}
+
+    up_v = [v]
+    while up_v[-1] not in position:
+      up_v.append(parent[up_v[-1]])
+    up_u = up_u[:position[up_v[-1]] + 1]
+
+    path = up_u + up_v[-2::-1] + [u]
+    edges = [parent_edge[w] for w in up_u[:-1]] + [parent_edge[w] for w in up_v[-2::-1]] + [edge]
+    return Walk.trusted(self, [self.vertices[w] for w in path], [self.edges[e] for e in edges])
+
+  def arcs(self, *, undirected: bool = False) -> tuple[list[int], Sequence[int], Sequence[int]]:
+    """CSR rows of the live arcs with the edge index of each
+
+    Rows list arcs in edge order, as incidence does. Undirected edges, or
+    every edge when undirected is set, give an arc from both ends, loops
+    included.
+    """
+    edges = list(self.live_edges())
+    m = len(edges)
+    indptr, indices, edge_ids = sorted_arcs(
+      len(self.vertices),
+      np.fromiter((e.tail.index for e in edges), dtype=np.int64, count=m),
+      np.fromiter((e.head.index for e in edges), dtype=np.int64, count=m),
+      np.fromiter((e.index for e in edges), dtype=np.int64, count=m),
+      directed=self.directed and not undirected)
+
+    return indptr.tolist(), indices.tolist(), edge_ids.tolist()
+
+  @cached
+  def find_cycle(self) -> Optional[Walk]:
+    """Any cycle as a closed Walk, undirected ones of length 2 need parallel edges"""
+    indptr, indices, edge_ids = self.arcs()
+    n = len(indptr) - 1
+
+    cursor = indptr[:-1]
+    on_path = bytearray(n)
+    visited = bytearray(n)
+
+    for root in range(n):
+      if visited[root]:
+        continue
 
-    return True
+      # Edge taken into each vertex on the path, an undirected search must
+      # not turn back along it but may along a parallel one
+      path = [root]
+      entered = [-1]
+      visited[root] = on_path[root] = 1
+
+      while path:
+        u = path[-1]
+        i = cursor[u]
+        if i == indptr[u + 1]:
+          on_path[path.pop()] = 0
+          entered.pop()
+          continue
+
+        cursor[u] = i + 1
+        v = indices[i]
+        e = edge_ids[i]
+        if not self.directed and e == entered[-1]:
+          continue
+
+        if on_path[v]:
+          k = path.index(v)
+          return Walk(self, path[k:] + [v], entered[k + 1:] + [e])
+
+        if not visited[v]:
+          visited[v] = on_path[v] = 1
+          path.append(v)
+          entered.append(e)
+
+    return None
+
+  def kahn(self) -> tuple[list[int], list[int]]:
+    if not self.directed:
+      raise Exception("Not a digraph")
+
+    indptr, indices, edge_ids = self.arcs()
+    order, starts = topological_levels(indptr, indices)
+    if len(order) < len(indptr) - 1:
+      raise CycleError(Walk(self, *blocked_cycle(indptr, indices, edge_ids, order)))
+
+    return order, starts
+
+  @cached
+  def topological_sort(self) -> list[Vertex]:
+    """Sources first, raises CycleError with a witness cycle if there is none
+
+    Removed slots have no arcs, so kahn() orders them like isolated
+    vertices and they are only dropped here.
+    """
+    order, _ = self.kahn()
+    vertices = self.vertices
+    return [vertices[u] for u in order if vertices[u] is not None]
+
+  @cached
+  def topological_levels(self) -> list[list[Vertex]]:
+    """Antichains in dependency order, each level only needs earlier ones"""
+    order, starts = self.kahn()
+    vertices = self.vertices
+    levels = ([vertices[u] for u in order[i:j] if vertices[u] is not None] for i, j in zip(starts, starts[1:]))
+    return [level for level in levels if level]
+
+  @cached
+  def depth_first_search(self):
+    """Every edge classified in O(V + E), see depth_first_arrays()"""
+    indptr, indices, edge_ids = self.arcs()
+    edges = self.edges
+    report = depth_first_arrays(
+      indptr, indices, edge_ids, len(edges), (u for u in range(len(indptr) - 1) if self.is_live(u)),
+      directed=self.directed)
+
+    return classified_edges(report, edges)
 
   def validate_vertices(self, vertices: list[int]) -> bool:
     if len(set(vertices)) != len(vertices):
       return False
 
-    return all(v in self.vertices for v in vertices)
+    return all(isinstance(v, (int, np.integer)) and self.is_live(v) for v in vertices)
 
   def validate_edges(self, edges: list[tuple[int, int, Optional[str]]]) -> bool:
     if len(set(edges)) != len(edges):
       return False
 
-    return all(e in self.edges for e in edges)
-
-  def subtract_vertices(self, vertices: list[int]) -> Graph | None:
-    if not self.validate_vertices(vertices):
-      return None
-
-    g = type(self)()
-    equivalent_vertices = []
+    return all(self.get_edge(*e) is not None for e in edges)
 
-    for v in self.vertices:
-      if v not in vertices:
-        g.create_vertex(v.label)
-        equivalent_vertices.append((v.index, g.vertices[-1].index))
+  def match_edges(self, edges: Iterable[Edge | tuple[int, int] | tuple[int, int, Optional[str]]]) -> Iterator[Edge]:
+    """Live edges given as objects or (ix, iy[, label]), every parallel match included"""
+    for e in edges:
+      if isinstance(e, Edge):
+        if 0 <= e.index < len(self.edges) and self.edges[e.index] is e:
+          yield e
+        continue
 
-    for e in self.edges:
-      edge = []
+      label = e[2] if len(e) == 3 else None
+      for edge in indexed_edges(self.edge_index.get(self.edge_key(e[0], e[1]))):
+        if self.edges[edge.index] is edge and (label is None or edge.label == label):
+          yield edge
 
-      for old, new in equivalent_vertices:
-        if old in e.ends:
-          edge.append(new)
+  def view(
+      self, vertices: Optional[Iterable[int]] = None,
+      edges: Optional[Iterable[Edge | tuple]] = None) -> SubgraphView:
+    """Copy-free subgraph, see SubgraphView.create"""
+    from lib.subgraph_view import SubgraphView
+    return SubgraphView.create(self, vertices, edges)
 
-      if len(edge) == 2:
-        g.create_edge(*edge, e.label)
+  def subtract_vertices(self, vertices: list[int]) -> Graph | None:
+    if not self.validate_vertices(vertices):
+      return None
 
-    return g
+    removed = set(vertices)
+    return self.view([v.index for v in self.live_vertices() if v.index not in removed]).materialize()
 
   def subtract_edges(
       self, edges: list[tuple[int, int, Optional[str]]]) -> Graph | None:
     if not self.validate_edges(edges):
       return None
 
-    g = deepcopy(self)
-
-    for e in edges:
-      g.remove_edge(*e)
-
-    return g
+    removed = {self.get_edge(*e).index for e in edges}
+    kept = [e for e in self.live_edges() if e.index not in removed]
+    return self.view([v.index for v in self.live_vertices()], kept).materialize()
 
   def create_induced_subgraph(self, vertices: list[int]) -> Graph | None:
     if not self.validate_vertices(vertices):
       return None
 
-    g = type(self)()
-    equivalent_vertices = []
-
-    for v in self.vertices:
-      if v in vertices:
-        g.create_vertex(v.label)
-        equivalent_vertices.append((v.index, g.vertices[-1].index))
-
-    for e in self.edges:
-      edge = []
-
-      for old, new in equivalent_vertices:
-        if old in e.ends:
-          edge.append(new)
-
-      if len(edge) == 2:
-        g.create_edge(*edge, e.label)
-
-    return g
+    return self.view(vertices).materialize()
 
   def create_edge_induced_subgraph(
       self, edges: list[tuple[int, int, Optional[str]]]) -> Graph | None:
     if not self.validate_edges(edges):
       return None
 
-    g = type(self)()
-    equivalent_vertices = []
-
-    for e in self.edges:
-      if e not in edges:
-        continue
-
-      for v in e.ends:
-        if not any(old == v for old, _ in equivalent_vertices):
-          g.create_vertex(v.label)
-          equivalent_vertices.append((v.index, g.vertices[-1].index))
-
-      edge = []
-      for old, new in equivalent_vertices:
-        if old in e.ends:
-          edge.append(new)
-
-      g.create_edge(*edge, e.label)
-
-    return g
+    return self.view(edges=edges).materialize()
 
   def create_subgraph(
       self, vertices: list[int],
@@ -190,46 +616,48 @@ class Graph:
     if not (self.validate_vertices(vertices) and self.validate_edges(edges)):
       return None
 
-    g = type(self)()
-    equivalent_vertices = []
+    return self.view(vertices, edges).materialize()
 
-    for v in self.vertices:
-      if v in vertices:
-        g.create_vertex(v.label)
-        equivalent_vertices.append((v.index, g.vertices[-1].index))
-
-    for e in edges:
-      edge = []
+  def dfs(self):
+    return
 
-      for old, new in equivalent_vertices:
-        if old in e:
-          edge.append(new)
+  @staticmethod
+  def from_edges(
+      edges: np.ndarray | Iterable[tuple[Any, Any] | tuple[Any, Any, Optional[str]]], *,
+      graph_type: type[Graph], directed: bool = False,
+      labels: Optional[Sequence[Optional[str]]] = None) -> Graph:
+    """Edges hold vertex labels, vertices are numbered by first appearance"""
+    g = graph_type(directed=directed)
 
-      if len(edge) == 2:
-        label = e[2] if len(e) == 3 else None
-        g.create_edge(*edge, label)
+    if isinstance(edges, np.ndarray):
+      g.add_labeled_edges_bulk(edges, labels)
+      return g
 
+    index: dict[Any, int] = {}
+    flat: list[int] = []
+    found: list[Optional[str]] = []
+    for e in edges:
+      flat.append(index.setdefault(e[0], len(index)))
+      flat.append(index.setdefault(e[1], len(index)))
+      found.append(e[2] if len(e) == 3 else None)
+    if labels is None and any(label is not None for label in found):
+      labels = found
+
+    g.add_vertices_bulk(index)
+    g.add_edges_bulk(np.array(flat, dtype=np.int64).reshape(-1, 2), labels)
     return g
 
-  def dfs(self):
-    return
-
   @staticmethod
   def create_empty_graph(n: int, *, graph_type: type[Graph], directed: bool = False) -> Graph:
     g = graph_type(directed=directed)
-
-    for i in range(n):
-      g.create_vertex(f"v{i + 1}")
+    g.add_vertices_bulk(f"v{i + 1}" for i in range(n))
 
     return g
 
   @staticmethod
   def create_complete_graph(n: int, *, graph_type: type[Graph]) -> Graph:
-    kn = Graph.create_empty_graph(n, graph_type)
-
-    for i in range(n):
-      for j in range(i + 1, n):
-        kn.create_edge(i, j)
+    kn = Graph.create_empty_graph(n, graph_type=graph_type)
+    kn.add_edges_bulk(np.stack(np.triu_indices(n, 1), axis=1))
 
     return kn
 
@@ -238,21 +666,60 @@ class Graph:
     if (n * k) % 2:
       return None
 
-    g = Graph.create_empty_graph(n, graph_type)
-    for d in range(k):
-      for i in range(d % 2, n, 2):
-        g.create_edge(i, (i + 1) % n)
+    g = Graph.create_empty_graph(n, graph_type=graph_type)
+    tails = np.concatenate([np.arange(d % 2, n, 2, dtype=np.int64) for d in range(k)] or [np.zeros(0, dtype=np.int64)])
+    g.add_edges_bulk(np.stack((tails, (tails + 1) % n), axis=1))
+
+    return g
+
+  @staticmethod
+  def create_gnp_graph(
+      n: int, p: float, *, graph_type: type[Graph], directed: bool = False,
+      seed: Optional[int | np.random.Generator] = None) -> Graph:
+    """Erdős–Rényi graph keeping each loop-free pair with probability p"""
+    g = Graph.create_empty_graph(n, graph_type=graph_type, directed=directed)
+    g.add_edges_bulk(gnp_edges(n, p, directed=directed, seed=seed))
+
+    return g
+
+  @staticmethod
+  def create_gnm_graph(
+      n: int, m: int, *, graph_type: type[Graph], directed: bool = False,
+      seed: Optional[int | np.random.Generator] = None) -> Graph:
+    """Erdős–Rényi graph with m distinct loop-free edges"""
+    g = Graph.create_empty_graph(n, graph_type=graph_type, directed=directed)
+    g.add_edges_bulk(gnm_edges(n, m, directed=directed, seed=seed))
+
+    return g
+
+  @staticmethod
+  def create_barabasi_albert_graph(
+      n: int, k: int, *, graph_type: type[Graph], directed: bool = False,
+      seed: Optional[int | np.random.Generator] = None) -> Graph:
+    """Preferential attachment graph, arcs point from new vertices to old ones"""
+    g = Graph.create_empty_graph(n, graph_type=graph_type, directed=directed)
+    g.add_edges_bulk(barabasi_albert_edges(n, k, seed=seed))
+
+    return g
+
+  @staticmethod
+  def create_rmat_graph(
+      scale: int, m: int, *, graph_type: type[Graph], directed: bool = False,
+      seed: Optional[int | np.random.Generator] = None, **probabilities: float) -> Graph:
+    """R-MAT graph on 2 ** scale vertices, probabilities being a, b and c"""
+    g = Graph.create_empty_graph(1 << scale, graph_type=graph_type, directed=directed)
+    g.add_edges_bulk(rmat_edges(scale, m, seed=seed, **probabilities))
 
     return g
 
   def __str__(self):
-    edges_list = [str(e) for e in self.edges]
-    vertices = [tuple(v) for v in self.vertices]
-    total_degree = sum([v.degree for v in self.vertices])
-    odd_degree_vertices = len([v for v in self.vertices if v.degree % 2])
-    even_degree_vertices = len(self.vertices) - odd_degree_vertices
+    edges_list = [str(e) for e in self.live_edges()]
+    vertices = [(v.label, self.get_degree(v.index)) for v in self.live_vertices()]
+    total_degree = sum(degree for _, degree in vertices)
+    odd_degree_vertices = len([degree for _, degree in vertices if degree % 2])
+    even_degree_vertices = self.vertex_count() - odd_degree_vertices
 
-    return f"Number of vertices: {len(self.vertices)}\n" + \
+    return f"Number of vertices: {self.vertex_count()}\n" + \
            f"Vertices (label, degree): {vertices}\n" + \
            f"Odd Degree Vertices: {odd_degree_vertices}\n" + \
            f"Even Degree Vertices: {even_degree_vertices}\n" + \
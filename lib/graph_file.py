@@ -0,0 +1,115 @@
+from __future__ import annotations
+from typing import Iterator, Optional, Sequence
+import struct
+import numpy as np
+
+
+MAGIC = b"GVCSR\0\0\0"
+VERSION = 1
+
+DIRECTED = 1
+INT_VERTEX_LABELS = 2
+EDGE_LABELS = 4
+
+SECTIONS = (
+  ("indptr", np.int64),
+  ("indices", np.int64),
+  ("edge_ids", np.int64),
+  ("degrees", np.int64),
+  ("edge_tails", np.int64),
+  ("edge_heads", np.int64),
+  ("vertex_labels", np.int64),
+  ("vertex_label_offsets", np.int64),
+  ("vertex_label_data", np.uint8),
+  ("edge_label_mask", np.uint8),
+  ("edge_label_offsets", np.int64),
+  ("edge_label_data", np.uint8),
+)
+
+# magic, version, flags, vertices, edges, then (offset, count) per section
+HEADER = struct.Struct("<8sIIQQ" + "QQ" * len(SECTIONS))
+
+
+class LabelTable(Sequence):
+  """UTF-8 strings packed into an offsets array and a byte blob"""
+
+  def __init__(self, offsets: np.ndarray, data: np.ndarray, mask: Optional[np.ndarray] = None):
+    self.offsets = offsets
+    self.data = data
+    self.mask = mask
+
+  @staticmethod
+  def pack(labels: Sequence[Optional[str]]) -> LabelTable:
+    encoded = [b"" if label is None else str(label).encode() for label in labels]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    mask = np.fromiter((label is not None for label in labels), dtype=np.uint8, count=len(encoded))
+    return LabelTable(offsets, data, mask)
+
+  def __len__(self) -> int:
+    return len(self.offsets) - 1
+
+  def __getitem__(self, i: int) -> Optional[str]:
+    if self.mask is not None and not self.mask[i]:
+      return None
+
+    return self.data[self.offsets[i]:self.offsets[i + 1]].tobytes().decode()
+
+  def __iter__(self) -> Iterator[Optional[str]]:
+    blob = self.data.tobytes()
+    offsets = self.offsets.tolist()
+    mask = self.mask.tolist() if self.mask is not None else [1] * len(self)
+
+    for i, present in enumerate(mask):
+      yield blob[offsets[i]:offsets[i + 1]].decode() if present else None
+
+
+def write_graph_file(path: str, sections: dict[str, np.ndarray], *, directed: bool, vertices: int, edges: int):
+  flags = 0
+  if directed:
+    flags |= DIRECTED
+  if sections.get("vertex_labels") is not None:
+    flags |= INT_VERTEX_LABELS
+  if sections.get("edge_label_mask") is not None:
+    flags |= EDGE_LABELS
+
+  arrays = []
+  table = []
+  offset = HEADER.size
+  for name, dtype in SECTIONS:
+    array = sections.get(name)
+    array = np.zeros(0, dtype=dtype) if array is None else np.ascontiguousarray(array, dtype=dtype)
+    offset += -offset % 8
+    arrays.append((offset, array))
+    table.extend((offset, len(array)))
+    offset += array.nbytes
+
+  with open(path, "wb") as f:
+    f.write(HEADER.pack(MAGIC, VERSION, flags, vertices, edges, *table))
+    for offset, array in arrays:
+      f.write(b"\0" * (offset - f.tell()))
+      f.write(array.tobytes())
+
+
+def read_graph_file(path: str) -> tuple[int, dict[str, np.ndarray]]:
+  """Returns the header flags and every section mapped read-only"""
+  with open(path, "rb") as f:
+    header = HEADER.unpack(f.read(HEADER.size))
+
+  magic, version, flags = header[:3]
+  if magic != MAGIC:
+    raise Exception("Not a graph file")
+  if version != VERSION:
+    raise Exception(f"Unsupported graph file version {version}")
+
+  table = header[5:]
+  sections = {}
+  for i, (name, dtype) in enumerate(SECTIONS):
+    offset, count = table[2 * i], table[2 * i + 1]
+    if count == 0:
+      sections[name] = np.zeros(0, dtype=dtype)
+    else:
+      sections[name] = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+
+  return flags, sections
@@ -0,0 +1,159 @@
+from __future__ import annotations
+from multiprocessing import Pool, shared_memory
+import numpy as np
+from lib.graph import sorted_arcs
+
+
+# Below this many arcs a pool costs more than sequential Tarjan saves
+PARALLEL_THRESHOLD = 1 << 20
+
+# Arrays each worker maps from shared memory, set up by attach()
+SHARED: dict[str, np.ndarray] = {}
+SEGMENTS: list[shared_memory.SharedMemory] = []
+
+
+def attach(specs: dict[str, tuple[str, str, int]]):
+  for name, (segment, dtype, length) in specs.items():
+    shm = shared_memory.SharedMemory(name=segment)
+    SEGMENTS.append(shm)
+    SHARED[name] = np.ndarray((length,), dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def row_reduce(ufunc: np.ufunc, indptr: np.ndarray, values: np.ndarray, default) -> np.ndarray:
+  """ufunc folded over each CSR row of values, default for empty rows"""
+  counts = np.diff(indptr)
+  result = np.full(len(counts), default, dtype=values.dtype)
+  nonempty = counts > 0
+  if nonempty.any():
+    result[nonempty] = ufunc.reduceat(values, (indptr[:-1] - indptr[0])[nonempty])
+  return result
+
+
+def color_step(lo: int, hi: int) -> int:
+  """Pulls the largest color among live predecessors into vertices lo..hi"""
+  rindptr, rindices = SHARED["rindptr"], SHARED["rindices"]
+  color, alive, following = SHARED["color"], SHARED["alive"], SHARED["following"]
+
+  tails = rindices[rindptr[lo]:rindptr[hi]]
+  incoming = np.where(alive[tails], color[tails], -1)
+  pulled = np.maximum(color[lo:hi], row_reduce(np.maximum, rindptr[lo:hi + 1], incoming, -1))
+  pulled = np.where(alive[lo:hi], pulled, color[lo:hi])
+
+  following[lo:hi] = pulled
+  return int((pulled != color[lo:hi]).sum())
+
+
+def mark_step(lo: int, hi: int) -> int:
+  """Marks vertices lo..hi with a marked successor of their own color"""
+  indptr, indices = SHARED["indptr"], SHARED["indices"]
+  color, alive, mark, following = SHARED["color"], SHARED["alive"], SHARED["mark"], SHARED["following"]
+
+  heads = indices[indptr[lo]:indptr[hi]]
+  own = np.repeat(color[lo:hi], np.diff(indptr[lo:hi + 1]))
+  reaching = (mark[heads] & (color[heads] == own)).astype(np.uint8)
+  marked = mark[lo:hi] | (alive[lo:hi] & row_reduce(np.maximum, indptr[lo:hi + 1], reaching, 0).astype(bool))
+
+  following[lo:hi] = marked
+  return int((marked != mark[lo:hi]).sum())
+
+
+def reverse_rows(indptr: np.ndarray, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+  n = len(indptr) - 1
+  tails = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+  rindptr, rindices, _ = sorted_arcs(n, indices, tails, None, directed=True)
+  return rindptr, rindices
+
+
+def peel(indptr: np.ndarray, indices: np.ndarray, alive: np.ndarray) -> np.ndarray:
+  """Repeatedly drops live vertices without live predecessors, returns them"""
+  n = len(indptr) - 1
+  tails = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+  live_arcs = alive[tails] & alive[indices] & (tails != indices)
+  remaining = np.bincount(indices[live_arcs], minlength=n)
+
+  peeled = []
+  frontier = np.flatnonzero(alive & (remaining == 0))
+  while frontier.size:
+    alive[frontier] = False
+    peeled.append(frontier)
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    heads = indices[np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(int(counts.sum()))]
+    heads = heads[alive[heads]]
+    remaining -= np.bincount(heads, minlength=n)
+    frontier = np.unique(heads[remaining[heads] == 0])
+
+  return np.concatenate(peeled) if peeled else np.zeros(0, dtype=np.int64)
+
+
+def parallel_component_labels(indptr: np.ndarray, indices: np.ndarray, workers: int) -> np.ndarray:
+  """Representative vertex of every vertex's strongly connected component
+
+  Sources and sinks are peeled off first. The rest is split by coloring:
+  the largest vertex id is pushed forward until stable, then each color's
+  own vertex marks backwards, inside its color, the component it heads.
+  Every round scans balanced vertex ranges in a process pool over shared
+  memory. Rounds grow with the graph's diameter, as usual for coloring.
+  """
+  n = len(indptr) - 1
+  rindptr, rindices = reverse_rows(indptr, indices)
+  arrays = {
+    "indptr": np.asarray(indptr, dtype=np.int64),
+    "indices": np.asarray(indices, dtype=np.int64),
+    "rindptr": rindptr,
+    "rindices": rindices,
+    "color": np.zeros(n, dtype=np.int64),
+    "following": np.zeros(n, dtype=np.int64),
+    "alive": np.ones(n, dtype=bool),
+    "mark": np.zeros(n, dtype=bool),
+  }
+  segments = {}
+  shared = {}
+  try:
+    for name, array in arrays.items():
+      shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+      segments[name] = shm
+      shared[name] = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+      shared[name][:] = array
+
+    specs = {name: (shm.name, shared[name].dtype.str, len(shared[name])) for name, shm in segments.items()}
+    bounds = np.searchsorted(shared["indptr"], np.linspace(0, len(indices), 4 * workers + 1)).tolist()
+    bounds[0], bounds[-1] = 0, n
+    ranges = [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+
+    with Pool(workers, initializer=attach, initargs=(specs,)) as pool:
+      return color_and_mark(pool, shared, ranges)
+  finally:
+    shared.clear()
+    for shm in segments.values():
+      shm.close()
+      shm.unlink()
+
+
+def color_and_mark(pool: Pool, shared: dict[str, np.ndarray], ranges: list[tuple[int, int]]) -> np.ndarray:
+  n = len(shared["color"])
+  ids = np.arange(n, dtype=np.int64)
+  alive, color, following = shared["alive"], shared["color"], shared["following"]
+  labels = np.full(n, -1, dtype=np.int64)
+
+  while True:
+    for trimmed in (peel(shared["indptr"], shared["indices"], alive), peel(shared["rindptr"], shared["rindices"], alive)):
+      labels[trimmed] = trimmed
+    if not alive.any():
+      return labels
+
+    color[:] = ids
+    while sum(pool.starmap(color_step, ranges)):
+      color[:] = following
+
+    # Marks come back through the int "following" array as 0/1
+    mark = shared["mark"]
+    mark[:] = alive & (color == ids)
+    while True:
+      changed = sum(pool.starmap(mark_step, ranges))
+      mark[:] = following.astype(bool)
+      if not changed:
+        break
+
+    labels[mark] = color[mark]
+    alive &= ~mark
@@ -0,0 +1,171 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterator
+import re
+import warnings
+import numpy as np
+
+
+if TYPE_CHECKING:
+  from lib.graph import Graph
+
+
+CHUNK_SIZE = 1 << 24
+NON_NUMERIC = np.ones(256, dtype=bool)
+NON_NUMERIC[list(b"0123456789+-.eE \t\r\n")] = False
+# First characters of the comment and header lines the formats allow
+SKIPPED_PREFIXES = (b"#", b"%", b"c", b"p")
+DIMACS_PROBLEM = re.compile(rb"^p\s+(\S+)\s+(\d+)\s+(\d+)", re.MULTILINE)
+
+
+def read_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+  """Yields large blocks of the file, each ending on a line boundary"""
+  with open(path, "rb") as f:
+    rest = b""
+    while True:
+      block = f.read(chunk_size)
+      if not block:
+        if rest:
+          yield rest + b"\n"
+        return
+
+      block = rest + block
+      cut = block.rfind(b"\n") + 1
+      rest = block[cut:]
+      if cut:
+        yield block[:cut]
+
+
+def numeric_lines(chunk: bytes, prefix: bytes = b"") -> bytes:
+  """Keeps only the lines made of numbers after prefix, with prefix removed
+
+  Comment and header lines are dropped, any other line that is not all
+  numbers raises ValueError.
+  """
+  body = (b"\n" + chunk).replace(b"\n" + prefix, b"\n") if prefix else chunk
+  bad = np.flatnonzero(NON_NUMERIC[np.frombuffer(body, dtype=np.uint8)])
+  if len(bad) == 0:
+    return body
+
+  # Cut out the few lines holding comments or headers
+  pieces = []
+  position = 0
+  for i in bad.tolist():
+    if i < position:
+      continue
+    start = body.rfind(b"\n", 0, i) + 1
+    end = body.find(b"\n", i)
+    line = body[start:len(body) if end == -1 else end]
+    if line.lstrip(b" \t")[:1] not in SKIPPED_PREFIXES:
+      raise ValueError(f"Malformed line {line.decode(errors='replace')!r}")
+    pieces.append(body[position:start])
+    position = len(body) if end == -1 else end + 1
+  pieces.append(body[position:])
+
+  return b"".join(pieces)
+
+
+def parse_numbers(text: bytes, dtype: type = np.int64) -> np.ndarray:
+  if not text or text.isspace():
+    return np.zeros(0, dtype=dtype)
+
+  with warnings.catch_warnings():
+    warnings.simplefilter("error")
+    try:
+      return np.fromstring(text, dtype=dtype, sep=" ")
+    except DeprecationWarning:
+      raise ValueError("Malformed numeric data") from None
+
+
+def iter_edge_list(path: str, *, columns: int = 2, chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+  """Yields (k, columns) arrays from a whitespace separated edge list (SNAP style)"""
+  for chunk in read_chunks(path, chunk_size):
+    numbers = parse_numbers(numeric_lines(chunk), np.int64 if columns == 2 else np.float64)
+    if len(numbers) % columns:
+      raise Exception(f"Edge list rows must have {columns} columns")
+    yield numbers.reshape(-1, columns)
+
+
+def read_edge_list(
+    path: str, *, graph_type: type[Graph], directed: bool = False,
+    weighted: bool = False, chunk_size: int = CHUNK_SIZE) -> Graph:
+  """Vertex ids become labels; a third column, when weighted, becomes the edge label"""
+  g = graph_type(directed=directed)
+
+  for rows in iter_edge_list(path, columns=3 if weighted else 2, chunk_size=chunk_size):
+    if not weighted:
+      g.add_labeled_edges_bulk(rows)
+      continue
+
+    weights = rows[:, 2]
+    labels = weights.astype(np.int64) if (weights == np.round(weights)).all() else weights
+    g.add_labeled_edges_bulk(rows[:, :2].astype(np.int64), labels.tolist())
+
+  return g
+
+
+def read_dimacs_graph(path: str, *, graph_type: type[Graph], chunk_size: int = CHUNK_SIZE) -> Graph:
+  """Reads 'p edge' files as undirected graphs and 'p sp' arc files as digraphs
+
+  Vertices are labeled 1..n; arc weights become edge labels.
+  """
+  g = None
+  header = b""
+
+  for chunk in read_chunks(path, chunk_size):
+    if g is None:
+      header += chunk
+      problem = DIMACS_PROBLEM.search(header)
+      if problem is None:
+        continue
+
+      g = graph_type(directed=problem.group(1) == b"sp")
+      g.add_vertices_bulk(range(1, int(problem.group(2)) + 1))
+      chunk, header = header, b""
+
+    if g.directed:
+      rows = parse_numbers(numeric_lines(chunk, b"a "), np.int64).reshape(-1, 3)
+      g.add_edges_bulk(rows[:, :2] - 1, rows[:, 2].tolist())
+    else:
+      rows = parse_numbers(numeric_lines(chunk, b"e "), np.int64).reshape(-1, 2)
+      g.add_edges_bulk(rows - 1)
+
+  if g is None:
+    raise Exception("Missing DIMACS problem line")
+
+  return g
+
+
+def iter_dimacs_cnf(path: str, *, chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+  """Yields (k, 2) arrays of literals from a 2-CNF DIMACS file
+
+  Unit clauses are widened to (x ∨ x).
+  """
+  carry = np.zeros(0, dtype=np.int64)
+
+  for chunk in read_chunks(path, chunk_size):
+    numbers = np.concatenate((carry, parse_numbers(numeric_lines(chunk), np.int64)))
+    zeros = np.flatnonzero(numbers == 0)
+    if len(zeros) == 0:
+      carry = numbers
+      continue
+
+    carry = numbers[zeros[-1] + 1:]
+    starts = np.concatenate(([0], zeros[:-1] + 1))
+    lengths = zeros - starts
+    if (lengths > 2).any() or (lengths < 1).any():
+      raise Exception("Not a 2-CNF formula")
+
+    first = numbers[starts]
+    second = np.where(lengths == 2, numbers[starts + 1], first)
+    yield np.stack((first, second), axis=1)
+
+  if len(carry):
+    raise Exception("Unterminated clause")
+
+
+def read_dimacs_cnf(path: str, *, chunk_size: int = CHUNK_SIZE) -> np.ndarray:
+  chunks = list(iter_dimacs_cnf(path, chunk_size=chunk_size))
+  if not chunks:
+    return np.zeros((0, 2), dtype=np.int64)
+
+  return np.concatenate(chunks)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+from array import array
+from collections import OrderedDict
+from copy import copy
+from functools import wraps
+from typing import Any, Callable, Hashable
+import numpy as np
+
+
+MUTABLE_LEAVES = (array, bytearray, np.ndarray)
+
+
+def detached(result: Any) -> Any:
+  """Copies the containers of a result, Vertex, Edge and graph objects stay shared
+
+  Lists are taken to be homogeneous, so one of plain objects is a flat copy.
+  """
+  if isinstance(result, list):
+    if result and isinstance(result[0], (list, tuple, dict) + MUTABLE_LEAVES):
+      return [detached(item) for item in result]
+    return result.copy()
+  if isinstance(result, tuple):
+    return tuple(detached(item) for item in result)
+  if isinstance(result, dict):
+    return {key: detached(value) for key, value in result.items()}
+  if isinstance(result, MUTABLE_LEAVES):
+    return copy(result)
+
+  return result
+
+
+class ResultCache:
+  """LRU table of algorithm results tagged with the graph version they saw
+
+  Entries from older versions can never hit again, so they are dropped as
+  soon as the version moves on. Callers get their own copy of the lists,
+  dicts and arrays of a result, so mutating one never reaches the entry.
+  """
+
+  def __init__(self, maxsize: int = 64):
+    self.maxsize = maxsize
+    self.version = 0
+    self.entries: OrderedDict[Hashable, Any] = OrderedDict()
+    self.hits = 0
+    self.misses = 0
+
+  def lookup(self, key: Hashable, version: int, compute: Callable[[], Any]) -> Any:
+    if version != self.version:
+      self.entries.clear()
+      self.version = version
+
+    if key in self.entries:
+      self.hits += 1
+      self.entries.move_to_end(key)
+      return detached(self.entries[key])
+
+    self.misses += 1
+    result = compute()
+    if self.maxsize > 0:
+      self.entries[key] = result
+      while len(self.entries) > self.maxsize:
+        self.entries.popitem(last=False)
+
+    return detached(result) if self.maxsize > 0 else result
+
+  def clear(self):
+    self.entries.clear()
+    self.hits = 0
+    self.misses = 0
+
+
+def cached(method: Callable) -> Callable:
+  """Memoizes a Graph method on (name, args, graph.version)"""
+
+  @wraps(method)
+  def wrapper(self, *args, **kwargs):
+    key = (method.__name__, args, tuple(sorted(kwargs.items())))
+    try:
+      hash(key)
+    except TypeError:
+      return method(self, *args, **kwargs)
+
+    return self.cache.lookup(key, self.version, lambda: method(self, *args, **kwargs))
+
+  return wrapper
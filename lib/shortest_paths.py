@@ -0,0 +1,249 @@
+from __future__ import annotations
+from array import array
+from typing import TYPE_CHECKING, Optional, Sequence
+import heapq
+import numpy as np
+from lib.csr_graph import CSRGraph
+from lib.graph import sorted_arcs
+from lib.walk import Walk
+
+
+if TYPE_CHECKING:
+  from lib.graph import Graph
+
+
+class ShortestPaths:
+  """Point-to-point shortest path queries over a snapshot of a graph
+
+  Distance and parent tables are allocated once and stamped with a query
+  generation, so an entry only counts when its stamp matches the current
+  query and nothing is reset between calls. Weights are given per edge
+  index, defaulting to the numeric edge labels (1 where unlabeled).
+  Mutating the graph afterwards requires a new instance. Queries and walks
+  use the graph's own indices, even when its snapshot skips removed slots.
+  """
+
+  def __init__(self, graph: Graph, weights: Optional[Sequence[float]] = None):
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.freeze(graph)
+    n = len(csr.indptr) - 1
+
+    self.graph = graph
+    self.position = None if csr.vertex_position is None else csr.vertex_position.tolist()
+    self.vertex_origin = None if csr.vertex_origin is None else csr.vertex_origin.tolist()
+    self.edge_origin = None if csr.edge_origin is None else csr.edge_origin.tolist()
+    self.cost = 0.0
+    self.generation = 0
+    self.stamp = (array("i", [0]) * n, array("i", [0]) * n)
+    self.distance = ([0.0] * n, [0.0] * n)
+    self.parent = (array("i", [0]) * n, array("i", [0]) * n)
+    self.via = (array("i", [-1]) * n, array("i", [-1]) * n)
+
+    if weights is None:
+      labels = csr.edge_labels
+      try:
+        weights = [1.0] * len(csr.edge_tails) if labels is None else [
+          1.0 if label is None else float(label) for label in labels]
+      except ValueError:
+        raise Exception("Edge labels are not numeric") from None
+
+    weights = np.asarray(weights, dtype=np.float64)
+    if len(weights) != len(csr.edge_tails):
+      raise Exception("Expected one weight per edge")
+    if (weights < 0).any():
+      raise Exception("Negative edge weight")
+
+    forward = (csr.indptr, csr.indices, weights[csr.edge_ids], csr.edge_ids)
+    if csr.directed:
+      tails = np.repeat(np.arange(n, dtype=np.int64), np.diff(csr.indptr))
+      indptr, heads, arcs = sorted_arcs(
+        n, csr.indices, tails, np.arange(len(tails), dtype=np.int64), directed=True)
+      backward = (indptr, heads, forward[2][arcs], csr.edge_ids[arcs])
+    else:
+      backward = forward
+
+    self.arcs = tuple(tuple(a.tolist() for a in side) for side in (forward, backward))
+
+  def start(self, *sources: int) -> int:
+    self.generation += 1
+    for side, source in enumerate(sources):
+      self.stamp[side][source] = self.generation
+      self.distance[side][source] = 0.0
+      self.parent[side][source] = source
+    return self.generation
+
+  def trace(self, side: int, v: int) -> tuple[list[int], list[int]]:
+    """Vertices back from v to the side's source, and the edge of each step"""
+    parent, via = self.parent[side], self.via[side]
+    path = [v]
+    edges = []
+    while parent[path[-1]] != path[-1]:
+      edges.append(via[path[-1]])
+      path.append(parent[path[-1]])
+    return path, edges
+
+  def walk(self, meeting: int, bidirectional: bool = False) -> Walk:
+    """Steps keep the edge they were relaxed through, parallel edges included"""
+    path, edges = self.trace(0, meeting)
+    path.reverse()
+    edges.reverse()
+    if bidirectional:
+      back_path, back_edges = self.trace(1, meeting)
+      path.extend(back_path[1:])
+      edges.extend(back_edges)
+    if self.vertex_origin is not None:
+      path = [self.vertex_origin[v] for v in path]
+    if self.edge_origin is not None:
+      edges = [self.edge_origin[e] for e in edges]
+    return Walk(self.graph, path, edges)
+
+  def validate(self, source: int, destination: int) -> tuple[int, int]:
+    """Snapshot indices of both ends"""
+    if self.position is not None:
+      n = len(self.position)
+      if not (0 <= source < n and 0 <= destination < n):
+        raise Exception("Invalid vertices")
+      source, destination = self.position[source], self.position[destination]
+
+    n = len(self.stamp[0])
+    if not (0 <= source < n and 0 <= destination < n):
+      raise Exception("Invalid vertices")
+
+    return source, destination
+
+  def bfs(self, source: int, destination: int) -> Optional[Walk]:
+    """Fewest edges from source to destination, ignoring weights"""
+    source, destination = self.validate(source, destination)
+    generation = self.start(source)
+    indptr, indices, _, edge_ids = self.arcs[0]
+    stamp, distance, parent, via = self.stamp[0], self.distance[0], self.parent[0], self.via[0]
+
+    frontier = [source]
+    while frontier and stamp[destination] != generation:
+      grown = []
+      for u in frontier:
+        for i in range(indptr[u], indptr[u + 1]):
+          v = indices[i]
+          if stamp[v] != generation:
+            stamp[v] = generation
+            distance[v] = distance[u] + 1
+            parent[v] = u
+            via[v] = edge_ids[i]
+            grown.append(v)
+      frontier = grown
+
+    if stamp[destination] != generation:
+      return None
+
+    self.cost = distance[destination]
+    return self.walk(destination)
+
+  def dijkstra(self, source: int, destination: int) -> Optional[Walk]:
+    """Lightest walk from source to destination using a binary heap"""
+    source, destination = self.validate(source, destination)
+    generation = self.start(source)
+    indptr, indices, weights, edge_ids = self.arcs[0]
+    stamp, distance, parent, via = self.stamp[0], self.distance[0], self.parent[0], self.via[0]
+
+    heap = [(0.0, source)]
+    while heap:
+      d, u = heapq.heappop(heap)
+      if d > distance[u]:
+        continue
+      if u == destination:
+        self.cost = d
+        return self.walk(destination)
+
+      for i in range(indptr[u], indptr[u + 1]):
+        v = indices[i]
+        dv = d + weights[i]
+        if stamp[v] != generation or dv < distance[v]:
+          stamp[v] = generation
+          distance[v] = dv
+          parent[v] = u
+          via[v] = edge_ids[i]
+          heapq.heappush(heap, (dv, v))
+
+    return None
+
+  def bidirectional_bfs(self, source: int, destination: int) -> Optional[Walk]:
+    """bfs() growing whichever of the two frontiers is smaller"""
+    source, destination = self.validate(source, destination)
+    generation = self.start(source, destination)
+    if source == destination:
+      self.cost = 0.0
+      return self.walk(source)
+
+    frontiers = ([source], [destination])
+    while frontiers[0] and frontiers[1]:
+      side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+      indptr, indices, _, edge_ids = self.arcs[side]
+      stamp, distance, parent, via = self.stamp[side], self.distance[side], self.parent[side], self.via[side]
+      other_stamp, other_distance = self.stamp[1 - side], self.distance[1 - side]
+
+      # Finish the whole level, the first meeting seen is not always the best
+      best = meeting = -1
+      grown = []
+      for u in frontiers[side]:
+        for i in range(indptr[u], indptr[u + 1]):
+          v = indices[i]
+          if stamp[v] == generation:
+            continue
+          stamp[v] = generation
+          distance[v] = distance[u] + 1
+          parent[v] = u
+          via[v] = edge_ids[i]
+          grown.append(v)
+          if other_stamp[v] == generation and (meeting == -1 or distance[v] + other_distance[v] < best):
+            best, meeting = distance[v] + other_distance[v], v
+
+      if meeting != -1:
+        self.cost = best
+        return self.walk(meeting, bidirectional=True)
+      frontiers[side][:] = grown
+
+    return None
+
+  def bidirectional_dijkstra(self, source: int, destination: int) -> Optional[Walk]:
+    """dijkstra() from both ends, stopping once the two heap tops cannot improve"""
+    source, destination = self.validate(source, destination)
+    generation = self.start(source, destination)
+    if source == destination:
+      self.cost = 0.0
+      return self.walk(source)
+
+    heaps = ([(0.0, source)], [(0.0, destination)])
+    settled = (set(), set())
+    best = float("inf")
+    meeting = -1
+
+    while heaps[0] and heaps[1]:
+      if heaps[0][0][0] + heaps[1][0][0] >= best:
+        break
+
+      side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+      d, u = heapq.heappop(heaps[side])
+      distance = self.distance[side]
+      if u in settled[side] or d > distance[u]:
+        continue
+      settled[side].add(u)
+
+      indptr, indices, weights, edge_ids = self.arcs[side]
+      stamp, parent, via = self.stamp[side], self.parent[side], self.via[side]
+      other_stamp, other_distance = self.stamp[1 - side], self.distance[1 - side]
+      for i in range(indptr[u], indptr[u + 1]):
+        v = indices[i]
+        dv = d + weights[i]
+        if stamp[v] != generation or dv < distance[v]:
+          stamp[v] = generation
+          distance[v] = dv
+          parent[v] = u
+          via[v] = edge_ids[i]
+          heapq.heappush(heaps[side], (dv, v))
+        if other_stamp[v] == generation and distance[v] + other_distance[v] < best:
+          best, meeting = distance[v] + other_distance[v], v
+
+    if meeting == -1:
+      return None
+
+    self.cost = best
+    return self.walk(meeting, bidirectional=True)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Sequence
+from lib.adjacency_list import AdjacencyList
+from lib.graph import indexed_edges
+from lib.result_cache import ResultCache
+from lib.vertex import Vertex
+
+
+if TYPE_CHECKING:
+  import numpy as np
+  from lib.edge import Edge
+  from lib.graph import Graph
+
+
+class MaskedList(Sequence):
+  """The parent's slots with masked-out entries reading as None"""
+
+  def __init__(self, items: list, mask: bytearray):
+    self.items = items
+    self.mask = mask
+
+  def __len__(self) -> int:
+    return len(self.items)
+
+  def __getitem__(self, i: int):
+    return self.items[i] if self.mask[i] else None
+
+  def __iter__(self) -> Iterator:
+    for item, keep in zip(self.items, self.mask):
+      yield item if keep else None
+
+
+class ViewRows(Sequence):
+  """Adjacency rows rebuilt on access from the parent's incidence lists"""
+
+  def __init__(self, view: SubgraphView):
+    self.view = view
+
+  def __len__(self) -> int:
+    return len(self.view.vertex_mask)
+
+  def __getitem__(self, i: int) -> list[Vertex]:
+    view = self.view
+    if not view.vertex_mask[i]:
+      return []
+
+    u = view.parent.vertices[i]
+    edge_mask = view.edge_mask
+    row = []
+    for e in view.parent.incidence[i]:
+      if not edge_mask[e.index] or view.parent.edges[e.index] is not e:
+        continue
+      # Undirected loops show up twice, as they do in AdjacencyList rows
+      if e.tail is u:
+        row.append(e.head)
+      if e.head is u and not view.directed:
+        row.append(e.tail)
+
+    return row
+
+
+class SubgraphView(AdjacencyList):
+  """Read-only subgraph sharing the parent's vertices, edges and indices
+
+  Vertex and edge masks hide what is left out, which reads as None exactly
+  like a removed slot, so every AdjacencyList algorithm runs on the view
+  unchanged. The view is only valid while the parent is not mutated.
+  """
+
+  def __init__(self, parent: Graph, vertex_mask: bytearray, edge_mask: bytearray):
+    self.parent = parent
+    self.directed = parent.directed
+    self.vertex_mask = vertex_mask
+    self.edge_mask = edge_mask
+
+    self.vertices = MaskedList(parent.vertices, vertex_mask)
+    self.edges = MaskedList(parent.edges, edge_mask)
+    self.content = ViewRows(self)
+    self.slots = None
+    # Masked edges read as None, which arcs() already skips like removed ones
+    self.incidence = parent.incidence
+    self.dead_vertices = len(vertex_mask) - sum(vertex_mask)
+    self.dead_edges = len(edge_mask) - sum(edge_mask)
+    self.label_index = {label: i for label, i in parent.label_index.items() if vertex_mask[i]}
+    self.edge_index = parent.edge_index
+    self.disjoint_set = None
+    self.cache = ResultCache()
+
+  @property
+  def version(self) -> int:
+    return self.parent.version
+
+  @staticmethod
+  def create(
+      parent: Graph, vertices: Optional[Iterable[int]] = None,
+      edges: Optional[Iterable[Edge | tuple]] = None) -> SubgraphView:
+    """Vertices alone induce a subgraph, edges alone bring their endpoints"""
+    root = parent.parent if isinstance(parent, SubgraphView) else parent
+    if len(root.incidence) != len(root.vertices):
+      raise Exception("Views need a mutable graph")
+
+    vertex_mask = bytearray(len(parent.vertices))
+    edge_mask = bytearray(len(parent.edges))
+
+    if vertices is None and edges is not None:
+      edges = list(parent.match_edges(edges))
+      for e in edges:
+        vertex_mask[e.tail.index] = vertex_mask[e.head.index] = 1
+    else:
+      for iv in parent.live_vertices() if vertices is None else vertices:
+        iv = iv.index if isinstance(iv, Vertex) else int(iv)
+        if not parent.is_live(iv):
+          raise Exception("Invalid vertices")
+        vertex_mask[iv] = 1
+
+    for e in parent.live_edges() if edges is None else parent.match_edges(edges):
+      if vertex_mask[e.tail.index] and vertex_mask[e.head.index]:
+        edge_mask[e.index] = 1
+
+    return SubgraphView(root, vertex_mask, edge_mask)
+
+  def materialize(self, graph_type: Optional[type[Graph]] = None) -> Graph:
+    """Real copy of the view, built in one linear pass over its slots"""
+    g = (graph_type or type(self.parent))(directed=self.directed)
+    remap = [-1] * len(self.vertex_mask)
+    live = list(self.live_vertices())
+    for new, index in enumerate(g.add_vertices_bulk(v.label for v in live)):
+      remap[live[new].index] = index
+
+    edges = list(self.live_edges())
+    labels = [e.label for e in edges]
+    g.add_edges_bulk(
+      [(remap[e.tail.index], remap[e.head.index]) for e in edges],
+      labels if any(label is not None for label in labels) else None)
+
+    return g
+
+  def get_edge(self, ix: int, iy: int, label: Optional[str] = None) -> Optional[Edge]:
+    edges = indexed_edges(self.parent.edge_index.get(self.edge_key(ix, iy)))
+    return next((e for e in edges if self.edge_mask[e.index] and (label is None or e.label == label)), None)
+
+  def is_neighbor(self, ix: int, iy: int) -> bool:
+    return self.get_edge(ix, iy) is not None
+
+  def get_degree(self, index: int) -> int:
+    """Counted over the view's edges only, Vertex.degree is the parent's"""
+    if not self.vertex_mask[index]:
+      raise Exception("Invalid vertices")
+
+    edges = self.parent.edges
+    edge_mask = self.edge_mask
+    degree = 0
+    for e in self.parent.incidence[index]:
+      if edge_mask[e.index] and edges[e.index] is e:
+        degree += 2 if e.tail is e.head else 1
+
+    return degree
+
+  def create_vertex(self, label: str):
+    raise Exception("SubgraphView is read-only")
+
+  def add_vertices_bulk(self, labels: Iterable[str | int]) -> list[int]:
+    raise Exception("SubgraphView is read-only")
+
+  def remove_vertex(self, iv: int):
+    raise Exception("SubgraphView is read-only")
+
+  def create_edge(self, ix: int, iy: int, label: Optional[str] = None):
+    raise Exception("SubgraphView is read-only")
+
+  def add_edges_bulk(self, edges: np.ndarray | Iterable[tuple], labels: Optional[Sequence[Optional[str]]] = None):
+    raise Exception("SubgraphView is read-only")
+
+  def remove_edge(self, ix: int, iy: int, label: Optional[str] = None):
+    raise Exception("SubgraphView is read-only")
+
+  def compact(self) -> list[int]:
+    raise Exception("SubgraphView is read-only, materialize() it first")
@@ -0,0 +1,265 @@
+from __future__ import annotations
+from array import array
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Sequence
+from lib.constants import EdgeType, TraversalAction
+
+
+if TYPE_CHECKING:
+  from lib.edge import Edge
+  from lib.graph import Graph
+  from lib.vertex import Vertex
+
+  VertexCallback = Callable[[Vertex, Optional[Vertex]], Optional[TraversalAction]]
+  EdgeCallback = Callable[[Vertex, Vertex, EdgeType], Optional[TraversalAction]]
+
+
+WHITE = 0
+GREY = 1
+BLACK = 2
+
+
+class DepthFirstTraversal:
+  """Iterative depth-first traversal driven by enter/exit/edge callbacks
+
+  Callbacks may return TraversalAction.STOP to abort the whole traversal,
+  on_enter may return TraversalAction.SKIP to leave a vertex unexpanded and
+  on_edge may return it to avoid descending through a tree edge.
+
+  Visit state lives in per-run tables indexed by vertex index, so the graph
+  itself is never written and several traversals may share it. Removed
+  vertex slots (None) among the roots are skipped.
+  """
+
+  def __init__(self, graph: Graph, neighbors: Optional[Callable[[Vertex], Iterable[Vertex]]] = None):
+    self.graph = graph
+    self.neighbors = neighbors or (lambda u: graph.content[u.index])
+    self.color = bytearray()
+
+  def run(
+      self, roots: Iterable[Vertex], *,
+      on_enter: Optional[VertexCallback] = None,
+      on_exit: Optional[VertexCallback] = None,
+      on_edge: Optional[EdgeCallback] = None,
+      skip_parent: bool = False,
+      backtrack: bool = False) -> bool:
+    """Returns True when a callback stopped the traversal"""
+    STOP = TraversalAction.STOP
+    SKIP = TraversalAction.SKIP
+    done = WHITE if backtrack else BLACK
+    neighbors = self.neighbors
+
+    n = len(self.graph.vertices)
+    color = self.color = bytearray(n)
+
+    for root in roots:
+      if root is None or color[root.index] != WHITE:
+        continue
+
+      color[root.index] = GREY
+      action = on_enter(root, None) if on_enter else None
+      if action is STOP:
+        return True
+
+      arcs = iter(()) if action is SKIP else iter(neighbors(root))
+      stack = [(root, None, arcs)]
+
+      while stack:
+        u, parent, arcs = stack[-1]
+
+        for v in arcs:
+          if skip_parent and v is parent:
+            continue
+
+          state = color[v.index]
+          if state == WHITE:
+            kind = EdgeType.TREE_EDGE
+          elif state == GREY:
+            kind = EdgeType.BACK_EDGE
+          else:
+            kind = EdgeType.UNCLASSIFIED
+
+          action = on_edge(u, v, kind) if on_edge else None
+          if action is STOP:
+            return True
+          if kind is not EdgeType.TREE_EDGE or action is SKIP:
+            continue
+
+          color[v.index] = GREY
+          action = on_enter(v, u) if on_enter else None
+          if action is STOP:
+            return True
+
+          stack.append((v, u, iter(()) if action is SKIP else iter(neighbors(v))))
+          break
+        else:
+          stack.pop()
+          color[u.index] = done
+          if on_exit and on_exit(u, parent) is STOP:
+            return True
+
+    return False
+
+
+# Codes of depth_first_arrays() edge types, EDGE_TYPES maps them back
+TREE = 1
+BACK = 2
+FORWARD = 3
+CROSS = 4
+EDGE_TYPES = (EdgeType.UNCLASSIFIED, EdgeType.TREE_EDGE, EdgeType.BACK_EDGE, EdgeType.FOWARD_EDGE, EdgeType.CROSS_EDGE)
+
+
+def depth_first_arrays(
+    indptr: list[int], indices: list[int], edge_ids: list[int], edges: int,
+    roots: Iterable[int], *, directed: bool) -> dict:
+  """Iterative depth-first search over CSR rows classifying every edge
+
+  Each arc carries the index of its edge, so an edge is classified in O(1)
+  from discovery and exit times: tree, back to a vertex still open, forward
+  to a finished descendant and cross to any other finished vertex. An
+  undirected edge is classified by the first of its two arcs and skipped
+  on the second, which leaves only tree and back edges. Entry and exit
+  times start at 1 and count separately, exit 0 meaning still open.
+  """
+  n = len(indptr) - 1
+  component = array("i", [0]) * n
+  entry = array("i", [0]) * n
+  finish = array("i", [0]) * n
+  kinds = bytearray(edges)
+  order = array("i")
+  cursor = indptr[:-1]
+  pushed = popped = count = 0
+
+  for root in roots:
+    if entry[root]:
+      continue
+
+    pushed += 1
+    entry[root] = pushed
+    component[root] = count
+    calls = [root]
+
+    while calls:
+      u = calls[-1]
+      i = cursor[u]
+      if i == indptr[u + 1]:
+        calls.pop()
+        popped += 1
+        finish[u] = popped
+        continue
+
+      cursor[u] = i + 1
+      v = indices[i]
+      e = edge_ids[i]
+      if not directed and kinds[e]:
+        continue
+
+      if not entry[v]:
+        kinds[e] = TREE
+        pushed += 1
+        entry[v] = pushed
+        component[v] = count
+        calls.append(v)
+      elif not finish[v]:
+        kinds[e] = BACK
+      else:
+        kinds[e] = FORWARD if entry[u] < entry[v] else CROSS
+      order.append(e)
+
+    count += 1
+
+  return {
+    "Components": count,
+    "Push Counter": pushed + 1,
+    "Pop Counter": popped + 1,
+    "Component": component,
+    "Entry Depth": entry,
+    "Exit Depth": finish,
+    "Edge Types": kinds,
+    "Edge Order": order,
+  }
+
+
+def classified_edges(report: dict, edges: Sequence[Optional[Edge]]) -> dict:
+  """Adds the Edge objects of each kind to a depth_first_arrays() report
+
+  Lists follow the order edges were classified in. The Edge objects are
+  left untouched, their types only live in the report's "Edge Types".
+  """
+  lists = {TREE: [], BACK: [], FORWARD: [], CROSS: []}
+  kinds = report["Edge Types"]
+  for e in report["Edge Order"]:
+    lists[kinds[e]].append(edges[e])
+
+  report["Tree Edges"] = lists[TREE]
+  report["Back Edges"] = lists[BACK]
+  report["Forward Edges"] = lists[FORWARD]
+  report["Cross Edges"] = lists[CROSS]
+  return report
+
+
+def topological_levels(indptr: list[int], indices: list[int]) -> tuple[list[int], list[int]]:
+  """Kahn's algorithm over CSR rows, one level at a time
+
+  Returns the vertices in topological order and the offset where each
+  level starts in it, plus a final offset. A level holds the vertices whose
+  latest predecessor sits in the level before, so no arc stays inside one.
+  Vertices on or behind a cycle are missing from the order.
+  """
+  n = len(indptr) - 1
+  indegree = [0] * n
+  for v in indices:
+    indegree[v] += 1
+
+  order = [u for u in range(n) if indegree[u] == 0]
+  starts = [0]
+  begin = 0
+  while begin < len(order):
+    end = len(order)
+    for k in range(begin, end):
+      u = order[k]
+      for i in range(indptr[u], indptr[u + 1]):
+        v = indices[i]
+        indegree[v] -= 1
+        if indegree[v] == 0:
+          order.append(v)
+    starts.append(end)
+    begin = end
+
+  return order, starts
+
+
+def blocked_cycle(
+    indptr: list[int], indices: Sequence[int], edge_ids: Sequence[int],
+    order: list[int]) -> tuple[list[int], list[int]]:
+  """A cycle among the vertices topological_levels() could not order
+
+  Each of them kept a predecessor that was not ordered either, so walking
+  predecessors from any of them repeats a vertex. The cycle is returned
+  closed, following the arcs forward, with the edge of each step.
+  """
+  n = len(indptr) - 1
+  left = bytearray([1]) * n
+  for u in order:
+    left[u] = 0
+
+  predecessor = [-1] * n
+  predecessor_edge = [-1] * n
+  for u in range(n):
+    if left[u]:
+      for i in range(indptr[u], indptr[u + 1]):
+        if left[indices[i]]:
+          predecessor[indices[i]] = u
+          predecessor_edge[indices[i]] = edge_ids[i]
+
+  position: dict[int, int] = {}
+  walk: list[int] = []
+  u = left.index(1)
+  while u not in position:
+    position[u] = len(walk)
+    walk.append(u)
+    u = predecessor[u]
+
+  walk = walk[position[u]:]
+  walk.append(u)
+  walk.reverse()
+  return walk, [predecessor_edge[v] for v in walk[1:]]
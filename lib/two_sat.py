@@ -0,0 +1,307 @@
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
+import numpy as np
+from lib.csr_graph import strongly_connected_labels
+from lib.graph import sorted_arcs
+
+
+def literal_nodes(literals: np.ndarray) -> np.ndarray:
+  """Literal x_k maps to node 2k and ¬x_k to node 2k + 1"""
+  return 2 * np.abs(literals) + (literals < 0)
+
+
+def implication_graph(clauses: np.ndarray, variables: int) -> tuple[np.ndarray, np.ndarray]:
+  """CSR arrays of the arcs ¬a → b and ¬b → a for every clause (a ∨ b)"""
+  a = literal_nodes(clauses[:, 0])
+  b = literal_nodes(clauses[:, 1])
+  tails = np.concatenate((a ^ 1, b ^ 1))
+  heads = np.concatenate((b, a))
+
+  indptr, indices, _ = sorted_arcs(2 * (variables + 1), tails, heads, None, directed=True)
+  return indptr, indices
+
+
+def as_clause_array(clauses: np.ndarray | Iterable[tuple[int, int]]) -> np.ndarray:
+  if not isinstance(clauses, np.ndarray):
+    clauses = np.array(list(clauses), dtype=np.int64)
+
+  clauses = clauses.reshape(-1, 2).astype(np.int64, copy=False)
+  if (clauses == 0).any():
+    raise Exception("Literals must be non-zero")
+
+  return clauses
+
+
+def solve_2sat(clauses: np.ndarray | Iterable[tuple[int, int]]) -> Optional[dict[int, bool]]:
+  """Assignment of every variable in the formula, or None if unsatisfiable"""
+  clauses = as_clause_array(clauses)
+  if len(clauses) == 0:
+    return {}
+
+  # Renumber variables densely so sparse or huge ids cost nothing extra
+  used, dense = np.unique(np.abs(clauses), return_inverse=True)
+  dense = (dense.reshape(-1, 2) + 1) * np.sign(clauses)
+
+  indptr, indices = implication_graph(dense, len(used))
+  component, _ = strongly_connected_labels(indptr.tolist(), indices.tolist())
+  component = np.array(component, dtype=np.int64).reshape(-1, 2)[1:]
+
+  if (component[:, 0] == component[:, 1]).any():
+    return None
+
+  # Tarjan numbers sinks first, so a literal is true when it completes first
+  values = component[:, 0] < component[:, 1]
+
+  return dict(zip(used.tolist(), values.tolist()))
+
+
+class TwoSatSolver:
+  """2-SAT formula kept solved across clause additions and retractions
+
+  The implication graph keeps its condensation, with every component
+  carrying a key in topological order. An added arc that agrees with the
+  order costs nothing; otherwise only components between its ends are
+  searched and reordered (Pearce-Kelly), merging any cycle it closes.
+  Retracting an arc inside a component first checks whether its ends are
+  still connected; only when they are not is Tarjan re-run on that
+  component alone. live_assignment() only re-evaluates the variables
+  touched since the last call, solve() copies its result.
+  """
+
+  def __init__(self, clauses: np.ndarray | Iterable[tuple[int, int]] = ()):
+    self.variables: dict[int, int] = {}
+    self.names: list[int] = []
+    self.successors: list[dict[int, int]] = []
+    self.predecessors: list[dict[int, int]] = []
+    self.component: list[int] = []
+    self.members: dict[int, set[int]] = {}
+    self.keys: dict[int, tuple[int, ...]] = {}
+    self.clauses: dict[int, tuple[int, int]] = {}
+    self.conflicts: set[int] = set()
+    self.assignment: dict[int, bool] = {}
+    self.assignment_view = MappingProxyType(self.assignment)
+    self.dirty: set[int] = set()
+    self.next_clause = 0
+    self.next_component = 0
+    self.next_key = 0
+
+    for a, b in as_clause_array(clauses).tolist():
+      x, y = self.node(a), self.node(b)
+      self.clauses[self.next_clause] = (a, b)
+      self.next_clause += 1
+      for tail, head in ((x ^ 1, y), (y ^ 1, x)):
+        self.successors[tail][head] = self.successors[tail].get(head, 0) + 1
+        self.predecessors[head][tail] = self.predecessors[head].get(tail, 0) + 1
+
+    self.rebuild()
+
+  def node(self, literal: int) -> int:
+    """Literal x_k maps to node 2i and ¬x_k to 2i + 1, i being k's dense index"""
+    if literal == 0:
+      raise Exception("Literals must be non-zero")
+
+    index = self.variables.get(abs(literal))
+    if index is None:
+      index = len(self.names)
+      self.variables[abs(literal)] = index
+      self.names.append(abs(literal))
+      self.dirty.add(index)
+      for _ in range(2):
+        self.successors.append({})
+        self.predecessors.append({})
+        self.component.append(self.new_component({len(self.component)}, (self.next_key,)))
+        self.next_key += 1
+
+    return 2 * index + (literal < 0)
+
+  def new_component(self, members: set[int], key: tuple[int, ...]) -> int:
+    c = self.next_component
+    self.next_component += 1
+    self.members[c] = members
+    self.keys[c] = key
+    return c
+
+  def rebuild(self):
+    """Recomputes the whole condensation from scratch"""
+    n = len(self.component)
+    indptr = [0] * (n + 1)
+    indices: list[int] = []
+    for u, heads in enumerate(self.successors):
+      indices.extend(heads)
+      indptr[u + 1] = len(indices)
+
+    labels, _ = strongly_connected_labels(indptr, indices)
+    count = max(labels, default=-1) + 1
+
+    self.members = {}
+    self.keys = {}
+    self.next_component = 0
+    self.next_key = count
+    created = [self.new_component(set(), (count - 1 - c,)) for c in range(count)]
+    for u, c in enumerate(labels):
+      self.component[u] = created[c]
+      self.members[created[c]].add(u)
+
+    self.conflicts = {i for i in range(len(self.names)) if labels[2 * i] == labels[2 * i + 1]}
+    self.dirty = set(range(len(self.names)))
+
+  def add_clause(self, a: int, b: int) -> int:
+    """Adds (a ∨ b) and returns an id for retract_clause"""
+    x, y = self.node(a), self.node(b)
+    self.add_arc(x ^ 1, y)
+    self.add_arc(y ^ 1, x)
+
+    clause = self.next_clause
+    self.next_clause += 1
+    self.clauses[clause] = (a, b)
+    return clause
+
+  def retract_clause(self, clause: int):
+    a, b = self.clauses.pop(clause)
+    x, y = self.variables[abs(a)] * 2 + (a < 0), self.variables[abs(b)] * 2 + (b < 0)
+    self.remove_arc(x ^ 1, y)
+    self.remove_arc(y ^ 1, x)
+
+  def add_arc(self, x: int, y: int):
+    multiplicity = self.successors[x].get(y, 0)
+    self.successors[x][y] = multiplicity + 1
+    self.predecessors[y][x] = multiplicity + 1
+    if multiplicity:
+      return
+
+    X, Y = self.component[x], self.component[y]
+    if X == Y or self.keys[X] < self.keys[Y]:
+      return
+
+    forward = self.search(Y, self.keys[X], self.successors)
+    backward = self.search(X, self.keys[Y], self.predecessors)
+    slots = sorted(self.keys[c] for c in forward | backward)
+    merged = forward & backward
+
+    before = sorted(backward - merged, key=self.keys.__getitem__)
+    after = sorted(forward - merged, key=self.keys.__getitem__)
+    for c, key in zip(before, slots):
+      self.keys[c] = key
+    for c, key in zip(after, slots[len(slots) - len(after):]):
+      self.keys[c] = key
+    if merged:
+      self.keys[self.merge(merged)] = slots[len(before)]
+
+    for c in before + after + ([self.component[x]] if merged else []):
+      self.dirty.update(u >> 1 for u in self.members[c])
+
+  def search(self, start: int, limit: tuple[int, ...], adjacency: list[dict[int, int]]) -> set[int]:
+    """Components reachable from start along adjacency without passing limit"""
+    forward = adjacency is self.successors
+    seen = {start}
+    stack = [start]
+
+    while stack:
+      c = stack.pop()
+      for u in self.members[c]:
+        for w in adjacency[u]:
+          d = self.component[w]
+          if d in seen or (self.keys[d] > limit if forward else self.keys[d] < limit):
+            continue
+          seen.add(d)
+          stack.append(d)
+
+    return seen
+
+  def merge(self, components: set[int]) -> int:
+    target = max(components, key=lambda c: len(self.members[c]))
+    members = self.members[target]
+
+    for c in components:
+      if c == target:
+        continue
+      moved = self.members.pop(c)
+      for u in moved:
+        self.component[u] = target
+        if self.component[u ^ 1] == target:
+          self.conflicts.add(u >> 1)
+      members |= moved
+      del self.keys[c]
+
+    return target
+
+  def remove_arc(self, x: int, y: int):
+    multiplicity = self.successors[x][y] - 1
+    if multiplicity:
+      self.successors[x][y] = multiplicity
+      self.predecessors[y][x] = multiplicity
+      return
+
+    del self.successors[x][y]
+    del self.predecessors[y][x]
+    if self.component[x] == self.component[y] and not self.reaches(x, y):
+      self.split(self.component[x])
+
+  def reaches(self, x: int, y: int) -> bool:
+    """Whether x still reaches y inside their component, searching from both ends"""
+    S = self.component[x]
+    seen = ({x}, {y})
+    frontiers = ([x], [y])
+
+    while frontiers[0] and frontiers[1]:
+      side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+      adjacency = self.successors if side == 0 else self.predecessors
+      grown = []
+      for u in frontiers[side]:
+        for w in adjacency[u]:
+          if w in seen[1 - side]:
+            return True
+          if w not in seen[side] and self.component[w] == S:
+            seen[side].add(w)
+            grown.append(w)
+      frontiers[side][:] = grown
+
+    return False
+
+  def split(self, S: int):
+    nodes = list(self.members[S])
+    local = {u: i for i, u in enumerate(nodes)}
+    indptr = [0]
+    indices: list[int] = []
+    for u in nodes:
+      indices.extend(local[w] for w in self.successors[u] if w in local)
+      indptr.append(len(indices))
+
+    labels, _ = strongly_connected_labels(indptr, indices)
+    count = max(labels) + 1
+    if count == 1:
+      return
+
+    key = self.keys.pop(S)
+    del self.members[S]
+    created = [self.new_component(set(), key + (count - 1 - c,)) for c in range(count)]
+    for u, c in zip(nodes, labels):
+      self.component[u] = created[c]
+      self.members[created[c]].add(u)
+
+    for u in nodes:
+      if self.component[u] != self.component[u ^ 1]:
+        self.conflicts.discard(u >> 1)
+      self.dirty.add(u >> 1)
+
+  def solve(self) -> Optional[dict[int, bool]]:
+    """Assignment of every variable seen so far, or None if unsatisfiable"""
+    assignment = self.live_assignment()
+    return None if assignment is None else dict(assignment)
+
+  def live_assignment(self) -> Optional[Mapping[int, bool]]:
+    """Like solve(), but a read-only view that later calls update in place
+
+    Only variables touched since the last call are re-evaluated and nothing
+    is copied, so this is the O(delta) way to poll the solver.
+    """
+    if self.conflicts:
+      return None
+
+    # Keys grow in topological order, a literal is true when it comes later
+    for i in self.dirty:
+      self.assignment[self.names[i]] = self.keys[self.component[2 * i]] > self.keys[self.component[2 * i + 1]]
+    self.dirty.clear()
+
+    return self.assignment_view
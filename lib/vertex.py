@@ -1,16 +1,10 @@
-from lib.constants import Color
-
-
 class Vertex:
+  __slots__ = ("index", "label", "degree")
 
   def __init__(self, index: int, label: str | int):
     self.index: int = index
     self.label: str | int = label
-    self.color: Color = Color.WHITE
     self.degree: int = 0
-    self.component: int = 0
-    self.entry_depth: int = 0
-    self.exit_depth: int = 0
 
   def __iter__(self):
     yield self.label
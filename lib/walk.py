@@ -1,36 +1,67 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
 
 if TYPE_CHECKING:
+  from lib.edge import Edge
   from lib.graph import Graph
+  from lib.vertex import Vertex
 
 
 class Walk:
-  """Only works for simple graphs"""
+  """Only works for simple graphs, unless the edge of every step is given
 
-  def __init__(self, graph: Graph, vertices: list[int]):
-    if not graph.validate_vertices(list(set(vertices))) or len(vertices) == 0:
+  Edges are given by index, one per step, and are only checked to join
+  the right vertices. Vertices and edges are fetched one at a time through
+  graph.vertex() and graph.edge(), so a CSRGraph only builds the objects on
+  the walk. content is rendered on first access.
+  """
+
+  def __init__(self, graph: Graph, vertices: Sequence[int], edges: Optional[Sequence[int]] = None):
+    if len(vertices) == 0 or not graph.validate_vertices(list(set(vertices))):
       raise Exception("Invalid vertices")
 
     self.graph = graph
-    self.vertices = [graph.vertices[v] for v in vertices]
+    self.vertices = [graph.vertex(v) for v in vertices]
     self.length = len(self.vertices) - 1
+    self.rendered: Optional[list[str]] = None
+
+    if edges is None:
+      self.edges = [graph.get_edge(x, y) for x, y in zip(vertices, vertices[1:])]
+      if any(e is None for e in self.edges):
+        raise Exception("Invalid Walk")
+      return
+
+    if len(edges) != self.length:
+      raise Exception("Invalid Walk")
+
+    self.edges = [graph.edge(i) for i in edges]
+    for u, v, e in zip(self.vertices, self.vertices[1:], self.edges):
+      if e is None or not (e.tail is u and e.head is v or not e.directed and e.tail is v and e.head is u):
+        raise Exception("Invalid Walk")
+
+  @staticmethod
+  def trusted(graph: Graph, vertices: list[Vertex], edges: list[Edge]) -> Walk:
+    """Walk over Vertex and Edge objects already known to form one"""
+    walk = Walk.__new__(Walk)
+    walk.graph = graph
+    walk.vertices = vertices
+    walk.edges = edges
+    walk.length = len(vertices) - 1
+    walk.rendered = None
+    return walk
 
-    self.edges = []
-    for i in range(self.length):
-      edge = (vertices[i], vertices[i + 1])
-      try:
-        index = graph.edges.index(edge)
-      except ValueError:
-        raise Exception("Invalid Walk") from None
-      self.edges.append(graph.edges[index])
-
-    self.content = []
-    for v, e in zip(self.vertices, self.edges):
-      self.content.append(str(v))
-      self.content.append(str(e))
-    self.content.append(str(self.vertices[-1]))
+  @property
+  def content(self) -> list[str]:
+    if self.rendered is None:
+      content = []
+      for v, e in zip(self.vertices, self.edges):
+        content.append(str(v))
+        content.append(str(e))
+      content.append(str(self.vertices[-1]))
+      self.rendered = content
+
+    return self.rendered
 
   def get_primitive(self, reverse: bool = False):
     if reverse:
@@ -40,10 +71,12 @@ class Walk:
 
   def get_path(self) -> Walk:
     last = -1
+    seen = set()
 
-    for i, v in enumerate(self.vertices):
-      if v in self.vertices[:i]:
+    for v in self.vertices:
+      if v.index in seen:
         break
+      seen.add(v.index)
       last += 1
 
     return self.section(0, last)
@@ -52,5 +85,12 @@ class Walk:
     if not (0 <= i < j < self.length):
       return None
 
-    sublist = [v.index for v in self.vertices[i:(j + 1)]]
-    return Walk(self.graph, sublist)
+    return Walk.trusted(self.graph, self.vertices[i:(j + 1)], self.edges[i:j])
+
+
+class CycleError(Exception):
+  """Raised when a cycle blocks an ordering, the cycle is kept as a Walk"""
+
+  def __init__(self, cycle: Walk):
+    super().__init__(f"Graph contains a cycle: {' '.join(cycle.get_primitive())}")
+    self.cycle = cycle
@@ -1,4 +1,5 @@
-from lib import AdjacencyList
+import sys
+from lib import AdjacencyList, read_dimacs_cnf
 
 
 def CNF_to_str(elements: list[tuple[int, int]]) -> str:
@@ -11,6 +12,11 @@ def CNF_to_str(elements: list[tuple[int, int]]) -> str:
   
 
 def main():
+  if len(sys.argv) > 1:
+    elements = read_dimacs_cnf(sys.argv[1])
+    print(AdjacencyList.is_2satisfiable(elements))
+    return
+
   # elements = [(1, -2), (-1, 2), (-1, -2), (1, -3)] # True
   # elements = [(1, 2), (-1, 2), (1, -2), (-1, -2)] # False
   elements = [(1, 2), (-2, 3), (-1, -2), (3, 4), (-3, 5), (-4, -5), (-3, 4)] # True
@@ -0,0 +1,73 @@
+import random
+import pytest
+from lib import AdjacencyList
+
+
+def check_slots(g):
+  for row, slots in zip(g.content, g.slots):
+    expected = {}
+    for i, v in enumerate(row):
+      expected.setdefault(v.index, []).append(i)
+    assert {k: sorted(p) if isinstance(p, list) else [p] for k, p in slots.items()} == expected
+    # A single position is never left wrapped in a list
+    assert all(isinstance(p, int) or len(p) > 1 for p in slots.values())
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("seed", range(8))
+def test_hashed_rows_agree_with_plain_rows(directed: bool, seed: int):
+  rng = random.Random(seed)
+  n = 6
+  hashed, plain = AdjacencyList(directed=directed, hashed=True), AdjacencyList(directed=directed)
+  for g in (hashed, plain):
+    g.add_vertices_bulk(range(n))
+
+  for step in range(120):
+    live = [v.index for v in plain.live_vertices()]
+    roll = rng.random()
+    if roll < 0.55:
+      # Few vertices, so parallel edges and loops come up often
+      x, y = rng.choice(live), rng.choice(live)
+      for g in (hashed, plain):
+        g.create_edge(x, y)
+    elif roll < 0.9 and plain.edge_count():
+      e = rng.choice(list(plain.live_edges()))
+      for g in (hashed, plain):
+        g.remove_edge(e.tail.index, e.head.index)
+    elif roll < 0.95 and len(live) > 2:
+      v = rng.choice(live)
+      for g in (hashed, plain):
+        g.remove_vertex(v)
+    else:
+      for g in (hashed, plain):
+        g.compact()
+
+    check_slots(hashed)
+    for x in range(len(plain.vertices)):
+      assert sorted(v.index for v in hashed.content[x]) == sorted(v.index for v in plain.content[x])
+      for y in range(len(plain.vertices)):
+        assert hashed.multiplicity(x, y) == plain.multiplicity(x, y)
+        if plain.is_live(x) and plain.is_live(y):
+          assert hashed.is_neighbor(x, y) == plain.is_neighbor(x, y)
+
+
+def test_removal_swaps_the_last_entry_in():
+  g = AdjacencyList(directed=True, hashed=True)
+  g.add_vertices_bulk("abcde")
+  g.add_edges_bulk([(0, 1), (0, 2), (0, 3), (0, 4), (0, 2)])
+
+  g.remove_edge(0, 1)
+  assert [v.label for v in g.content[0]] == ["c", "c", "d", "e"]
+  assert g.slots[0] == {2: [1, 0], 3: 2, 4: 3}
+  g.remove_edge(0, 2)
+  assert [v.label for v in g.content[0]] == ["e", "c", "d"]
+  assert g.slots[0] == {2: 1, 3: 2, 4: 0}
+
+
+def test_hashing_an_existing_graph():
+  g = AdjacencyList()
+  g.add_vertices_bulk("abc")
+  g.add_edges_bulk([(0, 1), (1, 1), (1, 2)])
+  g.hash_neighbors()
+  check_slots(g)
+  assert g.multiplicity(1, 1) == 2 and g.is_neighbor(2, 1) and not g.is_neighbor(0, 2)
@@ -0,0 +1,90 @@
+import random
+import numpy as np
+import pytest
+from lib import AdjacencyList, AdjacencyMatrix
+
+
+def random_pair(seed: int, directed: bool) -> tuple[AdjacencyList, AdjacencyMatrix]:
+  """The same random graph built, edited and pruned on both backends"""
+  rng = random.Random(seed)
+  n = rng.randint(1, 10)
+  graphs = (AdjacencyList(directed=directed), AdjacencyMatrix(directed=directed))
+  pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(0, 2 * n))]
+  extra = [(rng.randrange(n), rng.randrange(n)) for _ in range(3)]
+  removed_edges = rng.sample(pairs, min(2, len(pairs)))
+  removed_vertices = rng.sample(range(n), rng.randint(0, n // 3))
+
+  for g in graphs:
+    g.add_vertices_bulk([f"v{i}" for i in range(n)])
+    g.add_edges_bulk(pairs)
+    for x, y in extra:
+      g.create_edge(x, y)
+    for x, y in removed_edges:
+      g.remove_edge(x, y)
+    for v in removed_vertices:
+      g.remove_vertex(v)
+
+  return graphs
+
+
+def closure_by_search(g: AdjacencyList) -> np.ndarray:
+  live = [v.index for v in g.live_vertices()]
+  closure = np.zeros((len(g.vertices), len(g.vertices)), dtype=bool)
+  if live:
+    closure[np.ix_(live, range(len(g.vertices)))] = g.reachability(live)
+  return closure
+
+
+@pytest.mark.parametrize("seed", range(30))
+@pytest.mark.parametrize("directed", [False, True])
+def test_matrix_agrees_with_adjacency_list(seed: int, directed: bool):
+  lists, matrix = random_pair(seed, directed)
+  live = [v.index for v in lists.live_vertices()]
+
+  assert matrix.edge_count() == lists.edge_count()
+  for x in live:
+    assert sorted(matrix.neighbors(x).tolist()) == sorted({v.index for v in lists.content[x]})
+    for y in live:
+      assert matrix.is_neighbor(x, y) == lists.is_neighbor(x, y)
+
+  assert (matrix.reachability(live) == lists.reachability(live)).all()
+  closure = matrix.transitive_closure()
+  assert (closure[np.ix_(live, live)] == closure_by_search(lists)[np.ix_(live, live)]).all()
+
+  found = lists.find_bipartition()
+  assert isinstance(matrix.find_bipartition(), tuple) == isinstance(found, tuple)
+  if isinstance(found, tuple):
+    assert matrix.is_bipartite(*found) and lists.is_bipartite(*found)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matrix_counts_walks_and_triangles(seed: int):
+  lists, matrix = random_pair(seed, directed=seed % 2 == 1)
+  n = len(lists.vertices)
+  adjacency = np.zeros((n, n), dtype=np.int64)
+  # An undirected loop is two arcs, as in the CSR rows
+  for e in lists.live_edges():
+    adjacency[e.tail.index, e.head.index] += 1
+    if not lists.directed:
+      adjacency[e.head.index, e.tail.index] += 1
+
+  assert (matrix.count_walks(3) == adjacency @ adjacency @ adjacency).all()
+
+  simple = (adjacency != 0) & ~np.eye(n, dtype=bool)
+  triangles = sum(
+    simple[a, b] and simple[b, c] and simple[c, a]
+    for a in range(n) for b in range(n) for c in range(n) if len({a, b, c}) == 3)
+  assert matrix.count_triangles() == triangles // (3 if lists.directed else 6)
+
+
+def test_is_bipartite_rejects_bad_indices_like_the_base_class():
+  lists, matrix = (AdjacencyList(), AdjacencyMatrix())
+  for g in (lists, matrix):
+    g.add_vertices_bulk(["a", "b", "c"])
+    g.create_edge(0, 1)
+    g.remove_vertex(2)
+
+  for x, y in (([0], [1, 5]), ([0, -1], [1]), ([0], [1, 2]), ([0, 0], [1])):
+    assert matrix.is_bipartite(x, y) is False
+    assert lists.is_bipartite(x, y) is False
+  assert matrix.is_bipartite([0], [1]) and lists.is_bipartite([0], [1])
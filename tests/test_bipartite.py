@@ -0,0 +1,58 @@
+import itertools
+import random
+import numpy as np
+import pytest
+from lib import AdjacencyList, CSRGraph, Walk
+
+
+def two_colorable(n: int, pairs) -> bool:
+  return any(all(colors[x] != colors[y] for x, y in pairs) for colors in itertools.product((0, 1), repeat=n))
+
+
+def build(backend: str, n: int, pairs, directed: bool):
+  if backend == "csr":
+    tails, heads = np.array(pairs, dtype=np.int64).reshape(-1, 2).T
+    return CSRGraph.from_arrays(n, tails, heads, directed=directed)
+
+  g = AdjacencyList(directed=directed)
+  g.add_vertices_bulk(range(n))
+  g.add_edges_bulk(pairs)
+  return g
+
+
+@pytest.mark.parametrize("backend", ["list", "csr"])
+@pytest.mark.parametrize("seed", range(12))
+def test_partitions_and_odd_cycles_match_brute_force(backend: str, seed: int):
+  rng = random.Random(seed)
+  n = 8
+  pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(0, 9))]
+  g = build(backend, n, pairs, directed=seed % 2 == 1)
+  found = g.find_bipartition()
+
+  if not isinstance(found, Walk):
+    x, y = found
+    assert two_colorable(n, pairs)
+    assert sorted(x + y) == list(range(n)) and g.is_bipartite(x, y)
+    return
+
+  assert not two_colorable(n, pairs)
+  assert found.vertices[0] is found.vertices[-1] and found.length % 2 == 1
+  for u, v, e in zip(found.vertices, found.vertices[1:], found.edges):
+    assert g.edges[e.index] is e and (e.tail, e.head) in ((u, v), (v, u))
+
+
+def test_loops_and_removed_slots():
+  g = AdjacencyList()
+  g.add_vertices_bulk("abcd")
+  g.add_edges_bulk([(0, 1), (1, 2), (2, 0), (2, 3)])
+  assert isinstance(g.find_bipartition(), Walk)
+
+  g.remove_vertex(1)
+  x, y = g.find_bipartition()
+  assert sorted(x + y) == [0, 2, 3] and g.is_bipartite(x, y)
+  assert not g.is_bipartite(x + [1], y) and not g.is_bipartite(x, y + x[:1])
+  assert not g.is_bipartite(x[1:], y)
+
+  g.create_edge(3, 3)
+  loop = g.find_bipartition()
+  assert loop.length == 1 and [v.label for v in loop.vertices] == ["d", "d"]
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from lib import AdjacencyList, AdjacencyMatrix, Graph
+from lib.disjoint_set import DisjointSet
+
+
+def snapshot(g):
+  index = {k: [e.index for e in (v if isinstance(v, list) else [v])] for k, v in g.edge_index.items()}
+  return (
+    [(v.label, v.degree) for v in g.vertices],
+    [(e.tail.index, e.head.index, e.label) for e in g.edges],
+    [[e.index for e in row] for row in g.incidence],
+    index)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("hashed", [False, True])
+def test_bulk_matches_one_edge_at_a_time(directed, hashed):
+  rng = np.random.default_rng(1)
+  bulk = AdjacencyList(directed=directed, hashed=hashed)
+  single = AdjacencyList(directed=directed, hashed=hashed)
+  bulk.add_vertices_bulk(range(8))
+  single.add_vertices_bulk(range(8))
+
+  # Second batch lands on rows, slots and parallel edges the first one made
+  for _ in range(2):
+    pairs = rng.integers(0, 8, size=(30, 2))
+    labels = [None if i % 4 else f"e{i}" for i in range(30)]
+    bulk.add_edges_bulk(pairs, labels)
+    for (x, y), label in zip(pairs.tolist(), labels):
+      single.create_edge(x, y, label)
+
+  assert snapshot(bulk) == snapshot(single)
+  assert [[v.index for v in row] for row in bulk.content] == [[v.index for v in row] for row in single.content]
+  assert bulk.slots == single.slots
+  assert bulk.get_components() == single.get_components()
+
+
+def test_bulk_fills_the_matrix():
+  g = AdjacencyMatrix()
+  g.add_vertices_bulk(range(3))
+  g.add_edges_bulk(np.array([[0, 1], [1, 0], [2, 2]]))
+  assert g.matrix[:3, :3].tolist() == [[0, 2, 0], [2, 0, 0], [0, 0, 2]]
+
+
+def test_from_edges_takes_labels_from_tuples():
+  g = Graph.from_edges([("a", "b", "x"), ("b", "c"), ("c", "a", "z")], graph_type=AdjacencyList)
+  assert [e.label for e in g.edges] == ["x", None, "z"]
+  assert [v.label for v in g.vertices] == ["a", "b", "c"]
+  assert g.get_edge(2, 0).label == "z"
+
+
+def test_union_pairs_matches_union():
+  rng = np.random.default_rng(2)
+  # A reversed path needs many hooking rounds, random pairs need few
+  for xs, ys in [(np.arange(99, 0, -1), np.arange(98, -1, -1)), tuple(rng.integers(0, 100, size=(2, 60)))]:
+    together, apart = DisjointSet(100), DisjointSet(100)
+    together.union_pairs(xs, ys)
+    for x, y in zip(xs.tolist(), ys.tolist()):
+      apart.union(x, y)
+
+    assert together.count == apart.count
+    assert all((together.find(x) == together.find(y)) == (apart.find(x) == apart.find(y))
+               for x in range(100) for y in range(100))
@@ -0,0 +1,76 @@
+import random
+import numpy as np
+import pytest
+from lib import AdjacencyList, CSRGraph
+
+
+def components_by_search(g) -> list[set[int]]:
+  neighbors = {v.index: set() for v in g.live_vertices()}
+  for e in g.live_edges():
+    neighbors[e.tail.index].add(e.head.index)
+    neighbors[e.head.index].add(e.tail.index)
+
+  seen, found = set(), []
+  for v in neighbors:
+    if v in seen:
+      continue
+    component, stack = {v}, [v]
+    while stack:
+      for w in neighbors[stack.pop()] - component:
+        component.add(w)
+        stack.append(w)
+    seen |= component
+    found.append(component)
+  return found
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_components_follow_every_kind_of_change(seed: int):
+  rng = random.Random(seed)
+  g = AdjacencyList(directed=seed % 2 == 1)
+  g.add_vertices_bulk(range(10))
+
+  for step in range(60):
+    live = [v.index for v in g.live_vertices()]
+    roll = rng.random()
+    if roll < 0.5 and live:
+      g.create_edge(rng.choice(live), rng.choice(live))
+    elif roll < 0.65:
+      g.add_edges_bulk([(rng.choice(live), rng.choice(live)) for _ in range(3)])
+    elif roll < 0.8 and g.edge_count():
+      e = rng.choice(list(g.live_edges()))
+      g.remove_edge(e.tail.index, e.head.index, e.label)
+    elif roll < 0.9 and len(live) > 1:
+      g.remove_vertex(rng.choice(live))
+    else:
+      g.create_vertex(f"new{step}")
+
+    expected = components_by_search(g)
+    assert g.get_components() == len(expected)
+    for component in expected:
+      assert len({g.get_component(v) for v in component}) == 1
+      first = next(iter(component))
+      assert all(g.same_component(first, v) for v in component)
+    assert g.contains_circuit() == (g.edge_count() > g.vertex_count() - len(expected))
+
+
+def test_additions_keep_the_union_find_and_removals_drop_it():
+  g = AdjacencyList()
+  g.add_vertices_bulk(range(4))
+  disjoint_set = g.get_disjoint_set()
+
+  g.create_edge(0, 1)
+  g.add_edges_bulk([(2, 3)])
+  g.create_vertex("e")
+  assert g.disjoint_set is disjoint_set and g.get_components() == 3
+  assert g.is_connected() is False
+
+  g.remove_edge(0, 1)
+  assert g.disjoint_set is None
+  assert g.get_components() == 4
+
+
+def test_frozen_components():
+  g = CSRGraph.from_arrays(6, np.array([0, 1, 3]), np.array([1, 2, 4]), directed=False)
+  assert g.get_components() == 3
+  assert g.same_component(0, 2) and not g.same_component(2, 3)
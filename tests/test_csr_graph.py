@@ -0,0 +1,129 @@
+import random
+import numpy as np
+import pytest
+from lib import AdjacencyList, CSRGraph, CycleError
+
+
+def test_cycles_only_build_the_objects_on_them():
+  n = 1000
+  tails = np.append(np.arange(n - 1), n - 1)
+  heads = np.append(np.arange(1, n), n - 2)
+  g = CSRGraph.from_arrays(n, tails, heads, directed=True)
+
+  cycle = g.find_cycle()
+  assert [v.index for v in cycle.vertices] == [n - 2, n - 1, n - 2]
+  assert all(e.tail is u and e.head is v for u, v, e in zip(cycle.vertices, cycle.vertices[1:], cycle.edges))
+
+  with pytest.raises(CycleError) as raised:
+    g.topological_sort()
+  assert raised.value.cycle.length >= 2
+
+  assert "vertices" not in g.__dict__ and "edges" not in g.__dict__
+  assert g.vertices[n - 1] is cycle.vertices[1]
+  assert g.edges[cycle.edges[0].index] is cycle.edges[0]
+
+
+def reached_by_search(g, source: int) -> set[int]:
+  reached = {source}
+  stack = [source]
+  while stack:
+    u = stack.pop()
+    for e in g.live_edges():
+      for x, y in ((e.tail.index, e.head.index), (e.head.index, e.tail.index))[:1 if g.directed else 2]:
+        if x == u and y not in reached:
+          reached.add(y)
+          stack.append(y)
+  return reached
+
+
+def test_freeze_leaves_removed_slots_in_place():
+  g = AdjacencyList(directed=True)
+  g.add_vertices_bulk(["a", "b", "c", "d"])
+  g.add_edges_bulk([(0, 1), (1, 2), (2, 3)])
+  g.remove_vertex(0)
+
+  assert g.reachability([1]).tolist() == [[False, True, True, True]]
+  assert len(g.vertices) == 4 and g.vertices[0] is None
+  assert g.reachable_sets([2]) == [{2, 3}]
+  assert g.condensation()[1].tolist()[0] == -1
+  with pytest.raises(Exception):
+    g.reachability([0])
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_frozen_queries_use_the_graph_indices(seed: int):
+  rng = random.Random(seed)
+  g = AdjacencyList(directed=rng.random() < 0.5)
+  n = 12
+  g.add_vertices_bulk([f"v{i}" for i in range(n)])
+  g.add_edges_bulk([(rng.randrange(n), rng.randrange(n)) for _ in range(20)])
+  for _ in range(3):
+    g.remove_vertex(rng.randrange(n))
+  for _ in range(3):
+    e = rng.choice([e for e in g.edges if e is not None])
+    g.remove_edge(e.tail.index, e.head.index)
+  version = g.version
+
+  live = [v.index for v in g.live_vertices()]
+  sets = g.reachable_sets(live)
+  matrix = g.reachability(live)
+  paths = g.shortest_paths()
+  for row, u in enumerate(live):
+    expected = reached_by_search(g, u)
+    assert sets[row] == expected
+    assert set(np.flatnonzero(matrix[row]).tolist()) == expected
+    for v in expected:
+      walk = paths.bfs(u, v)
+      assert walk.vertices[0] is g.vertices[u] and walk.vertices[-1] is g.vertices[v]
+      assert all(g.edges[e.index] is e for e in walk.edges)
+
+  assert g.version == version and len(g.vertices) == n
+
+
+@pytest.mark.parametrize("backend", ["list", "csr"])
+def test_parallel_edges_close_a_cycle(backend: str):
+  g = AdjacencyList()
+  g.add_vertices_bulk(["a", "b", "c"])
+  g.add_edges_bulk([(2, 0), (2, 0), (2, 0), (0, 1)])
+  graph = g if backend == "list" else g.freeze()
+
+  assert g.contains_circuit()
+  cycle = graph.find_cycle()
+  assert cycle is not None and cycle.length == 2
+  assert {v.index for v in cycle.vertices} == {0, 2}
+  assert cycle.edges[0] is not cycle.edges[1]
+
+
+@pytest.mark.parametrize("backend", ["list", "csr"])
+def test_a_single_edge_is_no_cycle(backend: str):
+  g = AdjacencyList()
+  g.add_vertices_bulk(["a", "b", "c"])
+  g.add_edges_bulk([(2, 0), (0, 1)])
+  graph = g if backend == "list" else g.freeze()
+
+  assert not g.contains_circuit() and graph.find_cycle() is None
+
+
+@pytest.mark.parametrize("batch", [1, 64, 100, 512])
+def test_reachability_across_words_and_batches(batch: int):
+  rng = np.random.default_rng(batch)
+  n = 150
+  tails, heads = rng.integers(0, n, size=(2, 170))
+  g = CSRGraph.from_arrays(n, tails, heads, directed=True)
+
+  closure = np.eye(n, dtype=bool)
+  closure[tails, heads] = True
+  for k in range(n):
+    closure |= closure[:, [k]] & closure[[k], :]
+
+  # More than two words of sources, repeats included
+  sources = np.concatenate((np.arange(n), [5, 5, 149]))
+  targets = [149, 0, 7, 7]
+  assert (g.reachability(sources, batch=batch) == closure[sources]).all()
+  assert (g.reachability(sources, targets, batch=batch) == closure[np.ix_(sources, targets)]).all()
+  assert g.reachable_sets(sources, batch=batch) == [set(np.flatnonzero(closure[s]).tolist()) for s in sources]
+
+  with pytest.raises(Exception):
+    g.reachability([n])
+  with pytest.raises(Exception):
+    g.reachability([0], [-1])
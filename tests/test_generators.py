@@ -0,0 +1,84 @@
+import itertools
+import numpy as np
+import pytest
+from lib import AdjacencyList, CSRGraph
+from lib.generators import barabasi_albert_edges, gnm_edges, gnp_edges, rmat_edges, unrank_pairs
+
+
+def all_pairs(n: int, directed: bool) -> list[tuple[int, int]]:
+  if directed:
+    return [(x, y) for x, y in itertools.product(range(n), repeat=2) if x != y]
+  return [(x, y) for x in range(n) for y in range(x)]
+
+
+def simple(edges: np.ndarray, directed: bool) -> bool:
+  pairs = [tuple(e) for e in edges.tolist()]
+  return len(set(pairs)) == len(pairs) and all(x > y if not directed else x != y for x, y in pairs)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_unrank_lists_every_pair_in_order(directed: bool):
+  for n in (2, 3, 7, 40):
+    total = len(all_pairs(n, directed))
+    assert [tuple(p) for p in unrank_pairs(np.arange(total), n, directed).tolist()] == all_pairs(n, directed)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_gnp(directed: bool):
+  assert gnp_edges(10, 0.0, directed=directed).shape == (0, 2)
+  assert [tuple(p) for p in gnp_edges(6, 1.0, directed=directed).tolist()] == all_pairs(6, directed)
+
+  n, p = 300, 0.05
+  edges = gnp_edges(n, p, directed=directed, seed=1)
+  total = len(all_pairs(n, directed))
+  assert simple(edges, directed)
+  assert abs(len(edges) - total * p) < 5 * np.sqrt(total * p * (1 - p))
+  assert (edges == gnp_edges(n, p, directed=directed, seed=1)).all()
+
+  with pytest.raises(Exception):
+    gnp_edges(5, 1.5)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_gnm_draws_distinct_pairs(directed: bool):
+  total = len(all_pairs(30, directed))
+  # Sparse requests redraw, dense ones shuffle
+  for m in (0, 10, total // 2 + 1, total):
+    edges = gnm_edges(30, m, directed=directed, seed=m)
+    assert len(edges) == m and simple(edges, directed)
+
+  with pytest.raises(Exception):
+    gnm_edges(30, total + 1, directed=directed)
+
+
+def test_barabasi_albert_attaches_to_earlier_vertices():
+  n, k = 2000, 3
+  edges = barabasi_albert_edges(n, k, seed=4)
+  assert edges.shape == ((n - 1) * k, 2)
+  assert (edges[:, 0] == np.repeat(np.arange(1, n), k)).all()
+  assert (edges[:, 1] <= edges[:, 0]).all() and (edges[:, 1] >= 0).all()
+
+  # Preferential attachment: the oldest vertices end up as hubs
+  degrees = np.bincount(edges.ravel(), minlength=n)
+  assert degrees[:10].mean() > 5 * degrees[-1000:].mean()
+
+
+def test_rmat_quadrants():
+  scale, m = 5, 500
+  edges = rmat_edges(scale, m, seed=0)
+  assert edges.shape == (m, 2) and edges.min() >= 0 and edges.max() < 1 << scale
+
+  top = (1 << scale) - 1
+  assert (rmat_edges(scale, 20, a=1, b=0, c=0, seed=0) == 0).all()
+  assert (rmat_edges(scale, 20, a=0, b=0, c=0, seed=0) == top).all()
+  assert (rmat_edges(scale, 20, a=0, b=1, c=0, seed=0) == [0, top]).all()
+
+  with pytest.raises(Exception):
+    rmat_edges(scale, m, a=0.6, b=0.3, c=0.3)
+
+
+def test_backends_build_the_same_graph():
+  listed = AdjacencyList.create_gnm_graph(50, 120, directed=True, seed=7)
+  frozen = CSRGraph.create_gnm_graph(50, 120, directed=True, seed=7)
+  assert listed.edge_count() == 120
+  assert [(e.tail.index, e.head.index) for e in listed.edges] == list(zip(frozen.edge_tails.tolist(), frozen.edge_heads.tolist()))
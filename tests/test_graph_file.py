@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from lib import AdjacencyList, CSRGraph
+from lib.graph_file import HEADER, MAGIC, SECTIONS, LabelTable
+
+
+def round_trip(g, tmp_path) -> CSRGraph:
+  path = str(tmp_path / "g.bin")
+  g.save(path)
+  return CSRGraph.open(path)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_labels_and_arrays_survive_a_round_trip(tmp_path, directed: bool):
+  g = AdjacencyList(directed=directed)
+  g.add_vertices_bulk(["a", "β", "", "d"])
+  g.add_edges_bulk([(0, 1, "x"), (1, 2), (2, 3, "ü"), (3, 3)])
+  csr = g.freeze()
+  opened = round_trip(g, tmp_path)
+
+  assert opened.directed == directed
+  for name in ("indptr", "indices", "edge_ids", "degrees", "edge_tails", "edge_heads"):
+    assert isinstance(getattr(opened, name), np.memmap)
+    assert getattr(opened, name).tolist() == getattr(csr, name).tolist()
+  assert [v.label for v in opened.vertices] == ["a", "β", "", "d"]
+  assert [e.label for e in opened.edges] == ["x", None, "ü", None]
+
+
+def test_integer_labels_are_stored_as_an_array(tmp_path):
+  g = CSRGraph.from_arrays(3, np.array([0, 1]), np.array([1, 2]), directed=True)
+  opened = round_trip(g, tmp_path)
+  assert isinstance(opened.vertex_labels, np.ndarray)
+  assert opened.vertex_labels.tolist() == [0, 1, 2]
+  assert opened.edge_labels is None
+
+
+def test_removed_slots_are_left_out(tmp_path):
+  g = AdjacencyList()
+  g.add_vertices_bulk(range(4))
+  g.add_edges_bulk([(0, 1), (1, 2), (2, 3)])
+  g.remove_vertex(1)
+  opened = round_trip(g, tmp_path)
+  assert [v.label for v in opened.vertices] == [0, 2, 3]
+  assert [tuple(e) for e in opened.edges] == [(3, 2)]
+
+
+def test_foreign_and_future_files_are_refused(tmp_path):
+  path = tmp_path / "g.bin"
+  path.write_bytes(b"\0" * HEADER.size)
+  with pytest.raises(Exception, match="Not a graph file"):
+    CSRGraph.open(str(path))
+
+  path.write_bytes(HEADER.pack(MAGIC, 99, 0, 0, 0, *[0] * (2 * len(SECTIONS))))
+  with pytest.raises(Exception, match="version 99"):
+    CSRGraph.open(str(path))
+
+
+def test_label_table_keeps_none_apart_from_empty():
+  table = LabelTable.pack(["a", None, "", "ça"])
+  assert len(table) == 4
+  assert list(table) == ["a", None, "", "ça"]
+  assert [table[i] for i in range(4)] == ["a", None, "", "ça"]
@@ -0,0 +1,144 @@
+import itertools
+import random
+import time
+import pytest
+from lib import AdjacencyList
+
+
+def grid(width: int, height: int) -> AdjacencyList:
+  g = AdjacencyList()
+  g.add_vertices_bulk(range(width * height))
+  g.add_edges_bulk(
+    [(y * width + x, y * width + x + 1) for y in range(height) for x in range(width - 1)] +
+    [(y * width + x, (y + 1) * width + x) for y in range(height - 1) for x in range(width)])
+  return g
+
+
+def simple_paths_by_brute_force(g, source: int, destination: int) -> set[tuple[int, ...]]:
+  inner = [v.index for v in g.live_vertices() if v.index not in (source, destination)]
+  found = set()
+  for k in range(len(inner) + 1):
+    for middle in itertools.permutations(inner, k):
+      path = (source, *middle, destination)
+      if all(g.is_neighbor(x, y) for x, y in zip(path, path[1:])):
+        found.add(path)
+  return found
+
+
+def test_paths_match_brute_force():
+  g = grid(3, 2)
+  g.create_edge(0, 4)
+  paths = list(g.iter_paths_between(0, 5))
+
+  assert len(paths) == len(set(paths))
+  assert set(paths) == simple_paths_by_brute_force(g, 0, 5)
+  assert [w.vertices[-1].index for w in g.get_all_paths_between(0, 5)] == [5] * len(paths)
+
+
+def test_limits_cut_enumeration_short():
+  g = grid(3, 3)
+  every = list(g.iter_paths_between(0, 8))
+
+  assert list(g.iter_paths_between(0, 8, max_paths=3)) == every[:3]
+  assert sorted(g.iter_paths_between(0, 8, max_length=4)) == sorted(p for p in every if len(p) == 5)
+  assert list(g.iter_paths_between(0, 8, max_length=3)) == []
+  assert list(g.iter_paths_between(0, 8, max_paths=0)) == []
+  assert list(g.iter_paths_between(4, 4)) == [(4,)]
+
+
+def test_enumeration_is_lazy_and_honours_the_deadline():
+  g = grid(8, 8)
+  paths = g.iter_paths_between(0, 63)
+  assert len(next(paths)) >= 15
+
+  assert list(g.iter_paths_between(0, 63, deadline=time.monotonic() - 1)) == []
+
+
+def test_walk_between_is_a_shortest_one():
+  g = grid(4, 3)
+  walk = g.get_walk_between(0, 11)
+  assert walk.length == 5 and walk.vertices[0].index == 0 and walk.vertices[-1].index == 11
+
+  g.remove_vertex(5)
+  assert g.get_walk_between(0, 5) is None
+  assert g.get_walk_between(0, 11).length == 5
+
+
+def floyd_warshall(g, weights, unit: bool = False) -> list[list[float]]:
+  n = len(g.vertices)
+  d = [[0.0 if i == j else float("inf") for j in range(n)] for i in range(n)]
+  for e in g.live_edges():
+    w = 1.0 if unit else weights[e.index]
+    arcs = [(e.tail.index, e.head.index)] if g.directed else [(e.tail.index, e.head.index), (e.head.index, e.tail.index)]
+    for x, y in arcs:
+      d[x][y] = min(d[x][y], w)
+  for k, i, j in itertools.product(range(n), repeat=3):
+    d[i][j] = min(d[i][j], d[i][k] + d[k][j])
+  return d
+
+
+def follows_edges(g, walk, weights) -> float:
+  for u, v, e in zip(walk.vertices, walk.vertices[1:], walk.edges):
+    assert g.edges[e.index] is e
+    assert (e.tail, e.head) == (u, v) or (not g.directed and (e.tail, e.head) == (v, u))
+  return sum(weights[e.index] for e in walk.edges)
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("directed", [False, True])
+def test_every_search_finds_shortest_walks(seed: int, directed: bool):
+  rng = random.Random(seed)
+  n = 9
+  g = AdjacencyList(directed=directed)
+  g.add_vertices_bulk(range(n))
+  g.add_edges_bulk([(rng.randrange(n), rng.randrange(n)) for _ in range(22)])
+  weights = [float(rng.randint(0, 9)) for _ in g.edges]
+  unit = [1.0] * len(g.edges)
+  d, hops = floyd_warshall(g, weights), floyd_warshall(g, weights, unit=True)
+
+  # One instance answers every query, its buffers are never reset
+  paths = g.shortest_paths(weights)
+  for source, destination in itertools.product(range(n), repeat=2):
+    for search, expected, cost in (
+        (paths.dijkstra, d, weights), (paths.bidirectional_dijkstra, d, weights),
+        (paths.bfs, hops, unit), (paths.bidirectional_bfs, hops, unit)):
+      walk = search(source, destination)
+      if expected[source][destination] == float("inf"):
+        assert walk is None
+        continue
+      assert walk.vertices[0].index == source and walk.vertices[-1].index == destination
+      assert follows_edges(g, walk, cost) == paths.cost == expected[source][destination]
+
+
+def test_parallel_edges_keep_the_lighter_one():
+  g = AdjacencyList()
+  g.add_vertices_bulk("abc")
+  g.add_edges_bulk([(0, 1, "5"), (0, 1, "2"), (1, 2, "1")])
+  paths = g.shortest_paths()
+  walk = paths.dijkstra(0, 2)
+  assert [e.label for e in walk.edges] == ["2", "1"] and paths.cost == 3.0
+
+
+def test_queries_use_indices_across_removed_slots():
+  g = AdjacencyList()
+  g.add_vertices_bulk("abcd")
+  g.add_edges_bulk([(0, 1), (1, 3), (0, 2), (2, 3)])
+  g.remove_vertex(1)
+  walk = g.shortest_paths().bidirectional_bfs(0, 3)
+  assert [v.label for v in walk.vertices] == ["a", "c", "d"]
+  assert [e.index for e in walk.edges] == [2, 3]
+
+  with pytest.raises(Exception):
+    g.shortest_paths().bfs(0, 4)
+
+
+def test_bad_weights_are_refused():
+  g = AdjacencyList()
+  g.add_vertices_bulk("ab")
+  g.create_edge(0, 1, "heavy")
+  with pytest.raises(Exception, match="not numeric"):
+    g.shortest_paths()
+  with pytest.raises(Exception, match="Negative"):
+    g.shortest_paths([-1.0])
+  with pytest.raises(Exception, match="one weight per edge"):
+    g.shortest_paths([1.0, 2.0])
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from lib import AdjacencyList, iter_edge_list, read_dimacs_cnf, read_dimacs_graph, read_edge_list
+
+
+def write(tmp_path, text: str) -> str:
+  path = tmp_path / "input.txt"
+  path.write_text(text)
+  return str(path)
+
+
+def test_edge_list_skips_comments_and_headers(tmp_path):
+  path = write(tmp_path, "# SNAP header\n% matrix market comment\n1 2\n  # indented\n2 3\n\n3 1\n")
+  g = read_edge_list(path, graph_type=AdjacencyList, directed=True)
+
+  assert [v.label for v in g.vertices] == [1, 2, 3]
+  assert [(e.tail.label, e.head.label) for e in g.edges] == [(1, 2), (2, 3), (3, 1)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+def test_chunk_boundaries_split_no_rows(tmp_path, chunk_size: int):
+  rows = [(i, (7 * i) % 100) for i in range(100)]
+  text = "# comment\n" + "".join(f"{x} {y}\n" for x, y in rows[:50]) + "# middle\n"
+  text += "".join(f"{x}\t{y}\r\n" for x, y in rows[50:-1]) + f"{rows[-1][0]} {rows[-1][1]}"
+  path = write(tmp_path, text)
+
+  chunks = list(iter_edge_list(path, chunk_size=chunk_size))
+  assert np.concatenate(chunks).tolist() == [list(r) for r in rows]
+
+
+@pytest.mark.parametrize("line", ["3 x", "1 2 foo", "e 1 2", "1,2"])
+def test_malformed_lines_raise(tmp_path, line: str):
+  path = write(tmp_path, f"# ok\n1 2\n{line}\n2 3\n")
+  with pytest.raises(ValueError):
+    list(iter_edge_list(path))
+
+
+def test_weighted_edge_list_keeps_weights_as_labels(tmp_path):
+  path = write(tmp_path, "1 2 3\n2 3 0.5\n")
+  g = read_edge_list(path, graph_type=AdjacencyList, weighted=True)
+  assert [e.label for e in g.edges] == [3.0, 0.5]
+
+
+def test_dimacs_graphs(tmp_path):
+  path = write(tmp_path, "c undirected\np edge 4 3\ne 1 2\nc between\ne 2 3\ne 4 1\n")
+  g = read_dimacs_graph(path, graph_type=AdjacencyList, chunk_size=5)
+  assert not g.directed and len(g.vertices) == 4
+  assert sorted((e.tail.label, e.head.label) for e in g.edges) == [(2, 1), (3, 2), (4, 1)]
+
+  path = write(tmp_path, "c arcs\np sp 3 2\na 1 2 7\na 3 1 4\n")
+  g = read_dimacs_graph(path, graph_type=AdjacencyList)
+  assert g.directed and [(e.tail.label, e.head.label, e.label) for e in g.edges] == [(1, 2, 7), (3, 1, 4)]
+
+  path = write(tmp_path, "p sp 3 2\na 1 2 7\nx 3 1 4\n")
+  with pytest.raises(ValueError):
+    read_dimacs_graph(path, graph_type=AdjacencyList)
+
+
+@pytest.mark.parametrize("chunk_size", [2, 5, 1 << 20])
+def test_dimacs_cnf(tmp_path, chunk_size: int):
+  path = write(tmp_path, "c 2-cnf\np cnf 3 4\n1 -2 0\n-1\n3 0 2 0\nc trailing\n-3 -2 0\n")
+  clauses = read_dimacs_cnf(path, chunk_size=chunk_size)
+  assert clauses.tolist() == [[1, -2], [-1, 3], [2, 2], [-3, -2]]
+
+  path = write(tmp_path, "p cnf 2 1\n1 2\n")
+  with pytest.raises(Exception):
+    read_dimacs_cnf(path)
+  path = write(tmp_path, "p cnf 2 1\n1 2 x 0\n")
+  with pytest.raises(ValueError):
+    read_dimacs_cnf(path)
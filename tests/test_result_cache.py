@@ -0,0 +1,30 @@
+from lib import AdjacencyList
+
+
+def path_graph(n: int) -> AdjacencyList:
+  g = AdjacencyList(directed=True)
+  g.add_vertices_bulk([f"v{i}" for i in range(n)])
+  g.add_edges_bulk([(i, i + 1) for i in range(n - 1)])
+  return g
+
+
+def test_mutating_a_result_leaves_the_cache_intact():
+  g = path_graph(4)
+
+  order = g.topological_sort()
+  order.pop()
+  assert len(g.topological_sort()) == 4
+
+  levels = g.topological_levels()
+  levels[0].clear()
+  assert all(len(level) == 1 for level in g.topological_levels())
+
+  report = g.depth_first_search()
+  report["Tree Edges"].clear()
+  assert len(g.depth_first_search()["Tree Edges"]) == 3
+
+  csr = g.freeze()
+  _, labels = csr.condensation()
+  labels[:] = 0
+  assert sorted(csr.condensation()[1].tolist()) == [0, 1, 2, 3]
+  assert g.cache.hits > 0
@@ -0,0 +1,68 @@
+import pytest
+from lib import AdjacencyList, CSRGraph
+import lib.adjacency_list
+import lib.csr_graph
+
+
+def sample_view():
+  g = AdjacencyList(directed=True)
+  g.add_vertices_bulk(list("abcde"))
+  g.add_edges_bulk([(0, 1), (1, 2), (2, 3), (3, 1), (3, 4), (4, 0)])
+  return g, g.view(vertices=[1, 2, 3, 4])
+
+
+def test_frozen_queries_on_a_view_use_parent_indices(tmp_path):
+  g, view = sample_view()
+
+  assert view.reachability([1]).tolist() == [[False, True, True, True, True]]
+  assert view.reachability([4], [1, 4]).tolist() == [[False, True]]
+  assert view.reachable_sets([3]) == [{1, 2, 3, 4}]
+
+  _, labels = view.condensation()
+  assert labels[0] == -1 and len(set(labels[1:4].tolist())) == 1 and labels[4] != labels[1]
+
+  walk = view.shortest_paths().bfs(1, 4)
+  assert [v.label for v in walk.vertices] == ["b", "c", "d", "e"]
+
+  view.save(str(tmp_path / "view.bin"))
+  saved = CSRGraph.open(str(tmp_path / "view.bin"))
+  assert len(saved.indptr) - 1 == 4 and len(saved.edge_tails) == 4
+
+  with pytest.raises(Exception):
+    view.reachability([0])
+  assert len(g.vertices) == 5 and g.edge_count() == 6
+
+
+def test_parallel_components_of_a_view(monkeypatch):
+  monkeypatch.setattr(lib.adjacency_list, "PARALLEL_THRESHOLD", 1)
+  monkeypatch.setattr(lib.csr_graph, "PARALLEL_THRESHOLD", 1)
+  g, view = sample_view()
+
+  components = view.strongly_connected_components(workers=2)
+  assert sorted(sorted(v.label for v in c) for c in components) == [["b", "c", "d"], ["e"]]
+  assert all(v is g.vertices[v.index] for c in components for v in c)
+
+
+@pytest.mark.parametrize("directed", [True, False])
+def test_view_degrees_match_the_materialized_graph(directed):
+  g = AdjacencyList(directed=directed)
+  g.add_vertices_bulk(list("abcde"))
+  g.add_edges_bulk([(0, 1), (1, 2), (2, 3), (3, 1), (3, 4), (4, 0), (2, 2), (1, 2)])
+  view = g.view(vertices=[1, 2, 3, 4])
+  copy = view.materialize()
+
+  assert [view.get_degree(i) for i in range(1, 5)] == [copy.get_degree(i) for i in range(4)]
+  assert view.get_degree(1) < g.get_degree(1)
+  assert str(view) == str(copy)
+
+
+def test_cycle_degree_check_uses_view_degrees():
+  g = AdjacencyList()
+  g.add_vertices_bulk(list("abcd"))
+  g.add_edges_bulk([(0, 1), (1, 2), (2, 0), (2, 3), (3, 0)])
+  view = g.view(vertices=[0, 1, 2])
+  cycle = view.restricted_find_cycle()
+  assert cycle.vertices[0] is cycle.vertices[-1] and cycle.length >= 2
+
+  with pytest.raises(Exception):
+    g.view(vertices=[1, 2, 3]).restricted_find_cycle()
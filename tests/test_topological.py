@@ -0,0 +1,85 @@
+import random
+import sys
+import numpy as np
+import pytest
+from lib import AdjacencyList, CSRGraph, CycleError
+
+
+def random_dag(rng: random.Random, n: int, m: int, backend: str):
+  rank = list(range(n))
+  rng.shuffle(rank)
+  pairs = []
+  for _ in range(m):
+    x, y = rng.sample(range(n), 2)
+    pairs.append((x, y) if rank[x] < rank[y] else (y, x))
+  tails, heads = np.array(pairs, dtype=np.int64).reshape(-1, 2).T
+  if backend == "csr":
+    return CSRGraph.from_arrays(n, tails, heads, directed=True), pairs
+
+  g = AdjacencyList(directed=True)
+  g.add_vertices_bulk(range(n))
+  g.add_edges_bulk(pairs)
+  return g, pairs
+
+
+@pytest.mark.parametrize("backend", ["list", "csr"])
+@pytest.mark.parametrize("seed", range(8))
+def test_orders_and_levels_respect_every_arc(backend: str, seed: int):
+  rng = random.Random(seed)
+  n = 15
+  g, pairs = random_dag(rng, n, 30, backend)
+
+  position = {v.index: i for i, v in enumerate(g.topological_sort())}
+  assert sorted(position) == list(range(n))
+  assert all(position[x] < position[y] for x, y in pairs)
+
+  levels = g.topological_levels()
+  level = {v.index: k for k, vs in enumerate(levels) for v in vs}
+  assert sorted(level) == list(range(n))
+  assert all(level[x] < level[y] for x, y in pairs)
+  # Every vertex past the first level waited on the one right before it
+  assert all(any(level[x] == level[y] - 1 for x, z in pairs if z == y) for y in level if level[y] > 0)
+
+
+@pytest.mark.parametrize("backend", ["list", "csr"])
+@pytest.mark.parametrize("seed", range(8))
+def test_cycles_come_back_as_closed_walks(backend: str, seed: int):
+  rng = random.Random(seed)
+  n = 12
+  g, pairs = random_dag(rng, n, 20, backend)
+  order = [v.index for v in g.topological_sort()]
+  # An arc against the order closes at least one cycle
+  x, y = pairs[0]
+  if backend == "csr":
+    tails, heads = np.array(pairs + [(y, x)]).T
+    g = CSRGraph.from_arrays(n, tails, heads, directed=True)
+  else:
+    g.create_edge(y, x)
+  assert order.index(x) < order.index(y)
+
+  for method in (g.topological_sort, g.topological_levels):
+    with pytest.raises(CycleError) as raised:
+      method()
+    cycle = raised.value.cycle
+    assert cycle.vertices[0] is cycle.vertices[-1] and cycle.length >= 2
+    for u, v, e in zip(cycle.vertices, cycle.vertices[1:], cycle.edges):
+      assert g.edges[e.index] is e and e.tail is u and e.head is v
+
+
+def test_removed_slots_and_undirected_graphs():
+  g = AdjacencyList(directed=True)
+  g.add_vertices_bulk("abcd")
+  g.add_edges_bulk([(0, 1), (1, 2), (2, 3)])
+  g.remove_vertex(1)
+  assert [v.label for v in g.topological_sort()] == ["a", "c", "d"]
+  assert [[v.label for v in level] for level in g.topological_levels()] == [["a", "c"], ["d"]]
+
+  with pytest.raises(Exception, match="Not a digraph"):
+    AdjacencyList().topological_sort()
+
+
+def test_chains_deeper_than_the_recursion_limit():
+  n = 4 * sys.getrecursionlimit()
+  g = CSRGraph.from_arrays(n, np.arange(n - 1, 0, -1), np.arange(n - 2, -1, -1), directed=True)
+  assert [v.index for v in g.topological_sort()] == list(range(n - 1, -1, -1))
+  assert len(g.topological_levels()) == n
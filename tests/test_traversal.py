@@ -0,0 +1,134 @@
+import random
+import sys
+import numpy as np
+import pytest
+from lib import BACK, CROSS, FORWARD, TREE, AdjacencyList, DepthFirstTraversal, Edge
+from lib.constants import TraversalAction
+
+
+def diamond() -> AdjacencyList:
+  g = AdjacencyList(directed=True)
+  g.add_vertices_bulk(["a", "b", "c", "d"])
+  g.add_edges_bulk([(0, 1), (0, 2), (1, 3), (2, 3), (3, 0), (0, 3)])
+  return g
+
+
+def test_depth_first_search_leaves_edges_untouched():
+  g = diamond()
+  report = g.depth_first_search()
+
+  kinds = report["Edge Types"]
+  assert [kinds[e.index] for e in g.edges] == [TREE, TREE, TREE, CROSS, BACK, FORWARD]
+  assert report["Tree Edges"] == [g.edges[0], g.edges[2], g.edges[1]]
+  assert not hasattr(g.edges[0], "type") and "type" not in Edge.__slots__
+
+
+def test_nested_traversals_keep_their_own_state():
+  g = diamond()
+  outer, inner = [], []
+
+  def on_enter(u, parent):
+    outer.append(u.index)
+    if u.index == 1:
+      DepthFirstTraversal(g).run([g.vertices[3]], on_enter=lambda w, p: inner.append(w.index))
+
+  DepthFirstTraversal(g).run(g.vertices, on_enter=on_enter)
+  assert outer == [0, 1, 3, 2]
+  assert inner == [3, 0, 1, 2]
+
+
+def test_paths_deeper_than_the_recursion_limit():
+  n = 4 * sys.getrecursionlimit()
+  g = AdjacencyList(directed=True)
+  g.add_vertices_bulk(range(n))
+  g.add_edges_bulk(np.stack((np.arange(n - 1), np.arange(1, n)), axis=1))
+
+  assert g.is_connected()
+  assert len(g.strongly_connected_components(workers=1)) == n
+
+  g.create_edge(n - 1, 0)
+  assert [len(c) for c in g.strongly_connected_components(workers=1)] == [n]
+
+
+def test_cycle_from_circuit_follows_a_long_cycle():
+  n = 4 * sys.getrecursionlimit()
+  g = AdjacencyList()
+  g.add_vertices_bulk(range(n))
+  g.add_edges_bulk(np.stack((np.arange(n), (np.arange(n) + 1) % n), axis=1))
+
+  cycle = g.get_cycle_from_circuit(None, (0, n - 1, None))
+  assert [v.index for v in cycle.vertices] == [*range(n), 0]
+
+
+def test_skip_and_stop_actions():
+  g = diamond()
+  entered = []
+
+  def skip_b(u, parent):
+    entered.append(u.index)
+    if u.index == 1:
+      return TraversalAction.SKIP
+
+  DepthFirstTraversal(g).run([g.vertices[0]], on_enter=skip_b)
+  assert entered == [0, 1, 2, 3]
+
+  edges = []
+
+  def stop_at_d(u, v, kind):
+    edges.append((u.index, v.index))
+    if v.index == 3:
+      return TraversalAction.STOP
+
+  assert DepthFirstTraversal(g).run([g.vertices[0]], on_edge=stop_at_d)
+  assert edges == [(0, 1), (1, 3)]
+
+
+def classify_recursively(g) -> tuple[list[int], list[int], list[int]]:
+  indptr, indices, edge_ids = g.arcs()
+  n = len(indptr) - 1
+  entry, finish, kinds = [0] * n, [0] * n, [0] * len(g.edges)
+  clock = [0, 0]
+
+  def visit(u):
+    clock[0] += 1
+    entry[u] = clock[0]
+    for i in range(indptr[u], indptr[u + 1]):
+      v, e = indices[i], edge_ids[i]
+      if not g.directed and kinds[e]:
+        continue
+      if not entry[v]:
+        kinds[e] = TREE
+        visit(v)
+      elif not finish[v]:
+        kinds[e] = BACK
+      else:
+        kinds[e] = FORWARD if entry[u] < entry[v] else CROSS
+    clock[1] += 1
+    finish[u] = clock[1]
+
+  for u in range(n):
+    if g.is_live(u) and not entry[u]:
+      visit(u)
+  return entry, finish, kinds
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("seed", range(10))
+def test_classification_matches_a_recursive_search(directed: bool, seed: int):
+  rng = random.Random(seed)
+  n = 12
+  g = AdjacencyList(directed=directed)
+  g.add_vertices_bulk(range(n))
+  g.add_edges_bulk([(rng.randrange(n), rng.randrange(n)) for _ in range(24)])
+  g.remove_vertex(rng.randrange(n))
+  report = g.depth_first_search()
+
+  entry, finish, kinds = classify_recursively(g)
+  assert list(report["Entry Depth"]) == entry and list(report["Exit Depth"]) == finish
+  assert list(report["Edge Types"]) == kinds
+
+  listed = report["Tree Edges"] + report["Back Edges"] + report["Forward Edges"] + report["Cross Edges"]
+  assert sorted(e.index for e in listed) == sorted(e.index for e in g.live_edges())
+  assert len(report["Tree Edges"]) == g.vertex_count() - report["Components"]
+  if not directed:
+    assert not report["Forward Edges"] and not report["Cross Edges"]
@@ -0,0 +1,91 @@
+import itertools
+import random
+import numpy as np
+import pytest
+from lib import TwoSatSolver, solve_2sat
+
+
+def random_clause(rng: random.Random, variables: int) -> tuple[int, int]:
+  return tuple(rng.choice((-1, 1)) * rng.randint(1, variables) for _ in range(2))
+
+
+def satisfies(assignment, clauses) -> bool:
+  return all(any(assignment[abs(x)] == (x > 0) for x in c) for c in clauses)
+
+
+def brute_force(clauses) -> bool:
+  variables = sorted({abs(x) for c in clauses for x in c})
+  return any(
+    satisfies(dict(zip(variables, values)), clauses)
+    for values in itertools.product((False, True), repeat=len(variables)))
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_solve_2sat_agrees_with_brute_force(seed: int):
+  rng = random.Random(seed)
+  variables = rng.randint(1, 6)
+  clauses = [random_clause(rng, variables) for _ in range(rng.randint(1, 14))]
+
+  assignment = solve_2sat(clauses)
+  assert (assignment is not None) == brute_force(clauses)
+  if assignment is not None:
+    assert set(assignment) == {abs(x) for c in clauses for x in c}
+    assert satisfies(assignment, clauses)
+
+
+def test_sparse_variable_ids_and_arrays():
+  clauses = np.array([[10**12, -7], [7, 7], [-(10**12), 3]])
+  assert solve_2sat(clauses) == {7: True, 3: True, 10**12: True}
+  assert solve_2sat([]) == {}
+  assert solve_2sat([(5, 5), (-5, -5)]) is None
+
+  with pytest.raises(Exception):
+    solve_2sat([(0, 1)])
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_solver_agrees_with_full_solve(seed: int):
+  rng = random.Random(seed)
+  variables = rng.randint(1, 8)
+  initial = [random_clause(rng, variables) for _ in range(rng.randint(0, 6))]
+  solver = TwoSatSolver(initial)
+  live = dict(enumerate(initial))
+
+  for _ in range(60):
+    if live and rng.random() < 0.45:
+      clause = rng.choice(list(live))
+      solver.retract_clause(clause)
+      del live[clause]
+    else:
+      clause = random_clause(rng, variables)
+      live[solver.add_clause(*clause)] = clause
+
+    assignment = solver.solve()
+    expected = solve_2sat(list(live.values()))
+    assert (assignment is None) == (expected is None)
+    if assignment is not None:
+      assert satisfies(assignment, live.values())
+
+
+def test_solve_returns_a_snapshot():
+  solver = TwoSatSolver([(1, 2), (-1, 2)])
+  assignment = solver.solve()
+  assert type(assignment) is dict
+  snapshot = dict(assignment)
+
+  solver.add_clause(3, 3)
+  solver.add_clause(-1, -1)
+  assert solver.solve() == {1: False, 2: True, 3: True}
+  assert assignment == snapshot
+
+
+def test_live_assignment_is_a_read_only_view():
+  solver = TwoSatSolver([(1, 2), (-1, 2)])
+  live = solver.live_assignment()
+  with pytest.raises(TypeError):
+    live[1] = True
+
+  solver.add_clause(-1, -1)
+  assert solver.live_assignment() is live and live[1] is False
+  solver.add_clause(-2, -2)
+  assert solver.live_assignment() is None